@@ -1,10 +1,9 @@
 import locale
 import os
+import string
 import sys
 import queue
 import threading
-import webbrowser
-import shutil
 from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -21,14 +20,27 @@ from models import AppEntry, RelatedFile
 from related_scanner import DeepScanLimits, RelatedFileScanner
 from scanner import AppScanner, SizeScanLimits
 from settings_view import SettingsView
-from store import StoredState, default_state_path, load_state, save_state, set_configured_data_dir
-from utils import normalize_date, normalize_url, unique_casefold
+from store import StoredState, copy_state_file, default_state_path, load_state, save_state, set_configured_data_dir
+from utils import MISSING, normalize_date, normalize_url, unique_casefold
 
 try:
     locale.setlocale(locale.LC_COLLATE, "")
 except locale.Error:
     pass
 
+_ASCII_UPPERCASE = string.ascii_uppercase
+_GetLogicalDrives = None
+if os.name == "nt":
+    try:
+        import ctypes
+
+        _kernel32 = ctypes.windll.kernel32
+        _GetLogicalDrives = _kernel32.GetLogicalDrives
+        _GetLogicalDrives.argtypes = ()
+        _GetLogicalDrives.restype = ctypes.c_uint32
+    except (ImportError, AttributeError, OSError):
+        _GetLogicalDrives = None
+
 
 STATE_FILE = "arc_poc_state.json"
 
@@ -125,6 +137,7 @@ class MainController:
         self.root.title("ARC \u29BF Windows EcoSystem Mapper")
         self._apply_window_icon()
         self.style = ttk.Style(self.root)
+        self._style_map_cache: Dict[Tuple[str, str], List[Tuple]] = {}
         self.scanner = AppScanner()
         self.related_scanner = RelatedFileScanner()
         self.scan_names: Set[str] = set()
@@ -161,6 +174,8 @@ class MainController:
         self._path_norm_cache: Dict[str, str] = {}
         self._map_node_cache: Dict[str, Dict[str, object]] = {}
         self._map_refresh_job: Optional[str] = None
+        self._groups_refresh_pending = False
+        self._groups_refresh_select: Optional[int] = None
         self._related_index_dirty = True
         self._related_index_rows: Dict[str, RelatedRow] = {}
         self._related_index_app_rows: Dict[str, List[RelatedRow]] = {}
@@ -170,6 +185,7 @@ class MainController:
         self.all_apps: List[AppEntry] = []
         self.current_scan: List[AppEntry] = []
         self.reference_apps: List[AppEntry] = []
+        self._has_reference = False
         self.reference_source: str = ""
         self.reference_dirty = False
         self.reference_saved_path: str = ""
@@ -275,14 +291,15 @@ class MainController:
         self.app_groups = dict(state.app_groups)
         self.group_colors = dict(getattr(state, "group_colors", {}))
         self.scan_drives = list(getattr(state, "scan_drives", []))
-        self.size_cache = dict(state.size_cache)
-        self.related_overrides = dict(getattr(state, "related_overrides", {}))
-        self.related_manual = dict(getattr(state, "related_manual", {}))
-        self.related_ignore = dict(getattr(state, "related_ignore", {}))
-        self.related_unassigned = dict(getattr(state, "related_unassigned", {}))
-        self.install_location_overrides = dict(getattr(state, "install_location_overrides", {}))
-        self.version_overrides = dict(getattr(state, "version_overrides", {}))
-        self.install_date_overrides = dict(getattr(state, "install_date_overrides", {}))
+        # load_state builds these maps fresh for us; take them over rather than copying the large ones.
+        self.size_cache = state.size_cache
+        self.related_overrides = getattr(state, "related_overrides", {})
+        self.related_manual = getattr(state, "related_manual", {})
+        self.related_ignore = getattr(state, "related_ignore", {})
+        self.related_unassigned = getattr(state, "related_unassigned", {})
+        self.install_location_overrides = getattr(state, "install_location_overrides", {})
+        self.version_overrides = getattr(state, "version_overrides", {})
+        self.install_date_overrides = getattr(state, "install_date_overrides", {})
 
     def _apply_window_state(self) -> None:
         self.view.set_sort_desc(self.sort_reverse)
@@ -375,8 +392,7 @@ class MainController:
         target_path = os.path.join(folder, STATE_FILE)
         if os.path.normcase(os.path.abspath(selected_path)) != os.path.normcase(os.path.abspath(target_path)):
             try:
-                os.makedirs(folder, exist_ok=True)
-                shutil.copyfile(selected_path, target_path)
+                copy_state_file(selected_path, target_path)
             except OSError as exc:
                 messagebox.showwarning(
                     "State file copy failed",
@@ -717,10 +733,13 @@ class MainController:
     def _size_scan_worker(self, job_id: int, apps: List[AppEntry], limits: SizeScanLimits) -> None:
         try:
             results: List[Tuple[str, Optional[int], str]] = []
+            sizes: Dict[str, Optional[int]] = {}
             for app in apps:
                 location = self._install_location_for_app(app)
-                size = self.scanner.compute_install_size_mb(location, limits)
-                results.append((app.key(), size, location))
+                location_key = os.path.normcase(location)
+                if location_key not in sizes:
+                    sizes[location_key] = self.scanner.compute_install_size_mb(location, limits)
+                results.append((app.key(), sizes[location_key], location))
             self._bg_queue.put(("size_complete", job_id, results))
         except Exception as exc:  # pragma: no cover - log to UI
             self._bg_queue.put(("size_error", job_id, exc))
@@ -747,7 +766,11 @@ class MainController:
             self.apply_sort()
 
     def on_filter_change(self, value: str) -> None:
-        self.filter_query = value.strip().lower()
+        # Normalise once per keystroke; search blobs are already casefolded.
+        query = value.strip().casefold()
+        if query == self.filter_query:
+            return
+        self.filter_query = query
         if self._filter_job is not None:
             self.root.after_cancel(self._filter_job)
         self._filter_job = self.root.after(self.FILTER_DEBOUNCE_MS, self.apply_filter)
@@ -772,9 +795,8 @@ class MainController:
         if not query:
             self.filtered_apps = list(base_apps)
         else:
-            def match(app: AppEntry) -> bool:
-                return query in self._app_search_blob(app)
-            self.filtered_apps = [app for app in base_apps if match(app)]
+            search_blob = self._app_search_blob
+            self.filtered_apps = [app for app in base_apps if query in search_blob(app)]
         if self.view_mode == "map":
             self._apply_map_filter()
         else:
@@ -837,7 +859,7 @@ class MainController:
             return group_key
         if column == "installed":
             scan_names = self.scan_names
-            has_reference = bool(self.reference_apps)
+            has_reference = self._has_reference
             def installed_key(app: AppEntry):
                 installed = is_installed(app, scan_names, has_reference)
                 return (not installed, app.name_key())
@@ -920,8 +942,8 @@ class MainController:
 
     def _populate_tree(self, items: List[AppEntry]) -> None:
         rows: List[Tuple[str, List[str], str]] = []
-        scan_names = self.scan_names if self.reference_apps else set()
-        has_reference = bool(self.reference_apps)
+        has_reference = self._has_reference
+        scan_names = self.scan_names if has_reference else set()
         for app in items:
             rows.append(self._row_for_app(app, scan_names, has_reference))
         self.view.populate_tree(rows)
@@ -962,8 +984,8 @@ class MainController:
         return (app_key, row, tag)
 
     def _update_app_row(self, app: AppEntry) -> None:
-        scan_names = self.scan_names if self.reference_apps else set()
-        has_reference = bool(self.reference_apps)
+        has_reference = self._has_reference
+        scan_names = self.scan_names if has_reference else set()
         _row_id, values, tag = self._row_for_app(app, scan_names, has_reference)
         self.view.update_system_row(app.key(), values, tag)
 
@@ -1041,7 +1063,7 @@ class MainController:
             self.apply_filter()
 
     def _apply_related_filter(self) -> None:
-        query = self.filter_query.lower()
+        query = self.filter_query
         base_apps = self._apps_for_group_filter()
         if self._related_in_progress:
             self.view.populate_related_tree([])
@@ -1561,6 +1583,7 @@ class MainController:
             return
         _app, related = entry
         related.marked = self._next_marked_value(related.marked)
+        related.invalidate()
         self._invalidate_related_index()
         if self.display_mode == "reference":
             self._mark_reference_dirty()
@@ -1863,7 +1886,7 @@ class MainController:
             items = self.related_unassigned.get(app_key, [])
             item_norms = {self._normalize_related_path(path) for path in items}
             for norm in norms:
-                if norm in self.related_overrides and self.related_overrides.get(norm) == app_key:
+                if self.related_overrides.get(norm) == app_key:
                     del self.related_overrides[norm]
                     changed = True
                 if norm in item_norms:
@@ -2116,6 +2139,7 @@ class MainController:
         self._invalidate_background_jobs()
         self.reference_source = source_label
         self.reference_apps = list(apps)
+        self._has_reference = bool(self.reference_apps)
         self.display_mode = "reference"
         self.reference_dirty = dirty
         self.reference_saved_path = ""
@@ -2184,6 +2208,7 @@ class MainController:
             return
         self._invalidate_background_jobs()
         self.reference_apps = []
+        self._has_reference = False
         self.reference_source = ""
         self.reference_dirty = False
         self.reference_saved_path = ""
@@ -2232,11 +2257,28 @@ class MainController:
         self.view.set_row_group(row_id, group)
         self.view.cancel_group_editor()
 
-    def _refresh_groups(self) -> None:
+    def _refresh_groups_now(self) -> None:
         self.view.update_group_editor_values(self.groups, self.no_group_label)
         if self.settings_view.window and self.settings_view.window.winfo_exists():
             self.settings_view.refresh_groups(self.groups, self.group_colors)
 
+    def _schedule_refresh_groups(self, select_index: Optional[int] = None) -> None:
+        # Coalesce rapid group edits into a single view refresh once Tk is idle.
+        if select_index is not None:
+            self._groups_refresh_select = select_index
+        if self._groups_refresh_pending:
+            return
+        self._groups_refresh_pending = True
+        self.root.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._groups_refresh_pending = False
+        select_index = self._groups_refresh_select
+        self._groups_refresh_select = None
+        self._refresh_groups_now()
+        if select_index is not None and select_index < len(self.groups):
+            self.settings_view.select_group_index(select_index)
+
     def _ensure_group_colors(self) -> None:
         updated = False
         for name in self.groups:
@@ -2260,24 +2302,20 @@ class MainController:
     def _detect_drives(self) -> List[str]:
         if os.name != "nt":
             return [os.path.abspath(os.sep)]
+        bitmask: Optional[int] = None
+        if _GetLogicalDrives is not None:
+            try:
+                bitmask = _GetLogicalDrives()
+            except Exception:
+                bitmask = None
         drives: List[str] = []
-        try:
-            import string
-            import ctypes
-
-            bitmask = ctypes.windll.kernel32.GetLogicalDrives()
-            for idx, letter in enumerate(string.ascii_uppercase):
-                if bitmask & (1 << idx):
-                    path = f"{letter}:"
-                    if os.path.exists(path + "\\"):
-                        drives.append(path)
-        except Exception:
-            import string
-
-            for letter in string.ascii_uppercase:
-                path = f"{letter}:"
-                if os.path.exists(path + "\\"):
-                    drives.append(path)
+        for idx, letter in enumerate(_ASCII_UPPERCASE):
+            # Without the bitmask, fall back to probing every letter.
+            if bitmask is not None and not bitmask & (1 << idx):
+                continue
+            path = f"{letter}:"
+            if os.path.exists(path + "\\"):
+                drives.append(path)
         return drives
 
     def _normalize_scan_drives(self, drives: List[str], available: List[str], allow_empty: bool = False) -> List[str]:
@@ -2330,7 +2368,7 @@ class MainController:
         self.groups.append(name)
         self._ensure_group_colors()
         self._mark_reference_dirty()
-        self._refresh_groups()
+        self._schedule_refresh_groups()
         self.settings_view.clear_group_name()
         if self.view_mode == "map":
             self._schedule_map_refresh()
@@ -2354,13 +2392,10 @@ class MainController:
         self.groups[index] = new_name
         if selected in self.group_colors:
             self.group_colors[new_name] = self.group_colors.pop(selected)
-        for key, value in list(self.app_groups.items()):
-            if value == selected:
-                self.app_groups[key] = new_name
+        self.app_groups = {key: (new_name if value == selected else value) for key, value in self.app_groups.items()}
         self._invalidate_related_index()
         self._mark_reference_dirty()
-        self._refresh_groups()
-        self.settings_view.select_group_index(index)
+        self._schedule_refresh_groups(select_index=index)
         self.settings_view.set_group_name(new_name)
         self.apply_sort()
         if self.view_mode == "map":
@@ -2378,12 +2413,10 @@ class MainController:
         except ValueError:
             return
         self.group_colors.pop(selected, None)
-        for key, value in list(self.app_groups.items()):
-            if value == selected:
-                del self.app_groups[key]
+        self.app_groups = {key: value for key, value in self.app_groups.items() if value != selected}
         self._invalidate_related_index()
         self._mark_reference_dirty()
-        self._refresh_groups()
+        self._schedule_refresh_groups()
         self.settings_view.clear_group_name()
         self.apply_sort()
         if self.view_mode == "map":
@@ -2400,7 +2433,7 @@ class MainController:
             return
         self.group_colors[selected] = color
         self._mark_reference_dirty()
-        self._refresh_groups()
+        self._schedule_refresh_groups()
         if self.view_mode == "map":
             self._schedule_map_refresh()
 
@@ -2409,7 +2442,7 @@ class MainController:
         return any(existing.casefold() == folded for existing in self.groups)
 
     def _mark_reference_dirty(self) -> None:
-        if self.reference_apps:
+        if self._has_reference:
             self.reference_dirty = True
 
     def _confirm_save_dirty_reference(self, suffix: str) -> bool:
@@ -2431,6 +2464,8 @@ class MainController:
             return
         url = normalize_url(value)
         if url:
+            import webbrowser
+
             webbrowser.open(url)
         else:
             messagebox.showinfo("Invalid URL", "No valid website URL found for this entry.")
@@ -2468,8 +2503,7 @@ class MainController:
             return
         removed = False
         for key in (app.key(), app.legacy_key()):
-            if key in self.install_location_overrides:
-                del self.install_location_overrides[key]
+            if self.install_location_overrides.pop(key, MISSING) is not MISSING:
                 removed = True
         if not removed:
             return
@@ -2647,26 +2681,26 @@ class MainController:
         font_family = str(settings.get("font_family", "")).strip()
         if font_family:
             new_settings["font_family"] = font_family
+        errors: List[str] = []
         size_raw = str(settings.get("font_size", "")).strip()
         if size_raw:
             try:
                 size = int(size_raw)
             except ValueError:
-                messagebox.showerror("Invalid font size", "Font size must be a number.", parent=self.settings_view.window)
-                return
-            new_settings["font_size"] = max(6, min(72, size))
+                errors.append("Font size must be a number.")
+            else:
+                new_settings["font_size"] = max(6, min(72, size))
         map_max_raw = str(settings.get("map_max_related", "")).strip()
         if map_max_raw:
             try:
                 map_max = int(map_max_raw)
             except ValueError:
-                messagebox.showerror(
-                    "Invalid map setting",
-                    "Map max related items must be a whole number.",
-                    parent=self.settings_view.window,
-                )
-                return
-            new_settings["map_max_related"] = max(0, min(50, map_max))
+                errors.append("Map max related items must be a whole number.")
+            else:
+                new_settings["map_max_related"] = max(0, min(50, map_max))
+        if errors:
+            messagebox.showerror("Invalid settings", "\n".join(errors), parent=self.settings_view.window)
+            return
         new_settings["deep_scan"] = bool(settings.get("deep_scan"))
         selected_drives = self.settings_view.get_selected_drives()
         new_scan_drives = self._normalize_scan_drives(selected_drives, self.available_drives, allow_empty=True)
@@ -2696,14 +2730,20 @@ class MainController:
                 self.apply_filter()
 
     def _style_map_value(self, style_name: str, option: str, state: str) -> str:
-        for statespec, value in self.style.map(style_name, option):
+        key = (style_name, option)
+        entries = self._style_map_cache.get(key)
+        if entries is None:
+            entries = list(self.style.map(style_name, option))
+            self._style_map_cache[key] = entries
+        for statespec, value in entries:
             if state in statespec:
                 return value
         return ""
 
     def _default_gui_settings(self) -> Dict[str, object]:
         default_font = tkfont.nametofont("TkDefaultFont")
-        available_fonts = set(tkfont.families())
+        # Shares the Settings font cache, so the first Settings open skips the enumeration.
+        available_fonts = set(SettingsView.font_families(self.root))
         default_family = "Tahoma" if "Tahoma" in available_fonts else default_font.actual("family")
         return {
             # Adjust default fonts/colors used across the UI.
@@ -2758,6 +2798,7 @@ class MainController:
         self.style.configure("Treeview.Heading", foreground=text_color, font=self.heading_font)
         self.style.map("Treeview", background=[("selected", accent)], foreground=[("selected", table_fg)])
         self.root.configure(bg=window_bg)
+        self._style_map_cache.clear()
         self.view.set_tree_tag_colors(installed_text, missing_text)
         self.view.set_map_style(self.gui_settings)
 
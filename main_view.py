@@ -1,11 +1,157 @@
-import re
+import contextlib
+import functools
+import string
 import tkinter as tk
-import webbrowser
 from tkinter import ttk
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils import MISSING, noop
+
+
+class _SafeTagTable(dict):
+    """str.translate table mapping anything outside [A-Za-z0-9_-] to '_'."""
+
+    _ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        value = char if char in self._ALLOWED else "_"
+        self[code] = value
+        return value
+
+
+_SAFE_TAG_TABLE = _SafeTagTable()
+
+
+_MANUAL_PAGES: Dict[int, str] = {
+    1: (
+        "\u29BF SYSTEM VIEW \u29BF \n\n"
+        "\u2726Access: select SYSTEM VIEW in the top toggle; this view is the primary table for scanned apps and reference data.\n"
+        "_____\n"
+        "\u2726Scan controls: Scan starts a system scan, Clear Scan removes the current scan results, and Close Reference exits a loaded reference dataset (you will be prompted to save if it was changed).\n"
+        "_____\n"
+        "\u2726File menu (global): Import CSV… and Open JSON… load a reference dataset; Export XLSX… exports the currently displayed apps (including filtered results) with a Related Files sheet; Save JSON… saves the current scan only.\n"
+        "_____\n"
+        "\u2726View menu (global): All Results shows all apps; Grouped Only shows only apps that have a group assigned.\n"
+        "_____\n"
+        "\u2726Sorting/filtering: use the Sort by dropdown and Descending toggle; click any column header to sort by that column; the Filter box matches app name and publisher (use Clear Filter to reset).\n"
+        "_____\n"
+        "\u2726Table interactions: click a website cell to open the URL (cursor becomes a hand); right-click Name → VIEW RELATED FILES; right-click Install Location → Open, Set Install Location…, or Clear Install Location Override; right-click Version → Set Version… (only if the scan did not supply one); right-click Install Date → Set Install Date… (only if the scan did not supply one).\n"
+        "_____\n"
+        "\u2726Groups: double-click a Group cell to assign a group (groups are created in Settings); group colors carry into the System Map.\n"
+        "_____\n"
+        "\u2726Size (MB): selecting a row or sorting by Size (MB) triggers background size scans for missing values.\n"
+        "_____\n"
+        "\u2726Status bar: shows count and whether you are viewing (scan) or (reference); a * indicates unsaved reference changes, and the source filename is shown when applicable.\n"
+        "_____\n"
+        "\u2726Settings (gear): opens GUI customization (colors/fonts), System Map styling, Map max related limit (0–50), deep scan toggle, drive selection, and group management.\n"
+    ),
+    2: (
+        "\u29BF RELATED FILES \u29BF \n\n"
+        "\u2726Access: select RELATED FILES or right-click an app name in System View → VIEW RELATED FILES (this also filters to that app).\n"
+        "_____\n"
+        "\u2726Availability: this view is disabled until a system scan exists; it runs related-file scanning on demand.\n"
+        "_____\n"
+        "\u2726Layout: parent rows are apps; child rows list related paths with columns Path, Type, Source, Confidence, and Marked.\n"
+        "_____\n"
+        "\u2726Filtering: the main Filter box searches app name/publisher plus related file details (path/source/confidence/marked); Grouped Only applies here too.\n"
+        "_____\n"
+        "\u2726Marking: double-click a child row to cycle Marked through (blank → Keep → Ignore → blank).\n"
+        "_____\n"
+        "\u2726Parent row context menu (right-click app header): Add Files…, Add Folder…, Deeper Scan….\n"
+        "_____\n"
+        "\u2726Add Files/Folder: adds manual related items; for folders you can add just the folder or the folder plus its contents (up to 5,000 files, depth 10).\n"
+        "_____\n"
+        "\u2726Deeper Scan: scans the selected drives (from Settings) for additional candidates; results open in a window where you can Add Selected or Ignore Selected.\n"
+        "_____\n"
+        "\u2726Child row context menu (right-click Path cell): Open, Reassign to…, Unassign/Unassign Items, Remove Manual Item(s) (manual items only).\n"
+        "_____\n"
+        "\u2726Reassign: opens a searchable list of apps so selected related items can be re-attached to another app.\n"
+        "_____\n"
+        "\u2726Status bar: shows related file count and whether you are viewing (scan) or (reference).\n"
+    ),
+    3: (
+        "\u29BF SYSTEM MAP \u29BF \n\n"
+        "\u2726Access: select SYSTEM MAP; requires a scan (view is disabled without one).\n"
+        "_____\n"
+        "\u2726What you see: drives (diamonds), apps (rounded rectangles), and related nodes (rectangles) laid out by drive; app/related colors reflect group colors, ungrouped apps use the Map ungrouped color.\n"
+        "_____\n"
+        "\u2726Filtering: the main Filter and Grouped Only options limit which apps are mapped.\n"
+        "_____\n"
+        "\u2726Highlighting: click an app node or drive diamond to highlight its nodes/edges; click empty space to clear the highlight.\n"
+        "_____\n"
+        "\u2726Navigation: mouse wheel scrolls vertically; Shift + wheel scrolls horizontally.\n"
+        "_____\n"
+        "\u2726Drive tinting: right-click a drive diamond to apply a lane tint; choose Default to remove the custom tint.\n"
+        "_____\n"
+        "\u2726Related node limit: the number of related items per app is capped by Settings → Map max related (0 hides related nodes).\n"
+        "_____\n"
+        "\u2726Status bar: shows apps mapped or a scanning message if related files are still being gathered.\n"
+        "_____\n"
+        "\u2726Settings (gear): customize map background/text/edge/outline/highlight colors and drive selection used by deeper scans.\n"
+    ),
+}
+
+
+def _manual_segments(text: str) -> List[Tuple[str, str]]:
+    # Split a manual page into (text, tag) runs: the title is bold, "_____" lines are rules.
+    segments: List[Tuple[str, str]] = []
+    for index, line in enumerate(text.splitlines(keepends=True)):
+        if index == 0:
+            tag = "manual_bold"
+        elif line.strip() == "_____":
+            tag = "manual_rule"
+        else:
+            tag = ""
+        if segments and segments[-1][1] == tag:
+            segments[-1] = (segments[-1][0] + line, tag)
+        else:
+            segments.append((line, tag))
+    return segments
+
+
+_MANUAL_SEGMENTS: Dict[int, List[Tuple[str, str]]] = {page: _manual_segments(text) for page, text in _MANUAL_PAGES.items()}
+
+
+_DRIVE_TINT_PALETTE: Tuple[str, ...] = (
+    "#b4cbf2",
+    "#f6b7ea",
+    "#f7d4b5",
+    "#e0b8f5",
+    "#aceaf2",
+    "#f6c1c1",
+)
+
+_ENABLED_STATE = ["!disabled"]
+_DISABLED_STATE = ["disabled"]
+
+
+def _set_widgets_enabled(widgets: Tuple[ttk.Widget, ...], enabled: bool) -> None:
+    spec = _ENABLED_STATE if enabled else _DISABLED_STATE
+    for widget in widgets:
+        widget.state(spec)
 
 
 class MainView:
+    # Rows materialized synchronously when the system table is repopulated; the rest
+    # stream in from idle callbacks so large scans paint the visible window first.
+    SYSTEM_TREE_WINDOW_ROWS = 120
+    SYSTEM_TREE_CHUNK_ROWS = 400
+    # Map nodes are bucketed into square cells of this size and only nodes near the
+    # visible viewport (plus the margin) exist as canvas items.
+    MAP_CELL_SIZE = 256
+    MAP_VIEWPORT_MARGIN = 128
+    # Above this many new canvas items per render, creates go through one Tcl call. Edges are
+    # the most numerous and simplest items, so they switch to the batched path much sooner.
+    MAP_BATCH_CREATE_ITEMS = 500
+    MAP_BATCH_EDGE_ITEMS = 32
+    # Segments per rounded corner of an app card.
+    MAP_CORNER_STEPS = 6
+    # The background speckle is one pre-rendered image tile repeated across the map.
+    MAP_NOISE_TILE_SIZE = 512
+    # Deep-scan results are inserted in pages as the list is scrolled towards its end.
+    DEEP_SCAN_PAGE_ROWS = 200
+
     def __init__(
         self,
         root: tk.Tk,
@@ -19,11 +165,29 @@ class MainView:
         self.root = root
         self.columns = columns
         self.column_keys = [col for col, *_ in columns]
+        self._col_id_to_key = {f"#{index + 1}": key for index, key in enumerate(self.column_keys)}
+        self._col_index = {key: index for index, key in enumerate(self.column_keys)}
+        self._right_click_handlers: Dict[str, Callable[[str], List[Tuple[str, Callable[[], None]]]]] = {
+            "install_location": self._install_location_menu_entries,
+            "version": self._version_menu_entries,
+            "install_date": self._install_date_menu_entries,
+            "name": self._name_menu_entries,
+        }
         self.related_columns = related_columns
         self.related_column_keys = [col for col, *_ in related_columns]
+        self._related_col_index = {key: index for index, key in enumerate(self.related_column_keys)}
         self.callbacks = callbacks
+        self._on_sort_column = self._dispatch("on_sort_column")
+        self._on_sort_change = self._dispatch("on_sort_change")
+        self._on_filter_change = self._dispatch("on_filter_change")
+        self._on_view_change = self._dispatch("on_view_change")
+        self._on_row_select = self._dispatch("on_row_select")
+        self._on_group_filter_change = self._dispatch("on_group_filter_change")
         self.group_editor: Optional[ttk.Combobox] = None
         self.group_editor_var: Optional[tk.StringVar] = None
+        self._group_editor_wheel_bind: Optional[str] = None
+        # Last state pushed to each toolbar/menu control, so repeated updates skip Tk.
+        self._control_states: Dict[str, object] = {}
         self._context_path: str = ""
         self._context_app_name: str = ""
         self._context_related_rows: List[str] = []
@@ -31,27 +195,63 @@ class MainView:
         self._context_related_manual_rows: List[str] = []
         self._user_view_request: str = ""
         self._context_row_id: str = ""
-        self._system_item_ids: set = set()
+        self._system_item_ids: Dict[str, None] = {}
+        self._system_order: List[str] = []
+        # Last (values, tag) written per row, so unchanged rows skip the Tk item() call.
+        self._system_row_state: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        self._related_row_state: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        # Hash of the rows behind the last populate; repeat refreshes with the same rows are no-ops.
+        # Any out-of-band row edit resets it to None.
+        self._last_system_rows_hash: Optional[int] = None
+        self._last_related_groups_hash: Optional[int] = None
+        self._last_deep_scan_rows_hash: Optional[int] = None
+        # populate_* calls landing in the same event-loop turn are coalesced; only the last one is drawn.
+        self._queued_system_rows: Optional[List[Tuple[str, List[str], str]]] = None
+        self._system_populate_job: Optional[str] = None
+        self._queued_related_groups: Optional[Tuple[List[Tuple[str, List[str], List[Tuple[str, List[str], str]]]], bool]] = None
+        self._related_populate_job: Optional[str] = None
+        self._system_pending_rows: List[Tuple[str, List[str], str]] = []
+        self._system_pending_start = 0
+        self._system_pending_index: Dict[str, int] = {}
+        self._system_fill_job: Optional[str] = None
+        self._related_children: Dict[str, List[Tuple[str, List[str], str]]] = {}
+        self._related_child_slots: Dict[str, Tuple[str, int]] = {}
+        self._related_materialized: Set[str] = set()
+        self._tree_motion_event: Optional[tk.Event] = None
+        self._tree_motion_job: Optional[str] = None
+        self._tree_cursor_state = ""
         self._map_payload: Optional[Dict[str, object]] = None
         self._map_style: Dict[str, object] = {}
         self._map_group_colors: Dict[str, str] = {}
-        self._map_item_styles: Dict[int, Dict[str, object]] = {}
+        # Highlight restore styles per tag-expression class, applied with one itemconfigure each.
+        self._map_tag_defaults: List[Tuple[str, Dict[str, object]]] = []
+        self._map_nodes: List[Tuple[Tuple[float, float, float, float], List[Tuple[str, List[float], Dict[str, object]]]]] = []
+        self._map_node_keys: List[Tuple[str, ...]] = []
+        self._map_cells: Dict[Tuple[int, int], List[int]] = {}
+        self._map_rendered: Dict[int, List[int]] = {}
+        self._map_background_key: Optional[Tuple[object, ...]] = None
+        # Speckle tiles depend only on the background color, so style switches reuse them.
+        self._map_noise_tiles: Dict[str, tk.PhotoImage] = {}
+        # Drive band rectangles are kept and re-coordinated; surplus ones are hidden.
+        self._map_band_items: List[int] = []
+        self._map_render_job: Optional[str] = None
+        # Wheel steps accumulated until the next idle pass, applied as one scroll per axis.
+        self._map_wheel_dx = 0
+        self._map_wheel_dy = 0
+        self._map_wheel_job: Optional[str] = None
         self._map_highlight_tag: str = ""
         self._drive_band_colors: Dict[str, str] = {}
         self._drive_tag_map: Dict[str, str] = {}
         self._map_context_drive: str = ""
-        self._drive_tint_palette = [
-            "#b4cbf2",
-            "#f6b7ea",
-            "#f7d4b5",
-            "#e0b8f5",
-            "#aceaf2",
-            "#f6c1c1",
-        ]
-        self._tint_icons: Dict[str, tk.PhotoImage] = {}
+        self._drive_tint_palette = _DRIVE_TINT_PALETTE
+        self._tint_icons: Dict[Tuple[str, int], tk.PhotoImage] = {}
         self._reassign_window: Optional[tk.Toplevel] = None
+        self._reassign_filter_job: Optional[str] = None
         self._deep_scan_window: Optional[tk.Toplevel] = None
         self._deep_scan_tree: Optional[ttk.Treeview] = None
+        self._deep_scan_rows: List[Tuple[str, List[str]]] = []
+        self._deep_scan_loaded = 0
+        self._deep_scan_load_job: Optional[str] = None
         self._deep_scan_count_var: Optional[tk.StringVar] = None
         self._deep_scan_add_btn: Optional[ttk.Button] = None
         self._deep_scan_ignore_btn: Optional[ttk.Button] = None
@@ -60,7 +260,11 @@ class MainView:
         self._manual_page_var: Optional[tk.IntVar] = None
         self._manual_page_text: Optional[tk.StringVar] = None
         self._manual_body: Optional[tk.Text] = None
+        self._manual_rendered_page = 0
         self.group_filter_var: Optional[tk.StringVar] = None
+        self.context_menu: Optional[tk.Menu] = None
+        self.map_context_menu: Optional[tk.Menu] = None
+        self.map_canvas: Optional[tk.Canvas] = None
 
         self._build_menubar()
 
@@ -82,7 +286,7 @@ class MainView:
             text="SYSTEM VIEW",
             value="system",
             variable=self.view_var,
-            command=lambda: self._on_view_request("system"),
+            command=functools.partial(self._on_view_request, "system"),
         )
         self.system_view_btn.grid(row=0, column=0, padx=(0, 6))
         self.related_view_btn = ttk.Radiobutton(
@@ -90,7 +294,7 @@ class MainView:
             text="RELATED FILES",
             value="related",
             variable=self.view_var,
-            command=lambda: self._on_view_request("related"),
+            command=functools.partial(self._on_view_request, "related"),
         )
         self.related_view_btn.grid(row=0, column=1, padx=(0, 6))
         self.map_view_btn = ttk.Radiobutton(
@@ -98,7 +302,7 @@ class MainView:
             text="SYSTEM MAP",
             value="map",
             variable=self.view_var,
-            command=lambda: self._on_view_request("map"),
+            command=functools.partial(self._on_view_request, "map"),
         )
         self.map_view_btn.grid(row=0, column=2)
 
@@ -117,7 +321,7 @@ class MainView:
             toolbar, textvariable=self.sort_var, values=sort_labels, width=14, state="readonly"
         )
         self.sort_select.grid(row=0, column=5, padx=(0, 8))
-        self.sort_select.bind("<<ComboboxSelected>>", lambda _e: self._dispatch("on_sort_change")())
+        self.sort_select.bind("<<ComboboxSelected>>", lambda _e: self._on_sort_change())
 
         self.sort_desc_var = tk.BooleanVar(value=False)
         self.sort_toggle = ttk.Checkbutton(
@@ -128,7 +332,8 @@ class MainView:
 
         ttk.Label(toolbar, text="Filter").grid(row=0, column=7, padx=(0, 4))
         self.filter_var = tk.StringVar()
-        self.filter_var.trace_add("write", lambda *_: self._dispatch("on_filter_change")(self.filter_var.get()))
+        self._last_filter_text = ""
+        self.filter_var.trace_add("write", self._on_filter_write)
         self.filter_entry = ttk.Entry(toolbar, textvariable=self.filter_var, width=24)
         self.filter_entry.grid(row=0, column=8, sticky="ew")
 
@@ -146,6 +351,8 @@ class MainView:
         tree_frame.rowconfigure(0, weight=1)
         tree_frame.columnconfigure(0, weight=1)
 
+        # The three views share one grid cell; only the shown one stays mapped, so hidden
+        # trees take no focus or redraws. Switching un-grids just the outgoing frame.
         self.system_tree_frame = ttk.Frame(tree_frame)
         self.system_tree_frame.grid(row=0, column=0, sticky="nsew")
         self.related_tree_frame = ttk.Frame(tree_frame)
@@ -154,6 +361,12 @@ class MainView:
         self.system_map_frame = ttk.Frame(tree_frame)
         self.system_map_frame.grid(row=0, column=0, sticky="nsew")
         self.system_map_frame.grid_remove()
+        self._view_frames: Dict[str, ttk.Frame] = {
+            "system": self.system_tree_frame,
+            "related": self.related_tree_frame,
+            "map": self.system_map_frame,
+        }
+        self._shown_view = "system"
 
         self.system_tree = ttk.Treeview(self.system_tree_frame, columns=self.column_keys, show="headings", selectmode="browse")
         system_scrollbar = ttk.Scrollbar(self.system_tree_frame, orient=tk.VERTICAL, command=self.system_tree.yview)
@@ -163,9 +376,12 @@ class MainView:
         self.system_tree_frame.rowconfigure(0, weight=1)
         self.system_tree_frame.columnconfigure(0, weight=1)
 
+        set_heading = self.system_tree.heading
+        set_column = self.system_tree.column
+        sort_column = self._on_sort_column
         for (col, heading, anchor, stretch), width in zip(columns, widths):
-            self.system_tree.heading(col, text=heading, anchor=anchor, command=lambda c=col: self._dispatch("on_sort_column")(c))
-            self.system_tree.column(col, width=width, anchor=anchor, stretch=stretch)
+            set_heading(col, text=heading, anchor=anchor, command=functools.partial(sort_column, col))
+            set_column(col, width=width, anchor=anchor, stretch=stretch)
 
         self.related_tree = ttk.Treeview(self.related_tree_frame, columns=self.related_column_keys, show="tree headings", selectmode="extended")
         related_scrollbar = ttk.Scrollbar(self.related_tree_frame, orient=tk.VERTICAL, command=self.related_tree.yview)
@@ -174,23 +390,19 @@ class MainView:
         related_scrollbar.grid(row=0, column=1, sticky="ns")
         self.related_tree_frame.rowconfigure(0, weight=1)
         self.related_tree_frame.columnconfigure(0, weight=1)
-
-        self.system_map_frame.rowconfigure(0, weight=1)
-        self.system_map_frame.columnconfigure(0, weight=1)
-        self.map_canvas = tk.Canvas(self.system_map_frame, highlightthickness=0, background="white")
-        map_scroll_y = ttk.Scrollbar(self.system_map_frame, orient=tk.VERTICAL, command=self.map_canvas.yview)
-        map_scroll_x = ttk.Scrollbar(self.system_map_frame, orient=tk.HORIZONTAL, command=self.map_canvas.xview)
-        self.map_canvas.configure(yscrollcommand=map_scroll_y.set, xscrollcommand=map_scroll_x.set)
-        self.map_canvas.grid(row=0, column=0, sticky="nsew")
-        map_scroll_y.grid(row=0, column=1, sticky="ns")
-        map_scroll_x.grid(row=1, column=0, sticky="ew")
+        self._tree_scrollbars: Dict[str, ttk.Scrollbar] = {
+            str(self.system_tree): system_scrollbar,
+            str(self.related_tree): related_scrollbar,
+        }
 
         self.related_tree.heading("#0", text="")
         self.related_tree.column("#0", width=24, stretch=False)
 
+        set_heading = self.related_tree.heading
+        set_column = self.related_tree.column
         for (col, heading, anchor, stretch), width in zip(related_columns, related_widths):
-            self.related_tree.heading(col, text=heading, anchor=anchor)
-            self.related_tree.column(col, width=width, anchor=anchor, stretch=stretch)
+            set_heading(col, text=heading, anchor=anchor)
+            set_column(col, width=width, anchor=anchor, stretch=stretch)
 
         self.status_var = tk.StringVar(value="0 apps shown")
         status_frame = ttk.Frame(main)
@@ -203,29 +415,22 @@ class MainView:
         self.progress.grid_remove()
 
         self.system_tree.bind("<Button-1>", self._on_tree_click, add=True)
-        self.system_tree.bind("<Motion>", self._on_tree_motion, add=True)
+        self.system_tree.bind("<Motion>", self._queue_tree_motion, add=True)
         self.system_tree.bind("<Double-1>", self._on_tree_double_click, add=True)
         self.system_tree.bind("<<TreeviewSelect>>", self._on_tree_select, add=True)
-        self.system_tree.bind("<MouseWheel>", lambda _e: self.cancel_group_editor(), add=True)
         self.system_tree.bind("<Button-3>", self._on_right_click, add=True)
 
         self.related_tree.bind("<Double-1>", self._on_related_double_click, add=True)
+        self.related_tree.bind("<<TreeviewOpen>>", self._on_related_open, add=True)
         self.related_tree.bind("<Button-3>", self._on_related_right_click, add=True)
-        self.map_canvas.bind("<Button-1>", self._on_map_click, add=True)
-        self.map_canvas.bind("<Button-3>", self._on_map_right_click, add=True)
-        self.map_canvas.bind("<MouseWheel>", self._on_map_mousewheel, add=True)
-        self.map_canvas.bind("<Shift-MouseWheel>", self._on_map_mousewheel, add=True)
-        self.map_canvas.bind("<Button-4>", self._on_map_mousewheel, add=True)
-        self.map_canvas.bind("<Button-5>", self._on_map_mousewheel, add=True)
         self.root.protocol("WM_DELETE_WINDOW", self._dispatch("on_close"))
-        self.map_context_menu = tk.Menu(self.root, tearoff=0)
 
     def _dispatch(self, name: str) -> Callable:
-        return self.callbacks.get(name, lambda *args, **kwargs: None)
+        return self.callbacks.get(name, noop)
 
     def _on_view_request(self, mode: str) -> None:
         self._user_view_request = mode
-        self._dispatch("on_view_change")(mode)
+        self._on_view_change(mode)
 
     def consume_view_request(self, mode: str) -> bool:
         if self._user_view_request == mode:
@@ -253,57 +458,75 @@ class MainView:
                 self.progress.grid_remove()
 
     def set_filter(self, value: str) -> None:
+        if value == self.filter_var.get():
+            return
         self.filter_var.set(value)
 
+    def _on_filter_write(self, *_args) -> None:
+        text = self.filter_var.get()
+        if text == self._last_filter_text:
+            return
+        self._last_filter_text = text
+        self._on_filter_change(text)
+
+    def _control_state_changed(self, name: str, value: object) -> bool:
+        if self._control_states.get(name, MISSING) == value:
+            return False
+        self._control_states[name] = value
+        return True
+
     def set_export_enabled(self, enabled: bool) -> None:
+        if not self._control_state_changed("export", enabled):
+            return
         state = "normal" if enabled else "disabled"
         self.file_menu.entryconfig(self.export_label, state=state)
 
     def set_scan_enabled(self, enabled: bool) -> None:
-        self.scan_btn.state(["!disabled"] if enabled else ["disabled"])
+        if self._control_state_changed("scan", enabled):
+            _set_widgets_enabled((self.scan_btn,), enabled)
 
     def set_save_json_enabled(self, enabled: bool) -> None:
+        if not self._control_state_changed("save_json", enabled):
+            return
         state = "normal" if enabled else "disabled"
         self.file_menu.entryconfig(self.save_json_label, state=state)
 
     def set_clear_scan_enabled(self, enabled: bool) -> None:
-        self.clear_scan_btn.state(["!disabled"] if enabled else ["disabled"])
+        if self._control_state_changed("clear_scan", enabled):
+            _set_widgets_enabled((self.clear_scan_btn,), enabled)
 
     def set_close_reference_enabled(self, enabled: bool) -> None:
-        self.close_ref_btn.state(["!disabled"] if enabled else ["disabled"])
+        if self._control_state_changed("close_reference", enabled):
+            _set_widgets_enabled((self.close_ref_btn,), enabled)
 
     def set_view_mode(self, mode: str) -> None:
         if mode not in {"system", "related", "map"}:
             mode = "system"
         if mode in {"related", "map"}:
             self.cancel_group_editor()
+        # Always resync the radio buttons: a rejected view click leaves view_var out of step.
         self.view_var.set(mode)
-        if mode == "related":
-            self.related_tree_frame.grid()
-            self.system_tree_frame.grid_remove()
-            self.system_map_frame.grid_remove()
-        elif mode == "map":
-            self.system_map_frame.grid()
-            self.system_tree_frame.grid_remove()
-            self.related_tree_frame.grid_remove()
-        else:
-            self.system_tree_frame.grid()
-            self.related_tree_frame.grid_remove()
-            self.system_map_frame.grid_remove()
+        if self._control_state_changed("view_mode", mode):
+            if mode == "map":
+                self._ensure_map_canvas()
+            self._view_frames[self._shown_view].grid_remove()
+            self._view_frames[mode].grid()
+            self._shown_view = mode
 
     def set_related_view_enabled(self, enabled: bool) -> None:
-        self.related_view_btn.state(["!disabled"] if enabled else ["disabled"])
+        if self._control_state_changed("related_view", enabled):
+            _set_widgets_enabled((self.related_view_btn,), enabled)
 
     def set_map_view_enabled(self, enabled: bool) -> None:
-        self.map_view_btn.state(["!disabled"] if enabled else ["disabled"])
+        if self._control_state_changed("map_view", enabled):
+            _set_widgets_enabled((self.map_view_btn,), enabled)
 
     def set_sort_enabled(self, enabled: bool) -> None:
+        if not self._control_state_changed("sort", enabled):
+            return
         state = "readonly" if enabled else "disabled"
         self.sort_select.configure(state=state)
-        if enabled:
-            self.sort_toggle.state(["!disabled"])
-        else:
-            self.sort_toggle.state(["disabled"])
+        _set_widgets_enabled((self.sort_toggle,), enabled)
 
     def _build_menubar(self) -> None:
         menubar = tk.Menu(self.root)
@@ -324,13 +547,13 @@ class MainView:
             label="All Results",
             value="all",
             variable=self.group_filter_var,
-            command=lambda: self._dispatch("on_group_filter_change")(self.group_filter_var.get()),
+            command=lambda: self._on_group_filter_change(self.group_filter_var.get()),
         )
         view_menu.add_radiobutton(
             label="Grouped Only",
             value="grouped",
             variable=self.group_filter_var,
-            command=lambda: self._dispatch("on_group_filter_change")(self.group_filter_var.get()),
+            command=lambda: self._on_group_filter_change(self.group_filter_var.get()),
         )
         menubar.add_cascade(label="View", menu=view_menu)
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -342,7 +565,15 @@ class MainView:
         self.set_export_enabled(False)
         self.set_save_json_enabled(False)
 
-        self.context_menu = tk.Menu(self.root, tearoff=0)
+    def _ensure_context_menu(self) -> tk.Menu:
+        if self.context_menu is None:
+            self.context_menu = tk.Menu(self.root, tearoff=0)
+        return self.context_menu
+
+    def _ensure_map_context_menu(self) -> tk.Menu:
+        if self.map_context_menu is None:
+            self.map_context_menu = tk.Menu(self.root, tearoff=0)
+        return self.map_context_menu
 
     def _show_manual(self) -> None:
         if self._manual_window is not None and self._manual_window.winfo_exists():
@@ -376,12 +607,15 @@ class MainView:
         body_frame.columnconfigure(0, weight=1)
 
         body = tk.Text(body_frame, wrap="word", height=20, padx=8, pady=6)
+        body.tag_configure("manual_bold", font=("TkDefaultFont", 10, "bold"))
+        body.tag_configure("manual_rule", foreground="#9aa5b1")
         body.configure(state="disabled")
         body.grid(row=0, column=0, sticky="nsew")
         scroll = ttk.Scrollbar(body_frame, orient=tk.VERTICAL, command=body.yview)
         body.configure(yscrollcommand=scroll.set)
         scroll.grid(row=0, column=1, sticky="ns")
         self._manual_body = body
+        self._manual_rendered_page = 0
 
         self._manual_window = window
         window.protocol("WM_DELETE_WINDOW", self._close_manual_window)
@@ -400,94 +634,20 @@ class MainView:
         if not self._manual_body or not self._manual_page_var:
             return
         page = self._manual_page_var.get()
+        if page == self._manual_rendered_page:
+            return
+        self._manual_rendered_page = page
         if self._manual_page_text:
             self._manual_page_text.set(f"Page {page} of 3")
-        content = self._manual_page_content(page)
-        self._manual_body.configure(state="normal")
-        self._manual_body.delete("1.0", tk.END)
-        self._manual_body.insert("1.0", content)
-        self._manual_body.configure(state="disabled")
-
-    def _manual_page_content(self, page: int) -> str:
-        # DEV NOTE (manual formatting):
-        # Tkinter Text does NOT render markdown. To add bold/underline, use Text tags.
-        # Suggested approach:
-        # 1) Change _manual_page_content to return a list of (text, tag) segments instead of one string.
-        # 2) In _show_manual, after creating self._manual_body, define tags once, e.g.:
-        #    self._manual_body.tag_configure("manual_bold", font=("TkDefaultFont", 9, "bold"))
-        #    self._manual_body.tag_configure("manual_underline", font=("TkDefaultFont", 9, "underline"))
-        # 3) In _manual_update, iterate segments and insert with tag:
-        #    for text, tag in segments: self._manual_body.insert("end", text, tag or "")
-        # 4) Keep headings as tagged segments (e.g., ("System View\n\n", "manual_bold")).
-        pages = {
-            1: (
-                "\u29BF SYSTEM VIEW \u29BF \n\n"
-                "\u2726Access: select SYSTEM VIEW in the top toggle; this view is the primary table for scanned apps and reference data.\n"
-                "_____\n"
-                "\u2726Scan controls: Scan starts a system scan, Clear Scan removes the current scan results, and Close Reference exits a loaded reference dataset (you will be prompted to save if it was changed).\n"
-                "_____\n"
-                "\u2726File menu (global): Import CSV… and Open JSON… load a reference dataset; Export XLSX… exports the currently displayed apps (including filtered results) with a Related Files sheet; Save JSON… saves the current scan only.\n"
-                "_____\n"
-                "\u2726View menu (global): All Results shows all apps; Grouped Only shows only apps that have a group assigned.\n"
-                "_____\n"
-                "\u2726Sorting/filtering: use the Sort by dropdown and Descending toggle; click any column header to sort by that column; the Filter box matches app name and publisher (use Clear Filter to reset).\n"
-                "_____\n"
-                "\u2726Table interactions: click a website cell to open the URL (cursor becomes a hand); right-click Name → VIEW RELATED FILES; right-click Install Location → Open, Set Install Location…, or Clear Install Location Override; right-click Version → Set Version… (only if the scan did not supply one); right-click Install Date → Set Install Date… (only if the scan did not supply one).\n"
-                "_____\n"
-                "\u2726Groups: double-click a Group cell to assign a group (groups are created in Settings); group colors carry into the System Map.\n"
-                "_____\n"
-                "\u2726Size (MB): selecting a row or sorting by Size (MB) triggers background size scans for missing values.\n"
-                "_____\n"
-                "\u2726Status bar: shows count and whether you are viewing (scan) or (reference); a * indicates unsaved reference changes, and the source filename is shown when applicable.\n"
-                "_____\n"
-                "\u2726Settings (gear): opens GUI customization (colors/fonts), System Map styling, Map max related limit (0–50), deep scan toggle, drive selection, and group management.\n"
-            ),
-            2: (
-                "\u29BF RELATED FILES \u29BF \n\n"
-                "\u2726Access: select RELATED FILES or right-click an app name in System View → VIEW RELATED FILES (this also filters to that app).\n"
-                "_____\n"
-                "\u2726Availability: this view is disabled until a system scan exists; it runs related-file scanning on demand.\n"
-                "_____\n"
-                "\u2726Layout: parent rows are apps; child rows list related paths with columns Path, Type, Source, Confidence, and Marked.\n"
-                "_____\n"
-                "\u2726Filtering: the main Filter box searches app name/publisher plus related file details (path/source/confidence/marked); Grouped Only applies here too.\n"
-                "_____\n"
-                "\u2726Marking: double-click a child row to cycle Marked through (blank → Keep → Ignore → blank).\n"
-                "_____\n"
-                "\u2726Parent row context menu (right-click app header): Add Files…, Add Folder…, Deeper Scan….\n"
-                "_____\n"
-                "\u2726Add Files/Folder: adds manual related items; for folders you can add just the folder or the folder plus its contents (up to 5,000 files, depth 10).\n"
-                "_____\n"
-                "\u2726Deeper Scan: scans the selected drives (from Settings) for additional candidates; results open in a window where you can Add Selected or Ignore Selected.\n"
-                "_____\n"
-                "\u2726Child row context menu (right-click Path cell): Open, Reassign to…, Unassign/Unassign Items, Remove Manual Item(s) (manual items only).\n"
-                "_____\n"
-                "\u2726Reassign: opens a searchable list of apps so selected related items can be re-attached to another app.\n"
-                "_____\n"
-                "\u2726Status bar: shows related file count and whether you are viewing (scan) or (reference).\n"
-            ),
-            3: (
-                "\u29BF SYSTEM MAP \u29BF \n\n"
-                "\u2726Access: select SYSTEM MAP; requires a scan (view is disabled without one).\n"
-                "_____\n"
-                "\u2726What you see: drives (diamonds), apps (rounded rectangles), and related nodes (rectangles) laid out by drive; app/related colors reflect group colors, ungrouped apps use the Map ungrouped color.\n"
-                "_____\n"
-                "\u2726Filtering: the main Filter and Grouped Only options limit which apps are mapped.\n"
-                "_____\n"
-                "\u2726Highlighting: click an app node or drive diamond to highlight its nodes/edges; click empty space to clear the highlight.\n"
-                "_____\n"
-                "\u2726Navigation: mouse wheel scrolls vertically; Shift + wheel scrolls horizontally.\n"
-                "_____\n"
-                "\u2726Drive tinting: right-click a drive diamond to apply a lane tint; choose Default to remove the custom tint.\n"
-                "_____\n"
-                "\u2726Related node limit: the number of related items per app is capped by Settings → Map max related (0 hides related nodes).\n"
-                "_____\n"
-                "\u2726Status bar: shows apps mapped or a scanning message if related files are still being gathered.\n"
-                "_____\n"
-                "\u2726Settings (gear): customize map background/text/edge/outline/highlight colors and drive selection used by deeper scans.\n"
-            ),
-        }
-        return pages.get(page, "")
+        body = self._manual_body
+        body.configure(state="normal")
+        body.delete("1.0", tk.END)
+        for text, tag in self._manual_page_content(page):
+            body.insert(tk.END, text, tag)
+        body.configure(state="disabled")
+
+    def _manual_page_content(self, page: int) -> List[Tuple[str, str]]:
+        return _MANUAL_SEGMENTS.get(page, [])
 
     def _close_manual_window(self) -> None:
         if self._manual_window and self._manual_window.winfo_exists():
@@ -497,6 +657,13 @@ class MainView:
         self._manual_page_text = None
         self._manual_body = None
 
+    @staticmethod
+    def _open_url(url: str) -> None:
+        # webbrowser is only needed for the About link, so keep it out of startup imports.
+        import webbrowser
+
+        webbrowser.open(url)
+
     def _show_about(self) -> None:
         if self._about_window is not None and self._about_window.winfo_exists():
             self._about_window.lift()
@@ -522,7 +689,7 @@ class MainView:
         link_font = ("TkDefaultFont", 9, "underline")
         link = tk.Label(window, text=url, fg="#1a0dab", cursor="hand2", font=link_font)
         link.grid(row=1, column=0, sticky="w", pady=(4, 0))
-        link.bind("<Button-1>", lambda _e: webbrowser.open(url))
+        link.bind("<Button-1>", lambda _e: self._open_url(url))
 
         self._about_window = window
         window.protocol("WM_DELETE_WINDOW", self._close_about_window)
@@ -545,68 +712,72 @@ class MainView:
     def _show_context_menu(self, event: tk.Event, entries: List[Tuple[str, Callable[[], None]]]) -> None:
         if not entries:
             return
-        self.context_menu.delete(0, tk.END)
+        menu = self._ensure_context_menu()
+        menu.delete(0, tk.END)
         for label, command in entries:
-            self.context_menu.add_command(label=label, command=command)
+            menu.add_command(label=label, command=command)
         try:
-            self.context_menu.tk_popup(event.x_root, event.y_root)
+            menu.tk_popup(event.x_root, event.y_root)
         finally:
-            self.context_menu.grab_release()
+            menu.grab_release()
+
+    @staticmethod
+    def _identify_cell(tree: ttk.Treeview, event: tk.Event) -> Tuple[str, str]:
+        # Each identify call makes Tk recompute layout, so stop at the first miss.
+        if tree.identify_region(event.x, event.y) != "cell":
+            return "", ""
+        column = tree.identify_column(event.x)
+        if column == "#0":
+            return "", ""
+        return column, tree.identify_row(event.y)
 
     def _on_right_click(self, event: tk.Event) -> None:
-        region = self.system_tree.identify_region(event.x, event.y)
-        if region != "cell":
-            return
-        column = self.system_tree.identify_column(event.x)
-        row_id = self.system_tree.identify_row(event.y)
+        column, row_id = self._identify_cell(self.system_tree, event)
         if not row_id:
             return
         self._context_row_id = row_id
-        col_index = int(column.replace("#", "")) - 1
-        if col_index < 0 or col_index >= len(self.column_keys):
+        column_key = self._col_id_to_key.get(column)
+        build_entries = self._right_click_handlers.get(column_key) if column_key else None
+        if build_entries is None:
             return
-        column_key = self.column_keys[col_index]
-        if column_key == "install_location":
-            value = self.system_tree.set(row_id, "install_location")
-            self._context_path = value or ""
-            self._context_app_name = ""
-            self.system_tree.selection_set(row_id)
-            entries = []
-            if value:
-                entries.append(("Open", self._open_context_path))
-            entries.append(("Set Install Location...", self._set_install_location))
-            if value:
-                entries.append(("Clear Install Location Override", self._clear_install_location))
-            self._show_context_menu(event, entries)
-        elif column_key == "version":
-            self._context_app_name = ""
-            self._context_path = ""
-            self.system_tree.selection_set(row_id)
-            self._show_context_menu(event, [("Set Version...", self._set_version)])
-        elif column_key == "install_date":
-            self._context_app_name = ""
-            self._context_path = ""
-            self.system_tree.selection_set(row_id)
-            self._show_context_menu(event, [("Set Install Date...", self._set_install_date)])
-        elif column_key == "name":
-            value = self.system_tree.set(row_id, "name")
-            if not value:
-                return
-            self._context_app_name = value
-            self._context_path = ""
-            self.system_tree.selection_set(row_id)
-            self._show_context_menu(event, [("VIEW RELATED FILES", self._view_related_files)])
-        else:
+        entries = build_entries(row_id)
+        if not entries:
             return
+        self.system_tree.selection_set(row_id)
+        self._show_context_menu(event, entries)
+
+    def _install_location_menu_entries(self, row_id: str) -> List[Tuple[str, Callable[[], None]]]:
+        value = self.system_tree.set(row_id, "install_location")
+        self._context_path = value or ""
+        self._context_app_name = ""
+        entries: List[Tuple[str, Callable[[], None]]] = []
+        if value:
+            entries.append(("Open", self._open_context_path))
+        entries.append(("Set Install Location...", self._set_install_location))
+        if value:
+            entries.append(("Clear Install Location Override", self._clear_install_location))
+        return entries
+
+    def _version_menu_entries(self, _row_id: str) -> List[Tuple[str, Callable[[], None]]]:
+        self._context_app_name = ""
+        self._context_path = ""
+        return [("Set Version...", self._set_version)]
+
+    def _install_date_menu_entries(self, _row_id: str) -> List[Tuple[str, Callable[[], None]]]:
+        self._context_app_name = ""
+        self._context_path = ""
+        return [("Set Install Date...", self._set_install_date)]
+
+    def _name_menu_entries(self, row_id: str) -> List[Tuple[str, Callable[[], None]]]:
+        value = self.system_tree.set(row_id, "name")
+        if not value:
+            return []
+        self._context_app_name = value
+        self._context_path = ""
+        return [("VIEW RELATED FILES", self._view_related_files)]
 
     def _on_related_right_click(self, event: tk.Event) -> None:
-        region = self.related_tree.identify_region(event.x, event.y)
-        if region != "cell":
-            return
-        column = self.related_tree.identify_column(event.x)
-        if column == "#0":
-            return
-        row_id = self.related_tree.identify_row(event.y)
+        column, row_id = self._identify_cell(self.related_tree, event)
         if not row_id:
             return
         if self.related_tree.parent(row_id) == "":
@@ -629,21 +800,26 @@ class MainView:
         if row_id not in selection:
             self.related_tree.selection_set(row_id)
             selection = [row_id]
-        selected_rows = [item for item in selection if self.related_tree.parent(item) != ""]
+        # Child rows are exactly the ones tracked in _related_child_slots; no per-row parent() probe.
+        selected_rows = [item for item in selection if item in self._related_child_slots]
         if not selected_rows:
             return
-        manual_rows = [
-            item for item in selected_rows if self.related_tree.set(item, "source").casefold() == "manual"
-        ]
-        unassign_rows = [
-            item for item in selected_rows if self.related_tree.set(item, "source").casefold() != "manual"
-        ]
-        col_index = int(column.replace("#", "")) - 1
-        if col_index < 0 or col_index >= len(self.related_column_keys):
-            return
-        if self.related_column_keys[col_index] != "path":
+        path_index = self._related_col_index["path"]
+        if int(column.replace("#", "")) - 1 != path_index:
             return
-        value = self.related_tree.set(row_id, "path")
+        source_index = self._related_col_index["source"]
+        values_by_id = {item: self.related_tree.item(item, "values") for item in selected_rows}
+        manual_rows: List[str] = []
+        unassign_rows: List[str] = []
+        for item in selected_rows:
+            if str(values_by_id[item][source_index]).casefold() == "manual":
+                manual_rows.append(item)
+            else:
+                unassign_rows.append(item)
+        if row_id in values_by_id:
+            value = str(values_by_id[row_id][path_index])
+        else:
+            value = self.related_tree.set(row_id, "path")
         if not value:
             return
         self._context_path = value
@@ -701,31 +877,156 @@ class MainView:
         self.populate_system_tree(rows)
 
     def populate_system_tree(self, rows: List[Tuple[str, List[str], str]]) -> None:
+        self._queued_system_rows = rows
+        if self._system_populate_job is None:
+            self._system_populate_job = self.root.after_idle(self._flush_system_tree)
+
+    def _flush_system_tree(self) -> None:
+        self._cancel_system_populate()
+        rows = self._queued_system_rows
+        self._queued_system_rows = None
+        if rows is not None:
+            self._apply_system_populate(rows)
+
+    def _cancel_system_populate(self) -> None:
+        if self._system_populate_job is not None:
+            self.root.after_cancel(self._system_populate_job)
+            self._system_populate_job = None
+
+    def _apply_system_populate(self, rows: List[Tuple[str, List[str], str]]) -> None:
         self.cancel_group_editor()
+        rows_hash = hash(tuple((row_id, tuple(values), tag) for row_id, values, tag in rows))
+        if rows_hash == self._last_system_rows_hash:
+            return
+        self._last_system_rows_hash = rows_hash
+        self._cancel_system_fill()
         incoming_ids = [row_id for row_id, _values, _tag in rows]
-        incoming_set = set(incoming_ids)
-        for row_id in self.system_tree.get_children():
-            if row_id not in incoming_set:
-                self.system_tree.detach(row_id)
-        for index, (row_id, values, tag) in enumerate(rows):
-            if self.system_tree.exists(row_id):
-                self.system_tree.item(row_id, values=values, tags=(tag,))
-            else:
-                self.system_tree.insert("", tk.END, iid=row_id, values=values, tags=(tag,))
-                self._system_item_ids.add(row_id)
-            self.system_tree.move(row_id, "", index)
+        window = min(len(rows), self.SYSTEM_TREE_WINDOW_ROWS)
+        self._apply_system_rows(rows, 0, window)
+        if window < len(rows):
+            self._system_pending_rows = list(rows)
+            self._system_pending_start = window
+            self._system_pending_index = {incoming_ids[idx]: idx for idx in range(window, len(rows))}
+            self._system_fill_job = self.root.after_idle(self._fill_system_tree)
+
+    @contextlib.contextmanager
+    def bulk_update(self, tree: ttk.Treeview) -> Iterator[ttk.Treeview]:
+        # Detach the scrollbar while rows change so it is resynced once at the end. The tree
+        # stays mapped: Treeview already batches its redisplay at idle, and unmapping it per
+        # fill chunk would flicker and can drop keyboard focus.
+        scrollbar = self._tree_scrollbars.get(str(tree))
+        tree.configure(yscrollcommand="")
+        try:
+            yield tree
+        finally:
+            if scrollbar is not None:
+                tree.configure(yscrollcommand=scrollbar.set)
+                scrollbar.set(*tree.yview())
+
+    def _apply_system_rows(self, rows: List[Tuple[str, List[str], str]], start: int, end: int) -> None:
+        tree = self.system_tree
+        known = self._system_item_ids
+        row_state = self._system_row_state
+        with self.bulk_update(tree):
+            for index in range(start, end):
+                row_id, values, tag = rows[index]
+                state = (tuple(values), tag)
+                if row_id in known:
+                    if row_state.get(row_id) != state:
+                        self._tree_update_row(tree, row_id, state[0], (tag,))
+                        row_state[row_id] = state
+                else:
+                    # Index 0 avoids walking the sibling list; set_children below fixes the order.
+                    self._tree_insert_row(tree, "", row_id, state[0], (tag,))
+                    known[row_id] = None
+                    row_state[row_id] = state
+            # One reorder for the whole chunk: applied rows first, then rows still waiting for
+            # their chunk that already exist from a previous populate. Everything else is detached.
+            order = [row_id for row_id, _values, _tag in rows[:end]]
+            order.extend(row_id for row_id, _values, _tag in rows[end:] if row_id in known)
+            # Re-sorting or re-filtering often yields the order already on screen.
+            if order != self._system_order:
+                tree.set_children("", *order)
+                self._system_order = order
+
+    def _fill_system_tree(self) -> None:
+        self._system_fill_job = None
+        rows = self._system_pending_rows
+        start = self._system_pending_start
+        end = min(len(rows), start + self.SYSTEM_TREE_CHUNK_ROWS)
+        self._apply_system_rows(rows, start, end)
+        self._system_pending_start = end
+        if end < len(rows):
+            self._system_fill_job = self.root.after_idle(self._fill_system_tree)
+        else:
+            self._cancel_system_fill()
+
+    def _cancel_system_fill(self) -> None:
+        if self._system_fill_job is not None:
+            self.root.after_cancel(self._system_fill_job)
+            self._system_fill_job = None
+        self._system_pending_rows = []
+        self._system_pending_start = 0
+        self._system_pending_index = {}
+
+    def _pending_system_row(self, row_id: str) -> Optional[int]:
+        index = self._system_pending_index.get(row_id)
+        if index is None or index < self._system_pending_start:
+            return None
+        return index
 
     def clear_system_tree(self) -> None:
         self.cancel_group_editor()
+        self._cancel_system_populate()
+        self._queued_system_rows = None
+        self._cancel_system_fill()
+        self._last_system_rows_hash = None
+        # get_children() would miss rows detached by filtering; ttk hands the ids to Tcl as one list.
         if self._system_item_ids:
             self.system_tree.delete(*self._system_item_ids)
             self._system_item_ids.clear()
+        self._system_order = []
+        self._system_row_state.clear()
 
     def populate_related_tree(
         self,
         groups: List[Tuple[str, List[str], List[Tuple[str, List[str], str]]]],
         preserve_expansion: bool = False,
     ) -> None:
+        # A collapsing populate still pending means the coalesced result must collapse too.
+        if self._queued_related_groups is not None:
+            preserve_expansion = preserve_expansion and self._queued_related_groups[1]
+        self._queued_related_groups = (groups, preserve_expansion)
+        if self._related_populate_job is None:
+            self._related_populate_job = self.root.after_idle(self._flush_related_tree)
+
+    def _flush_related_tree(self) -> None:
+        if self._related_populate_job is not None:
+            self.root.after_cancel(self._related_populate_job)
+            self._related_populate_job = None
+        queued = self._queued_related_groups
+        self._queued_related_groups = None
+        if queued is not None:
+            self._apply_related_populate(*queued)
+
+    def _apply_related_populate(
+        self,
+        groups: List[Tuple[str, List[str], List[Tuple[str, List[str], str]]]],
+        preserve_expansion: bool,
+    ) -> None:
+        groups_hash = hash(
+            tuple(
+                (parent_id, tuple(parent_values), tuple((row_id, tuple(values), tag) for row_id, values, tag in children))
+                for parent_id, parent_values, children in groups
+            )
+        )
+        # Without preserve_expansion every group collapses, so only expansion-preserving refreshes can skip.
+        if preserve_expansion and groups_hash == self._last_related_groups_hash:
+            selection = self.related_tree.selection()
+            if selection:
+                self.related_tree.selection_remove(selection)
+            return
+        self._last_related_groups_hash = groups_hash
         expanded: set = set()
         if preserve_expansion:
             for item_id in self.related_tree.get_children():
@@ -737,32 +1038,102 @@ class MainView:
         selection = self.related_tree.selection()
         if selection:
             self.related_tree.selection_remove(selection)
-        incoming_parents = [parent_id for parent_id, _values, _children in groups]
-        incoming_set = set(incoming_parents)
-        for item_id in self.related_tree.get_children():
-            if item_id not in incoming_set:
-                self.related_tree.delete(item_id)
-        for parent_index, (parent_id, parent_values, children) in enumerate(groups):
-            if self.related_tree.exists(parent_id):
-                self.related_tree.item(parent_id, values=parent_values)
-            else:
-                self.related_tree.insert("", tk.END, iid=parent_id, text="", values=parent_values, open=False)
-            self.related_tree.move(parent_id, "", parent_index)
-            incoming_children = [row_id for row_id, _values, _tag in children]
-            incoming_children_set = set(incoming_children)
-            for child_id in self.related_tree.get_children(parent_id):
-                if child_id not in incoming_children_set:
-                    self.related_tree.delete(child_id)
-            for child_index, (row_id, values, tag) in enumerate(children):
-                if self.related_tree.exists(row_id):
-                    self.related_tree.item(row_id, values=values, tags=(tag,))
+        tree = self.related_tree
+        self._related_children = {}
+        self._related_child_slots = {}
+        with self.bulk_update(tree):
+            incoming_parents = [parent_id for parent_id, _values, _children in groups]
+            incoming_set = set(incoming_parents)
+            stale = [item_id for item_id in tree.get_children() if item_id not in incoming_set]
+            if stale:
+                tree.delete(*stale)
+                self._related_materialized.difference_update(stale)
+            for parent_id, parent_values, children in groups:
+                if tree.exists(parent_id):
+                    tree.item(parent_id, values=parent_values)
                 else:
-                    self.related_tree.insert(parent_id, tk.END, iid=row_id, values=values, tags=(tag,))
-                self.related_tree.move(row_id, parent_id, child_index)
-            if preserve_expansion:
-                self.related_tree.item(parent_id, open=parent_id in expanded)
+                    tree.insert("", 0, iid=parent_id, text="", values=parent_values, open=False)
+                self._related_children[parent_id] = list(children)
+                for child_index, (row_id, _values, _tag) in enumerate(children):
+                    self._related_child_slots[row_id] = (parent_id, child_index)
+                is_open = preserve_expansion and parent_id in expanded
+                if is_open:
+                    self._materialize_related_children(parent_id)
+                else:
+                    self._release_related_children(parent_id)
+                tree.item(parent_id, open=is_open)
+            tree.set_children("", *incoming_parents)
+        slots = self._related_child_slots
+        self._related_row_state = {row_id: state for row_id, state in self._related_row_state.items() if row_id in slots}
+
+    @staticmethod
+    def _related_placeholder_id(parent_id: str) -> str:
+        return f"{parent_id}::pending"
+
+    def _on_related_open(self, _event: tk.Event) -> None:
+        parent_id = self.related_tree.focus()
+        if parent_id and parent_id not in self._related_materialized and parent_id in self._related_children:
+            self._materialize_related_children(parent_id)
+
+    def _materialize_related_children(self, parent_id: str) -> None:
+        # Children of collapsed groups live only in _related_children until the group is opened.
+        tree = self.related_tree
+        children = self._related_children.get(parent_id, [])
+        incoming_set = {row_id for row_id, _values, _tag in children}
+        existing = tree.get_children(parent_id)
+        stale = [child_id for child_id in existing if child_id not in incoming_set]
+        if stale:
+            tree.delete(*stale)
+        self._related_materialized.add(parent_id)
+        if len(stale) == len(existing):
+            self._insert_rows_reversed(tree, parent_id, children)
+            for row_id, values, tag in children:
+                self._related_row_state[row_id] = (tuple(values), tag)
+            return
+        row_state = self._related_row_state
+        for row_id, values, tag in children:
+            state = (tuple(values), tag)
+            if tree.exists(row_id):
+                if row_state.get(row_id) != state:
+                    self._tree_update_row(tree, row_id, state[0], (tag,))
+                    row_state[row_id] = state
             else:
-                self.related_tree.item(parent_id, open=False)
+                self._tree_insert_row(tree, parent_id, row_id, state[0], (tag,))
+                row_state[row_id] = state
+        tree.set_children(parent_id, *(row_id for row_id, _values, _tag in children))
+
+    @staticmethod
+    def _insert_rows_reversed(tree: ttk.Treeview, parent: str, rows: List[Tuple[str, List[str], str]]) -> None:
+        # Treeview walks the sibling list to find "end"; filling an empty parent back to front
+        # at index 0 keeps each insert O(1).
+        for row_id, values, tag in reversed(rows):
+            MainView._tree_insert_row(tree, parent, row_id, tuple(values), (tag,) if tag else ())
+
+    # Row writes go straight to the Tcl command with values and tags passed as list objects;
+    # ttk's insert()/item() wrappers would re-quote every cell into a script string first.
+    @staticmethod
+    def _tree_insert_row(tree: ttk.Treeview, parent: str, row_id: str, values: Tuple[str, ...], tags: Tuple[str, ...]) -> None:
+        tree.tk.call(str(tree), "insert", parent, 0, "-id", row_id, "-values", values, "-tags", tags)
+
+    @staticmethod
+    def _tree_update_row(tree: ttk.Treeview, row_id: str, values: Tuple[str, ...], tags: Tuple[str, ...]) -> None:
+        tree.tk.call(str(tree), "item", row_id, "-values", values, "-tags", tags)
+
+    def _release_related_children(self, parent_id: str) -> None:
+        tree = self.related_tree
+        placeholder = self._related_placeholder_id(parent_id)
+        existing = tree.get_children(parent_id)
+        stale = [child_id for child_id in existing if child_id != placeholder]
+        self._related_materialized.discard(parent_id)
+        # A single hidden placeholder keeps the expand arrow until the real rows are needed.
+        has_placeholder = len(existing) > len(stale)
+        needs_placeholder = bool(self._related_children.get(parent_id))
+        if has_placeholder and not needs_placeholder:
+            stale.append(placeholder)
+        if stale:
+            tree.delete(*stale)
+        if needs_placeholder and not has_placeholder:
+            tree.insert(parent_id, tk.END, iid=placeholder, values=())
 
     def open_reassign_dialog(
         self,
@@ -802,10 +1173,13 @@ class MainView:
         combo = ttk.Combobox(frame, textvariable=choice_var, values=options, state="readonly", width=50)
         combo.grid(row=4, column=0, sticky="ew", pady=(6, 12))
 
+        options_cf = [opt.casefold() for opt in options]
+
         def apply_filter(*_args: object) -> None:
+            self._reassign_filter_job = None
             text = filter_var.get().strip().casefold()
             if text:
-                filtered = [opt for opt in options if text in opt.casefold()]
+                filtered = [options[index] for index, folded in enumerate(options_cf) if text in folded]
             else:
                 filtered = list(options)
             combo.configure(values=filtered)
@@ -819,7 +1193,13 @@ class MainView:
                 choice_var.set(filtered[0])
             apply_btn.state(["!disabled"])
 
-        filter_var.trace_add("write", apply_filter)
+        def schedule_filter(*_args: object) -> None:
+            # Coalesce fast typing into one filter pass.
+            if self._reassign_filter_job is not None:
+                win.after_cancel(self._reassign_filter_job)
+            self._reassign_filter_job = win.after(120, apply_filter)
+
+        filter_var.trace_add("write", schedule_filter)
 
         btns = ttk.Frame(frame)
         btns.grid(row=5, column=0, sticky="e")
@@ -843,6 +1223,12 @@ class MainView:
         on_confirm(choice)
 
     def _close_reassign(self, window: tk.Toplevel, on_cancel: Callable[[], None]) -> None:
+        if self._reassign_filter_job is not None:
+            try:
+                window.after_cancel(self._reassign_filter_job)
+            except tk.TclError:
+                pass
+            self._reassign_filter_job = None
         if window and window.winfo_exists():
             window.grab_release()
             window.destroy()
@@ -896,11 +1282,11 @@ class MainView:
         tree.grid(row=1, column=0, sticky="nsew")
 
         scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scroll.set)
+        tree.configure(yscrollcommand=functools.partial(self._on_deep_scan_view_change, scroll))
         scroll.grid(row=1, column=1, sticky="ns")
 
-        for row_id, values in rows:
-            tree.insert("", tk.END, iid=row_id, values=values)
+        self._reset_deep_scan_rows(rows)
+        self._last_deep_scan_rows_hash = hash(tuple((row_id, tuple(values)) for row_id, values in rows))
 
         btns = ttk.Frame(frame)
         btns.grid(row=2, column=0, sticky="e", pady=(10, 0))
@@ -914,10 +1300,7 @@ class MainView:
         self._deep_scan_ignore_btn = ignore_btn
 
         def update_buttons(_event: Optional[tk.Event] = None) -> None:
-            has_selection = bool(tree.selection())
-            state = ["!disabled"] if has_selection else ["disabled"]
-            add_btn.state(state)
-            ignore_btn.state(state)
+            _set_widgets_enabled((add_btn, ignore_btn), bool(tree.selection()))
 
         tree.bind("<<TreeviewSelect>>", update_buttons, add=True)
         update_buttons()
@@ -930,42 +1313,123 @@ class MainView:
     def update_deep_scan_rows(self, rows: List[Tuple[str, List[str]]]) -> None:
         if not self._deep_scan_tree or not self._deep_scan_tree.winfo_exists():
             return
-        tree = self._deep_scan_tree
-        tree.delete(*tree.get_children())
-        for row_id, values in rows:
-            tree.insert("", tk.END, iid=row_id, values=values)
+        rows_hash = hash(tuple((row_id, tuple(values)) for row_id, values in rows))
+        if rows_hash == self._last_deep_scan_rows_hash:
+            return
+        self._last_deep_scan_rows_hash = rows_hash
+        self._deep_scan_tree.delete(*self._deep_scan_tree.get_children())
+        self._reset_deep_scan_rows(rows)
         if self._deep_scan_count_var:
             self._deep_scan_count_var.set(f"Results: {len(rows)}")
         if self._deep_scan_add_btn and self._deep_scan_ignore_btn:
-            self._deep_scan_add_btn.state(["disabled"])
-            self._deep_scan_ignore_btn.state(["disabled"])
+            _set_widgets_enabled((self._deep_scan_add_btn, self._deep_scan_ignore_btn), False)
+
+    def _reset_deep_scan_rows(self, rows: List[Tuple[str, List[str]]]) -> None:
+        self._cancel_deep_scan_load()
+        self._deep_scan_rows = list(rows)
+        self._deep_scan_loaded = 0
+        self._load_deep_scan_page()
+
+    def _load_deep_scan_page(self) -> None:
+        self._deep_scan_load_job = None
+        tree = self._deep_scan_tree
+        if tree is None:
+            return
+        rows = self._deep_scan_rows
+        start = self._deep_scan_loaded
+        end = min(len(rows), start + self.DEEP_SCAN_PAGE_ROWS)
+        if end <= start:
+            return
+        page = [(row_id, values, "") for row_id, values in rows[start:end]]
+        # Unhook the scrollbar while the page goes in; Tk reports the final view once it is restored.
+        scroll_command = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
+        try:
+            self._insert_rows_reversed(tree, "", page)
+            if start:
+                # The page went in at index 0; move it behind the rows already shown.
+                tree.set_children("", *(row_id for row_id, _values in rows[:end]))
+        finally:
+            tree.configure(yscrollcommand=scroll_command)
+        self._deep_scan_loaded = end
+
+    def _on_deep_scan_view_change(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
+        scrollbar.set(first, last)
+        if (
+            float(last) >= 0.9
+            and self._deep_scan_loaded < len(self._deep_scan_rows)
+            and self._deep_scan_load_job is None
+        ):
+            self._deep_scan_load_job = self.root.after_idle(self._load_deep_scan_page)
+
+    def _cancel_deep_scan_load(self) -> None:
+        if self._deep_scan_load_job is not None:
+            self.root.after_cancel(self._deep_scan_load_job)
+            self._deep_scan_load_job = None
 
     def _close_deep_scan_window(self, on_close: Callable[[], None]) -> None:
+        self._cancel_deep_scan_load()
+        self._deep_scan_rows = []
+        self._deep_scan_loaded = 0
         win = self._deep_scan_window
         if win and win.winfo_exists():
             win.grab_release()
             win.destroy()
         self._deep_scan_window = None
         self._deep_scan_tree = None
+        self._last_deep_scan_rows_hash = None
         self._deep_scan_count_var = None
         self._deep_scan_add_btn = None
         self._deep_scan_ignore_btn = None
         on_close()
 
     def set_related_row_marked(self, row_id: str, value: str) -> None:
-        self.related_tree.set(row_id, "marked", value)
+        self._flush_related_tree()
+        self._last_related_groups_hash = None
+        slot = self._related_child_slots.get(row_id)
+        if slot is not None:
+            parent_id, child_index = slot
+            children = self._related_children[parent_id]
+            _row_id, values, tag = children[child_index]
+            values = list(values)
+            values[self._related_col_index["marked"]] = value
+            children[child_index] = (row_id, values, tag)
+        if self.related_tree.exists(row_id):
+            self.related_tree.set(row_id, "marked", value)
+            self._related_row_state.pop(row_id, None)
 
     def set_tree_tag_colors(self, installed_color: str, missing_color: str) -> None:
         self.system_tree.tag_configure("installed", foreground=installed_color)
         self.system_tree.tag_configure("missing", foreground=missing_color)
 
     def set_row_group(self, row_id: str, group: str) -> None:
-        self.system_tree.set(row_id, "group", group)
+        self._flush_system_tree()
+        self._last_system_rows_hash = None
+        index = self._pending_system_row(row_id)
+        if index is not None:
+            _row_id, values, tag = self._system_pending_rows[index]
+            values = list(values)
+            values[self._col_index["group"]] = group
+            self._system_pending_rows[index] = (row_id, values, tag)
+            return
+        if self.system_tree.exists(row_id):
+            self.system_tree.set(row_id, "group", group)
+            self._system_row_state.pop(row_id, None)
 
     def update_system_row(self, row_id: str, values: List[str], tag: str) -> None:
+        self._flush_system_tree()
+        self._last_system_rows_hash = None
+        index = self._pending_system_row(row_id)
+        if index is not None:
+            self._system_pending_rows[index] = (row_id, values, tag)
+            return
         if not self.system_tree.exists(row_id):
             return
-        self.system_tree.item(row_id, values=values, tags=(tag,))
+        state = (tuple(values), tag)
+        if self._system_row_state.get(row_id) == state:
+            return
+        self._tree_update_row(self.system_tree, row_id, state[0], (tag,))
+        self._system_row_state[row_id] = state
 
     def open_group_editor(
         self,
@@ -976,6 +1440,7 @@ class MainView:
         on_save: Callable[[str], None],
         on_cancel: Callable[[], None],
     ) -> None:
+        self._flush_system_tree()
         bbox = self.system_tree.bbox(row_id, "group")
         if not bbox:
             return
@@ -995,6 +1460,10 @@ class MainView:
         self.group_editor.bind("<FocusOut>", lambda _e: on_save(self.group_editor_var.get()))
         self.group_editor.bind("<Return>", lambda _e: on_save(self.group_editor_var.get()))
         self.group_editor.bind("<Escape>", lambda _e: on_cancel())
+        # Scrolling moves the row out from under the editor; only listen while it is open.
+        self._group_editor_wheel_bind = self.system_tree.bind(
+            "<MouseWheel>", lambda _e: self.cancel_group_editor(), add=True
+        )
 
     def update_group_editor_values(self, groups: List[str], no_group_label: str) -> None:
         if not self.group_editor or not self.group_editor.winfo_exists():
@@ -1007,49 +1476,114 @@ class MainView:
                 self.group_editor_var.set(no_group_label)
 
     def cancel_group_editor(self) -> None:
+        if self._group_editor_wheel_bind is not None:
+            self.system_tree.unbind("<MouseWheel>", self._group_editor_wheel_bind)
+            self._group_editor_wheel_bind = None
         if self.group_editor and self.group_editor.winfo_exists():
             self.group_editor.destroy()
         self.group_editor = None
         self.group_editor_var = None
 
+    def _ensure_map_canvas(self) -> tk.Canvas:
+        # Built on first visit to SYSTEM MAP; most sessions never open it.
+        if self.map_canvas is not None:
+            return self.map_canvas
+        self.system_map_frame.rowconfigure(0, weight=1)
+        self.system_map_frame.columnconfigure(0, weight=1)
+        bg = str(self._map_style.get("map_bg", "white"))
+        canvas = tk.Canvas(self.system_map_frame, highlightthickness=0, background=bg)
+        map_scroll_y = ttk.Scrollbar(self.system_map_frame, orient=tk.VERTICAL, command=canvas.yview)
+        map_scroll_x = ttk.Scrollbar(self.system_map_frame, orient=tk.HORIZONTAL, command=canvas.xview)
+        canvas.configure(
+            yscrollcommand=functools.partial(self._on_map_view_change, map_scroll_y),
+            xscrollcommand=functools.partial(self._on_map_view_change, map_scroll_x),
+        )
+        canvas.grid(row=0, column=0, sticky="nsew")
+        map_scroll_y.grid(row=0, column=1, sticky="ns")
+        map_scroll_x.grid(row=1, column=0, sticky="ew")
+        canvas.bind("<Button-1>", self._on_map_click, add=True)
+        canvas.bind("<Button-3>", self._on_map_right_click, add=True)
+        canvas.bind("<MouseWheel>", self._on_map_mousewheel, add=True)
+        canvas.bind("<Shift-MouseWheel>", self._on_map_mousewheel, add=True)
+        canvas.bind("<Button-4>", self._on_map_mousewheel, add=True)
+        canvas.bind("<Button-5>", self._on_map_mousewheel, add=True)
+        canvas.bind("<Configure>", lambda _e: self._schedule_map_render(), add=True)
+        canvas.bind("<Destroy>", self._on_map_canvas_destroy, add=True)
+        self.map_canvas = canvas
+        if self._map_payload is not None:
+            self._draw_system_map()
+        return canvas
+
     def set_map_style(self, style: Dict[str, object]) -> None:
         self._map_style = dict(style)
-        bg = str(self._map_style.get("map_bg", "white"))
-        self.map_canvas.configure(background=bg)
+        if self.map_canvas is not None:
+            bg = str(self._map_style.get("map_bg", "white"))
+            self.map_canvas.configure(background=bg)
 
     def set_map_group_colors(self, group_colors: Dict[str, str]) -> None:
         self._map_group_colors = dict(group_colors)
 
     def populate_system_map(self, payload: Dict[str, object]) -> None:
         self._map_payload = payload
-        self._draw_system_map()
+        if self.map_canvas is not None:
+            self._draw_system_map()
 
     def _draw_system_map(self) -> None:
         canvas = self.map_canvas
-        canvas.delete("all")
-        self._map_item_styles = {}
-        self._map_highlight_tag = ""
+        self._cancel_map_render()
+        self._clear_map_highlight()
+        # Keep what is on the canvas keyed by logical node so the redraw only touches changes.
+        previous = {
+            self._map_node_keys[index]: (self._map_nodes[index][1], item_ids)
+            for index, item_ids in self._map_rendered.items()
+        }
+        canvas.delete("empty")
+        self._map_nodes = []
+        self._map_node_keys = []
+        self._map_cells = {}
+        self._map_rendered = {}
         payload = self._map_payload or {}
         apps = list(payload.get("apps") or [])
         if not apps:
+            canvas.delete("all")
+            self._map_background_key = None
+            self._map_band_items = []
             text_color = str(self._map_style.get("map_text", "black"))
-            canvas.create_text(20, 20, text="Run a scan to build the system map.", anchor="nw", fill=text_color)
+            canvas.create_text(
+                20, 20, text="Run a scan to build the system map.", anchor="nw", fill=text_color, tags=("empty",)
+            )
             canvas.configure(scrollregion=(0, 0, 400, 200))
             return
 
-        drives = list(payload.get("drives") or [])
-        drive_apps: Dict[str, List[Dict[str, object]]] = {drive: [] for drive in drives}
-        drive_related: Dict[str, List[Tuple[Dict[str, object], Dict[str, object]]]] = {drive: [] for drive in drives}
+        # Coerce each payload field once; every pass below reads these tuples.
+        # App rows are (id, name, group, drive, related) and related rows are (id, label, drive).
+        app_rows: List[Tuple[str, str, str, str, List[Tuple[str, str, str]]]] = []
         for app in apps:
-            drive = str(app.get("drive", "Unknown"))
-            drive_apps.setdefault(drive, []).append(app)
-            for related in app.get("related", []) or []:
-                rel_drive = str(related.get("drive", "Unknown"))
-                drive_related.setdefault(rel_drive, []).append((app, related))
+            related_rows = [
+                (str(related.get("id", "")), str(related.get("label", "")), str(related.get("drive", "Unknown")))
+                for related in app.get("related", []) or []
+            ]
+            app_rows.append(
+                (
+                    str(app.get("id", "")),
+                    str(app.get("name", "")),
+                    str(app.get("group", "") or ""),
+                    str(app.get("drive", "Unknown")),
+                    related_rows,
+                )
+            )
+
+        drives = list(payload.get("drives") or [])
+        drive_apps: Dict[str, List[Tuple[str, str, str, str, List[Tuple[str, str, str]]]]] = {drive: [] for drive in drives}
+        drive_related: Dict[str, List[Tuple[str, str, str]]] = {drive: [] for drive in drives}
+        for app_row in app_rows:
+            drive_apps.setdefault(app_row[3], []).append(app_row)
+            for related_row in app_row[4]:
+                drive_related.setdefault(related_row[2], []).append(related_row)
         drives = sorted(drive_apps.keys(), key=lambda d: d.casefold())
         for drive in drives:
-            drive_apps[drive].sort(key=lambda a: str(a.get("name", "")).casefold())
-            drive_related[drive].sort(key=lambda pair: str(pair[1].get("label", "")).casefold())
+            drive_apps[drive].sort(key=lambda row: row[1].casefold())
+            drive_related[drive].sort(key=lambda row: row[1].casefold())
 
         # --- Node sizing controls (manual tuning) ---
         # Adjust these to change node geometry and spacing:
@@ -1080,46 +1614,37 @@ class MainView:
         app_tags: Dict[str, str] = {}
         drive_tags: Dict[str, str] = {}
 
+        # Loop-invariant strides and offsets, hoisted out of the per-node loops.
+        app_stride = app_h + app_gap
+        rel_stride = rel_h + rel_gap
+        col_offsets = [10 + col * (rel_w + rel_gap) for col in range(related_cols)]
+        max_related_rows = 0
         for idx, drive in enumerate(drives):
             lane_x = margin_x + idx * lane_width
             cx = lane_x + lane_width // 2
-            x1 = cx - drive_w // 2
-            x2 = cx + drive_w // 2
-            y1 = drive_y
-            y2 = drive_y + drive_h
-            drive_positions[drive] = (x1, y1, x2, y2)
+            drive_positions[drive] = (cx - drive_w // 2, drive_y, cx + drive_w // 2, drive_y + drive_h)
             drive_tags[drive] = f"drive:{self._safe_tag(drive)}"
 
-            apps_for_drive = drive_apps.get(drive, [])
-            for a_idx, app in enumerate(apps_for_drive):
-                app_id = str(app.get("id", ""))
-                tag = f"app:{self._safe_tag(app_id)}"
-                app_tags[app_id] = tag
-                ay1 = apps_start_y + a_idx * (app_h + app_gap)
-                ay2 = ay1 + app_h
-                ax1 = cx - app_w // 2
-                ax2 = cx + app_w // 2
-                app_positions[app_id] = (ax1, ay1, ax2, ay2)
+            ax1 = cx - app_w // 2
+            ax2 = cx + app_w // 2
+            ay1 = apps_start_y
+            for app_id, *_rest in drive_apps.get(drive, []):
+                app_tags[app_id] = f"app:{self._safe_tag(app_id)}"
+                app_positions[app_id] = (ax1, ay1, ax2, ay1 + app_h)
+                ay1 += app_stride
 
+            lane_cols = [lane_x + offset for offset in col_offsets]
             related_for_drive = drive_related.get(drive, [])
-            for r_idx, (app, related) in enumerate(related_for_drive):
-                rel_id = str(related.get("id", ""))
-                row = r_idx // related_cols
-                col = r_idx % related_cols
-                rx1 = lane_x + 10 + col * (rel_w + rel_gap)
-                rx2 = rx1 + rel_w
-                ry1 = related_start_y + row * (rel_h + rel_gap)
-                ry2 = ry1 + rel_h
-                related_positions[rel_id] = (rx1, ry1, rx2, ry2)
-
-        max_related_rows = 0
-        for drive in drives:
-            count = len(drive_related.get(drive, []))
-            rows = (count + related_cols - 1) // related_cols if related_cols else 0
+            for r_idx, (rel_id, _label, _rel_drive) in enumerate(related_for_drive):
+                row, col = divmod(r_idx, related_cols)
+                rx1 = lane_cols[col]
+                ry1 = related_start_y + row * rel_stride
+                related_positions[rel_id] = (rx1, ry1, rx1 + rel_w, ry1 + rel_h)
+            rows = -(-len(related_for_drive) // related_cols)
             if rows > max_related_rows:
                 max_related_rows = rows
         total_width = margin_x * 2 + (len(drives) - 1) * lane_width + lane_width
-        total_height = related_start_y + max_related_rows * (rel_h + rel_gap) + 60
+        total_height = related_start_y + max_related_rows * rel_stride + 60
         self._drive_tag_map = {tag: drive for drive, tag in drive_tags.items()}
         self._draw_map_background(total_width, total_height, drives, lane_width, margin_x)
 
@@ -1129,140 +1654,283 @@ class MainView:
         node_outline = str(self._map_style.get("map_node_outline", "#52606d"))
         text_color = str(self._map_style.get("map_text", "#1f2933"))
         unknown_group = str(self._map_style.get("map_unknown_group", "#cbd2d9"))
+        # Highlighting only touches line fill/width, shape outline/width and label fill.
+        self._map_tag_defaults = [
+            ("edge", {"fill": edge_color, "width": 1}),
+            ("node:drive&&!label", {"outline": drive_outline, "width": 1}),
+            ("node&&!node:drive&&!label", {"outline": node_outline, "width": 1}),
+            ("label", {"fill": text_color}),
+        ]
 
         # Draw edges first so nodes sit above the lines.
         for drive in drives:
             drive_tag = drive_tags.get(drive, "")
-            for app in drive_apps.get(drive, []):
-                app_id = str(app.get("id", ""))
+            for app_id, *_rest in drive_apps.get(drive, []):
                 app_tag = app_tags.get(app_id, "")
                 if app_id not in app_positions:
                     continue
                 x1, y1, x2, y2 = drive_positions.get(drive, (0, 0, 0, 0))
                 ax1, ay1, ax2, ay2 = app_positions[app_id]
-                line_id = canvas.create_line(
-                    (x1 + x2) / 2,
-                    y2,
-                    (ax1 + ax2) / 2,
-                    ay1,
-                    fill=edge_color,
-                    width=1,
-                    tags=("map", "edge", drive_tag, app_tag),
+                self._add_map_edge(
+                    ("edge", drive, app_id),
+                    [(x1 + x2) / 2, y2, (ax1 + ax2) / 2, ay1],
+                    edge_color,
+                    ("map", "edge", drive_tag, app_tag),
                 )
-                self._map_item_styles[line_id] = {"fill": edge_color, "width": 1}
 
-        for app in apps:
-            app_id = str(app.get("id", ""))
+        for app_id, _name, _group, _drive, related_rows in app_rows:
             app_tag = app_tags.get(app_id, "")
             if app_id not in app_positions:
                 continue
             ax1, ay1, ax2, ay2 = app_positions[app_id]
-            for related in app.get("related", []) or []:
-                rel_id = str(related.get("id", ""))
+            for rel_id, _label, _rel_drive in related_rows:
                 if rel_id not in related_positions:
                     continue
                 rx1, ry1, rx2, ry2 = related_positions[rel_id]
-                line_id = canvas.create_line(
-                    (ax1 + ax2) / 2,
-                    ay2,
-                    (rx1 + rx2) / 2,
-                    ry1,
-                    fill=edge_color,
-                    width=1,
-                    tags=("map", "edge", app_tag),
+                self._add_map_edge(
+                    ("edge", app_id, rel_id),
+                    [(ax1 + ax2) / 2, ay2, (rx1 + rx2) / 2, ry1],
+                    edge_color,
+                    ("map", "edge", app_tag),
                 )
-                self._map_item_styles[line_id] = {"fill": edge_color, "width": 1}
 
         # Draw drive nodes.
         for drive in drives:
             x1, y1, x2, y2 = drive_positions[drive]
             drive_tag = drive_tags.get(drive, "")
-            rect_id = self._create_drive_diamond(
-                x1,
-                y1,
-                x2,
-                y2,
-                fill=drive_fill,
-                outline=drive_outline,
-                width=1,
-                tags=("map", "node", "node:drive", drive_tag),
-            )
-            self._map_item_styles[rect_id] = {"fill": drive_fill, "outline": drive_outline, "width": 1}
+            tags = ("map", "node", "node:drive", drive_tag)
             label = f"{drive}\\" if drive.endswith(":") else drive
-            text_id = canvas.create_text(
-                (x1 + x2) / 2,
-                (y1 + y2) / 2,
-                text=label,
-                fill=text_color,
-                tags=("map", "node", "node:drive", drive_tag),
+            self._add_map_node(
+                ("drive", drive),
+                (x1, y1, x2, y2),
+                [
+                    (
+                        "polygon",
+                        self._diamond_points(x1, y1, x2, y2),
+                        {"fill": drive_fill, "outline": drive_outline, "width": 1, "tags": tags},
+                    ),
+                    (
+                        "text",
+                        [(x1 + x2) / 2, (y1 + y2) / 2],
+                        {"text": label, "fill": text_color, "tags": tags + ("label",)},
+                    ),
+                ],
             )
-            self._map_item_styles[text_id] = {"fill": text_color}
 
         # Draw app nodes.
-        for app in apps:
-            app_id = str(app.get("id", ""))
+        for app_id, name, group, drive, _related_rows in app_rows:
             if app_id not in app_positions:
                 continue
             app_tag = app_tags.get(app_id, "")
-            group = str(app.get("group", "") or "")
             group_color = self._map_group_colors.get(group, unknown_group)
-            drive_tag = drive_tags.get(str(app.get("drive", "")), "")
+            drive_tag = drive_tags.get(drive, "")
             x1, y1, x2, y2 = app_positions[app_id]
-            rect_id = self._create_rounded_rect(
-                x1,
-                y1,
-                x2,
-                y2,
-                radius=app_corner_radius,
-                fill=group_color,
-                outline=node_outline,
-                width=1,
-                tags=("map", "node", "node:app", app_tag, drive_tag),
-            )
-            self._map_item_styles[rect_id] = {"fill": group_color, "outline": node_outline, "width": 1}
-            text_id = canvas.create_text(
-                (x1 + x2) / 2,
-                (y1 + y2) / 2,
-                text=str(app.get("name", "")),
-                fill=text_color,
-                tags=("map", "node", "node:app", app_tag, drive_tag),
+            tags = ("map", "node", "node:app", app_tag, drive_tag)
+            self._add_map_node(
+                ("app", app_id),
+                (x1, y1, x2, y2),
+                [
+                    (
+                        "polygon",
+                        self._rounded_rect_points(x1, y1, x2, y2, app_corner_radius),
+                        {"fill": group_color, "outline": node_outline, "width": 1, "tags": tags},
+                    ),
+                    (
+                        "text",
+                        [(x1 + x2) / 2, (y1 + y2) / 2],
+                        {"text": name, "fill": text_color, "tags": tags + ("label",)},
+                    ),
+                ],
             )
-            self._map_item_styles[text_id] = {"fill": text_color}
 
         # Draw related nodes.
-        for app in apps:
-            app_id = str(app.get("id", ""))
+        related_fills = {group: self._tint_color(color, 0.35) for group, color in self._map_group_colors.items()}
+        unknown_related_fill = self._tint_color(unknown_group, 0.35)
+        for app_id, _name, group, _drive, related_rows in app_rows:
             app_tag = app_tags.get(app_id, "")
-            group = str(app.get("group", "") or "")
-            group_color = self._map_group_colors.get(group, unknown_group)
-            related_fill = self._tint_color(group_color, 0.35)
-            for related in app.get("related", []) or []:
-                rel_id = str(related.get("id", ""))
+            related_fill = related_fills.get(group, unknown_related_fill)
+            for rel_id, label, rel_drive in related_rows:
                 if rel_id not in related_positions:
                     continue
-                drive_tag = drive_tags.get(str(related.get("drive", "")), "")
+                drive_tag = drive_tags.get(rel_drive, "")
                 x1, y1, x2, y2 = related_positions[rel_id]
-                rect_id = canvas.create_rectangle(
-                    x1,
-                    y1,
-                    x2,
-                    y2,
-                    fill=related_fill,
-                    outline=node_outline,
-                    width=1,
-                    tags=("map", "node", "node:file", app_tag, drive_tag),
+                tags = ("map", "node", "node:file", app_tag, drive_tag)
+                self._add_map_node(
+                    ("file", app_id, rel_id),
+                    (x1, y1, x2, y2),
+                    [
+                        (
+                            "rectangle",
+                            [x1, y1, x2, y2],
+                            {"fill": related_fill, "outline": node_outline, "width": 1, "tags": tags},
+                        ),
+                        (
+                            "text",
+                            [(x1 + x2) / 2, (y1 + y2) / 2],
+                            {"text": label, "fill": text_color, "tags": tags + ("label",)},
+                        ),
+                    ],
                 )
-                self._map_item_styles[rect_id] = {"fill": related_fill, "outline": node_outline, "width": 1}
-                text_id = canvas.create_text(
-                    (x1 + x2) / 2,
-                    (y1 + y2) / 2,
-                    text=str(related.get("label", "")),
-                    fill=text_color,
-                    tags=("map", "node", "node:file", app_tag, drive_tag),
-                )
-                self._map_item_styles[text_id] = {"fill": text_color}
 
         canvas.configure(scrollregion=(0, 0, total_width, total_height))
+        self._reuse_map_items(previous)
+        self._render_map_viewport()
+
+    def _reuse_map_items(
+        self,
+        previous: Dict[Tuple[str, ...], Tuple[List[Tuple[str, List[float], Dict[str, object]]], List[int]]],
+    ) -> None:
+        canvas = self.map_canvas
+        stale: List[int] = []
+        for index, key in enumerate(self._map_node_keys):
+            entry = previous.pop(key, None)
+            if entry is None:
+                continue
+            old_items, item_ids = entry
+            items = self._map_nodes[index][1]
+            if [item[0] for item in old_items] != [item[0] for item in items]:
+                stale.extend(item_ids)
+                continue
+            for item_id, (_old_kind, old_coords, old_options), (_kind, coords, options) in zip(item_ids, old_items, items):
+                if coords != old_coords:
+                    canvas.coords(item_id, *coords)
+                if options != old_options:
+                    canvas.itemconfigure(item_id, **options)
+            self._map_rendered[index] = item_ids
+        for _items, item_ids in previous.values():
+            stale.extend(item_ids)
+        if stale:
+            canvas.delete(*stale)
+
+    def _add_map_node(
+        self,
+        key: Tuple[str, ...],
+        bbox: Tuple[float, float, float, float],
+        items: List[Tuple[str, List[float], Dict[str, object]]],
+    ) -> None:
+        index = len(self._map_nodes)
+        self._map_nodes.append((bbox, items))
+        self._map_node_keys.append(key)
+        cell = self.MAP_CELL_SIZE
+        x1, y1, x2, y2 = bbox
+        for cx in range(int(x1 // cell), int(x2 // cell) + 1):
+            for cy in range(int(y1 // cell), int(y2 // cell) + 1):
+                self._map_cells.setdefault((cx, cy), []).append(index)
+
+    def _add_map_edge(self, key: Tuple[str, ...], coords: List[float], color: str, tags: Tuple[str, ...]) -> None:
+        x1, y1, x2, y2 = coords
+        self._add_map_node(
+            key,
+            (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)),
+            [("line", coords, {"fill": color, "width": 1, "tags": tags})],
+        )
+
+    def _on_map_view_change(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
+        scrollbar.set(first, last)
+        self._schedule_map_render()
+
+    def _schedule_map_render(self) -> None:
+        if self._map_render_job is None and self._map_nodes:
+            self._map_render_job = self.root.after_idle(self._render_map_viewport)
+
+    def _cancel_map_render(self) -> None:
+        if self._map_render_job is not None:
+            self.root.after_cancel(self._map_render_job)
+            self._map_render_job = None
+
+    def _render_map_viewport(self) -> None:
+        self._map_render_job = None
+        if not self._map_nodes:
+            return
+        canvas = self.map_canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            width = canvas.winfo_reqwidth()
+            height = canvas.winfo_reqheight()
+        margin = self.MAP_VIEWPORT_MARGIN
+        left = canvas.canvasx(0) - margin
+        top = canvas.canvasy(0) - margin
+        right = canvas.canvasx(width) + margin
+        bottom = canvas.canvasy(height) + margin
+        cell = self.MAP_CELL_SIZE
+        visible: Set[int] = set()
+        for cx in range(int(left // cell), int(right // cell) + 1):
+            for cy in range(int(top // cell), int(bottom // cell) + 1):
+                for index in self._map_cells.get((cx, cy), ()):
+                    x1, y1, x2, y2 = self._map_nodes[index][0]
+                    if x1 <= right and x2 >= left and y1 <= bottom and y2 >= top:
+                        visible.add(index)
+
+        rendered = self._map_rendered
+        stale = [index for index in rendered if index not in visible]
+        for index in stale:
+            canvas.delete(*rendered.pop(index))
+
+        # Node indices follow draw order (edges first), so sorting keeps the layering stable.
+        pending = sorted(visible.difference(rendered))
+        specs = [spec for index in pending for spec in self._map_nodes[index][1]]
+        if not specs:
+            return
+        # Edges precede every node in draw order, so they form a prefix of the pending specs.
+        edge_count = 0
+        while edge_count < len(specs) and specs[edge_count][0] == "line":
+            edge_count += 1
+        created = self._create_map_items(canvas, specs[:edge_count], self.MAP_BATCH_EDGE_ITEMS)
+        created.extend(self._create_map_items(canvas, specs[edge_count:], self.MAP_BATCH_CREATE_ITEMS))
+        highlight_tag = self._map_highlight_tag
+        created_highlighted = False
+        created_edge = False
+        position = 0
+        for index in pending:
+            item_count = len(self._map_nodes[index][1])
+            for kind, _coords, options in self._map_nodes[index][1]:
+                if highlight_tag and highlight_tag in options["tags"]:
+                    created_highlighted = True
+                if kind == "line":
+                    created_edge = True
+            rendered[index] = created[position : position + item_count]
+            position += item_count
+        if created_highlighted:
+            self._apply_map_highlight(highlight_tag)
+        if created_edge:
+            try:
+                canvas.tag_lower("edge", "node")
+            except tk.TclError:
+                pass
+
+    @staticmethod
+    def _create_map_items(
+        canvas: tk.Canvas,
+        specs: List[Tuple[str, List[float], Dict[str, object]]],
+        batch_threshold: int,
+    ) -> List[int]:
+        if len(specs) > batch_threshold:
+            return MainView._create_map_items_batched(canvas, specs)
+        creators = {
+            "line": canvas.create_line,
+            "polygon": canvas.create_polygon,
+            "rectangle": canvas.create_rectangle,
+            "text": canvas.create_text,
+        }
+        return [creators[kind](coords, **options) for kind, coords, options in specs]
+
+    @staticmethod
+    def _create_map_items_batched(
+        canvas: tk.Canvas,
+        specs: List[Tuple[str, List[float], Dict[str, object]]],
+    ) -> List[int]:
+        # Arguments travel as Tcl list objects (no script text is built), so labels
+        # containing braces, quotes or brackets need no escaping.
+        commands = []
+        for kind, coords, options in specs:
+            command: List[object] = [str(canvas), "create", kind, *coords]
+            for key, value in options.items():
+                command.append(f"-{key}")
+                command.append(value)
+            commands.append(tuple(command))
+        result = canvas.tk.call("apply", ("commands", "lmap command $commands {{*}$command}"), tuple(commands))
+        return [int(item_id) for item_id in canvas.tk.splitlist(result)]
 
     def _on_map_click(self, _event: tk.Event) -> None:
         tags = self.map_canvas.gettags("current")
@@ -1285,8 +1953,7 @@ class MainView:
         self._highlight_map_items(selection)
 
     def _on_map_mousewheel(self, event: tk.Event) -> None:
-        if not self.map_canvas.winfo_exists():
-            return
+        # Wheel bindings live on the canvas itself, so they cannot fire after it is destroyed.
         delta = 0
         if hasattr(event, "delta") and event.delta:
             delta = int(event.delta / 120)
@@ -1298,33 +1965,60 @@ class MainView:
         if delta == 0:
             return
         if getattr(event, "state", 0) & 0x0001:
-            self.map_canvas.xview_scroll(-delta, "units")
+            self._map_wheel_dx -= delta
         else:
-            self.map_canvas.yview_scroll(-delta, "units")
+            self._map_wheel_dy -= delta
+        if self._map_wheel_job is None:
+            self._map_wheel_job = self.root.after_idle(self._apply_map_wheel)
+
+    def _on_map_canvas_destroy(self, _event: tk.Event) -> None:
+        # Drop a coalesced scroll that would otherwise run against the dead canvas.
+        if self._map_wheel_job is not None:
+            self.root.after_cancel(self._map_wheel_job)
+            self._map_wheel_job = None
+        self._map_wheel_dx = self._map_wheel_dy = 0
+
+    def _apply_map_wheel(self) -> None:
+        self._map_wheel_job = None
+        dx, dy = self._map_wheel_dx, self._map_wheel_dy
+        self._map_wheel_dx = self._map_wheel_dy = 0
+        if dx:
+            self.map_canvas.xview_scroll(dx, "units")
+        if dy:
+            self.map_canvas.yview_scroll(dy, "units")
 
     def _clear_map_highlight(self) -> None:
-        if not self._map_item_styles:
+        selection = self._map_highlight_tag
+        if not selection:
             return
-        for item_id, style in self._map_item_styles.items():
+        for expression, style in self._map_tag_defaults:
             try:
-                self.map_canvas.itemconfigure(item_id, **style)
+                self.map_canvas.itemconfigure(f"{selection}&&{expression}", **style)
             except tk.TclError:
                 continue
         self._map_highlight_tag = ""
 
     def _highlight_map_items(self, selection: str) -> None:
+        # Items created later by the viewport pass pick up the active highlight themselves.
+        if selection == self._map_highlight_tag:
+            return
         self._clear_map_highlight()
-        highlight = str(self._map_style.get("map_highlight", "#0b69ff"))
-        for item_id in self.map_canvas.find_withtag(selection):
-            kind = self.map_canvas.type(item_id)
-            if kind == "line":
-                self.map_canvas.itemconfigure(item_id, fill=highlight, width=2)
-            elif kind in {"rectangle", "oval", "polygon"}:
-                self.map_canvas.itemconfigure(item_id, outline=highlight, width=2)
-            elif kind == "text":
-                self.map_canvas.itemconfigure(item_id, fill=highlight)
+        self._apply_map_highlight(selection)
         self._map_highlight_tag = selection
 
+    def _apply_map_highlight(self, selection: str) -> None:
+        # One itemconfigure per item class; Tk resolves the tag expression over all matches in C.
+        highlight = str(self._map_style.get("map_highlight", "#0b69ff"))
+        for expression, style in (
+            ("edge", {"fill": highlight, "width": 2}),
+            ("node&&!label", {"outline": highlight, "width": 2}),
+            ("label", {"fill": highlight}),
+        ):
+            try:
+                self.map_canvas.itemconfigure(f"{selection}&&{expression}", **style)
+            except tk.TclError:
+                continue
+
     def _on_map_right_click(self, event: tk.Event) -> None:
         tags = self.map_canvas.gettags("current")
         drive = ""
@@ -1335,28 +2029,34 @@ class MainView:
         if not drive:
             return
         self._map_context_drive = drive
-        self._build_drive_tint_menu(drive)
+        menu = self._build_drive_tint_menu(drive)
         try:
-            self.map_context_menu.tk_popup(event.x_root, event.y_root)
+            menu.tk_popup(event.x_root, event.y_root)
         finally:
-            self.map_context_menu.grab_release()
+            menu.grab_release()
 
-    def _build_drive_tint_menu(self, drive: str) -> None:
-        self.map_context_menu.delete(0, tk.END)
+    def _build_drive_tint_menu(self, drive: str) -> tk.Menu:
+        # The palette is fixed and _set_drive_tint reads _map_context_drive, so the entries are
+        # built once; only the Default swatch follows the current map background.
+        menu = self._ensure_map_context_menu()
         default_color = str(self._map_style.get("map_bg", "#f4f6f9"))
-        self.map_context_menu.add_command(
+        if menu.index(tk.END) is not None:
+            menu.entryconfigure(0, image=self._get_tint_icon(default_color))
+            return menu
+        menu.add_command(
             label="Default",
             image=self._get_tint_icon(default_color),
             compound="left",
             command=lambda: self._set_drive_tint(""),
         )
         for color in self._drive_tint_palette:
-            self.map_context_menu.add_command(
+            menu.add_command(
                 label="",
                 image=self._get_tint_icon(color),
                 compound="left",
                 command=lambda c=color: self._set_drive_tint(c),
             )
+        return menu
 
     def _set_drive_tint(self, color: str) -> None:
         drive = self._map_context_drive
@@ -1372,34 +2072,70 @@ class MainView:
         if width <= 0 or height <= 0:
             return
         bg = str(self._map_style.get("map_bg", "#f4f6f9"))
-        noise_color = self._tint_color(bg, 0.05)
-        noise_color_alt = self._tint_color(bg, 0.1)
-        specks = max(200, min(2000, (width * height) // 8000))
-        seed = width * 131 + height * 17 + len(drives) * 19
-        x = seed % max(width, 1)
-        y = (seed * 3) % max(height, 1)
-        for i in range(int(specks)):
-            x = (x * 1664525 + 1013904223) % max(width, 1)
-            y = (y * 22695477 + 1) % max(height, 1)
-            size = 2 if (i % 7 == 0) else 1
-            color = noise_color if (i % 2 == 0) else noise_color_alt
-            self.map_canvas.create_rectangle(x, y, x + size, y + size, outline="", fill=color, tags=("map", "noise"))
-
-        for idx, drive in enumerate(drives):
-            tint = self._drive_band_color(drive, idx)
+        bands = [self._drive_band_color(drive, idx) for idx, drive in enumerate(drives)]
+        background_key = (width, height, tuple(drives), lane_width, margin_x, bg, tuple(bands))
+        if background_key == self._map_background_key:
+            return
+        self._map_background_key = background_key
+        self.map_canvas.delete("noise")
+        tile = self._map_noise_tile(bg)
+        tile_size = self.MAP_NOISE_TILE_SIZE
+        for x in range(0, width, tile_size):
+            for y in range(0, height, tile_size):
+                self.map_canvas.create_image(x, y, image=tile, anchor="nw", tags=("map", "noise"))
+
+        band_items = self._map_band_items
+        used = 0
+        for idx, tint in enumerate(bands):
             if not tint:
                 continue
             x1 = margin_x + idx * lane_width
             x2 = x1 + lane_width - 8
-            self.map_canvas.create_rectangle(
-                x1,
-                0,
-                x2,
-                height,
-                fill=tint,
-                outline="",
-                tags=("map", "band"),
-            )
+            if used < len(band_items):
+                item = band_items[used]
+                self.map_canvas.coords(item, x1, 0, x2, height)
+                self.map_canvas.itemconfigure(item, fill=tint, state="normal")
+            else:
+                band_items.append(
+                    self.map_canvas.create_rectangle(
+                        x1,
+                        0,
+                        x2,
+                        height,
+                        fill=tint,
+                        outline="",
+                        tags=("map", "band"),
+                    )
+                )
+            used += 1
+        for item in band_items[used:]:
+            self.map_canvas.itemconfigure(item, state="hidden")
+        # Nodes kept from the previous draw sit below the new background; push it back down.
+        try:
+            self.map_canvas.tag_lower("band")
+            self.map_canvas.tag_lower("noise")
+        except tk.TclError:
+            pass
+
+    def _map_noise_tile(self, bg: str) -> tk.PhotoImage:
+        tile = self._map_noise_tiles.get(bg)
+        if tile is not None:
+            return tile
+        # A few dozen put() calls render the speckle once, instead of thousands of 1-2px canvas items.
+        size = self.MAP_NOISE_TILE_SIZE
+        tile = tk.PhotoImage(width=size, height=size)
+        tile.put(bg, to=(0, 0, size, size))
+        noise_color = self._tint_color(bg, 0.05)
+        noise_color_alt = self._tint_color(bg, 0.1)
+        x, y = 131, 17
+        for i in range(size * size // 4000):
+            x = (x * 1664525 + 1013904223) % size
+            y = (y * 22695477 + 1) % size
+            speck = 2 if (i % 7 == 0) else 1
+            color = noise_color if (i % 2 == 0) else noise_color_alt
+            tile.put(color, to=(x, y, min(size, x + speck), min(size, y + speck)))
+        self._map_noise_tiles[bg] = tile
+        return tile
 
     def _drive_band_color(self, drive: str, index: int) -> str:
         if drive in self._drive_band_colors:
@@ -1408,55 +2144,42 @@ class MainView:
             return ""
         return self._drive_tint_palette[index % len(self._drive_tint_palette)]
 
-    def _create_rounded_rect(
-        self,
-        x1: float,
-        y1: float,
-        x2: float,
-        y2: float,
-        radius: int,
-        **kwargs,
-    ) -> int:
-        radius = max(0, min(radius, int((x2 - x1) / 2), int((y2 - y1) / 2)))
-        points = [
-            x1 + radius,
-            y1,
-            x2 - radius,
-            y1,
-            x2,
-            y1,
-            x2,
-            y1 + radius,
-            x2,
-            y2 - radius,
-            x2,
-            y2,
-            x2 - radius,
-            y2,
-            x1 + radius,
-            y2,
-            x1,
-            y2,
-            x1,
-            y2 - radius,
-            x1,
-            y1 + radius,
-            x1,
-            y1,
-        ]
-        return self.map_canvas.create_polygon(points, smooth=True, splinesteps=12, **kwargs)
+    @staticmethod
+    def _rounded_rect_points(x1: float, y1: float, x2: float, y2: float, radius: int) -> List[float]:
+        offsets = MainView._rounded_rect_offsets(x2 - x1, y2 - y1, radius)
+        return [value + (x1 if index % 2 == 0 else y1) for index, value in enumerate(offsets)]
 
-    def _create_drive_diamond(
-        self,
-        x1: float,
-        y1: float,
-        x2: float,
-        y2: float,
-        **kwargs,
-    ) -> int:
+    # App cards share a handful of sizes, so the outline is built once per (width, height, radius).
+    # Corners are pre-tessellated into straight segments, tracing the same quadratic curve Tk's
+    # smooth=True would draw through the old control points, so the polygon needs no spline pass.
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _rounded_rect_offsets(width: float, height: float, radius: int) -> Tuple[float, ...]:
+        radius = max(0, min(radius, int(width / 2), int(height / 2)))
+        half = radius / 2
+        corners = (
+            ((width - half, 0), (width, 0), (width, half)),
+            ((width, height - half), (width, height), (width - half, height)),
+            ((half, height), (0, height), (0, height - half)),
+            ((0, half), (0, 0), (half, 0)),
+        )
+        steps = MainView.MAP_CORNER_STEPS
+        points: List[float] = []
+        for (sx, sy), (cx, cy), (ex, ey) in corners:
+            for step in range(steps + 1):
+                t = step / steps
+                a = (1 - t) * (1 - t)
+                b = 2 * t * (1 - t)
+                c = t * t
+                points.append(a * sx + b * cx + c * ex)
+                points.append(a * sy + b * cy + c * ey)
+        return tuple(points)
+
+    @staticmethod
+    def _diamond_points(x1: float, y1: float, x2: float, y2: float) -> List[float]:
         cx = (x1 + x2) / 2
         cy = (y1 + y2) / 2
-        points = [
+        return [
             x1,
             cy,
             cx,
@@ -1466,15 +2189,14 @@ class MainView:
             cx,
             y2,
         ]
-        return self.map_canvas.create_polygon(points, **kwargs)
 
-    def _get_tint_icon(self, color: str) -> tk.PhotoImage:
-        swatch = self._swatch_color(color)
-        key = f"{color.casefold()}::{swatch.casefold()}"
+    def _get_tint_icon(self, color: str, size: int = 14) -> tk.PhotoImage:
+        # The swatch is derived from the color, so the color alone identifies the icon.
+        key = (color.casefold(), size)
         icon = self._tint_icons.get(key)
-        if icon:
+        if icon is not None:
             return icon
-        size = 14
+        swatch = self._swatch_color(color)
         icon = tk.PhotoImage(width=size, height=size)
         border = "#8a8a8a"
         icon.put(border, to=(0, 0, size, size))
@@ -1482,56 +2204,61 @@ class MainView:
         self._tint_icons[key] = icon
         return icon
 
-    def _swatch_color(self, color: str) -> str:
+    # The color helpers below are pure and see the same few palette/style colors on every redraw.
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _swatch_color(color: str) -> str:
         text = color.strip()
         if not text.startswith("#"):
             return text
-        base = text.lstrip("#")
-        if len(base) != 6:
-            return text
-        try:
-            r = int(base[0:2], 16)
-            g = int(base[2:4], 16)
-            b = int(base[4:6], 16)
-        except ValueError:
+        rgb = MainView._parse_hex(text)
+        if rgb is None:
             return text
+        r, g, b = rgb
         luminance = (0.2126 * r + 0.7152 * g + 0.0722 * b) / 255.0
         if luminance > 0.88:
-            return self._shade_color(text, 0.82)
+            return MainView._shade_color(text, 0.82)
         return text
 
+    # Shared by the colour helpers, which see the same palette entries.
     @staticmethod
-    def _shade_color(value: str, factor: float) -> str:
+    @functools.lru_cache(maxsize=256)
+    def _parse_hex(value: str) -> Optional[Tuple[int, int, int]]:
         text = value.strip().lstrip("#")
         if len(text) != 6:
-            return value
+            return None
         try:
-            r = int(text[0:2], 16)
-            g = int(text[2:4], 16)
-            b = int(text[4:6], 16)
+            r, g, b = bytes.fromhex(text)
         except ValueError:
+            return None
+        return r, g, b
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _shade_color(value: str, factor: float) -> str:
+        rgb = MainView._parse_hex(value)
+        if rgb is None:
             return value
+        r, g, b = rgb
         factor = max(0.0, min(1.0, factor))
         r = int(r * factor)
         g = int(g * factor)
         b = int(b * factor)
         return f"#{r:02x}{g:02x}{b:02x}"
 
+    # Both are pure and called once per map node with heavily repeated inputs.
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _safe_tag(raw: str) -> str:
-        return re.sub(r"[^a-zA-Z0-9_-]+", "_", raw or "")
+        return (raw or "").translate(_SAFE_TAG_TABLE)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _tint_color(value: str, amount: float) -> str:
-        text = value.strip().lstrip("#")
-        if len(text) != 6:
-            return value
-        try:
-            r = int(text[0:2], 16)
-            g = int(text[2:4], 16)
-            b = int(text[4:6], 16)
-        except ValueError:
+        rgb = MainView._parse_hex(value)
+        if rgb is None:
             return value
+        r, g, b = rgb
         amount = max(0.0, min(1.0, amount))
         r = int(r + (255 - r) * amount)
         g = int(g + (255 - g) * amount)
@@ -1540,56 +2267,42 @@ class MainView:
 
     def _on_tree_click(self, event: tk.Event) -> None:
         self.cancel_group_editor()
-        region = self.system_tree.identify_region(event.x, event.y)
-        if region != "cell":
-            return
-        column = self.system_tree.identify_column(event.x)
-        row_id = self.system_tree.identify_row(event.y)
-        if not row_id:
-            return
-        col_index = int(column.replace("#", "")) - 1
-        if col_index < 0 or col_index >= len(self.column_keys):
-            return
-        if self.column_keys[col_index] != "website":
+        column, row_id = self._identify_cell(self.system_tree, event)
+        if not row_id or self._col_id_to_key.get(column) != "website":
             return
         value = self.system_tree.set(row_id, "website")
         self._dispatch("on_website_click")(value)
 
+    def _queue_tree_motion(self, event: tk.Event) -> None:
+        # Hover only drives the cursor shape, so handle the latest position once per idle pass.
+        self._tree_motion_event = event
+        if self._tree_motion_job is None:
+            self._tree_motion_job = self.root.after_idle(self._drain_tree_motion)
+
+    def _drain_tree_motion(self) -> None:
+        self._tree_motion_job = None
+        event = self._tree_motion_event
+        self._tree_motion_event = None
+        if event is not None:
+            self._on_tree_motion(event)
+
     def _on_tree_motion(self, event: tk.Event) -> None:
-        region = self.system_tree.identify_region(event.x, event.y)
-        if region != "cell":
-            self.system_tree.configure(cursor="")
-            return
-        column = self.system_tree.identify_column(event.x)
-        row_id = self.system_tree.identify_row(event.y)
-        if not row_id:
-            self.system_tree.configure(cursor="")
-            return
-        col_index = int(column.replace("#", "")) - 1
-        if col_index < 0 or col_index >= len(self.column_keys):
-            self.system_tree.configure(cursor="")
-            return
-        if self.column_keys[col_index] != "website":
-            self.system_tree.configure(cursor="")
+        column, row_id = self._identify_cell(self.system_tree, event)
+        if not row_id or self._col_id_to_key.get(column) != "website":
+            self._set_tree_cursor("")
             return
         value = self.system_tree.set(row_id, "website")
-        if value and value != "NOT FOUND":
-            self.system_tree.configure(cursor="hand2")
-        else:
-            self.system_tree.configure(cursor="")
+        self._set_tree_cursor("hand2" if value and value != "NOT FOUND" else "")
+
+    def _set_tree_cursor(self, cursor: str) -> None:
+        # Only touch Tk when the hover state actually flips.
+        if cursor != self._tree_cursor_state:
+            self._tree_cursor_state = cursor
+            self.system_tree.configure(cursor=cursor)
 
     def _on_tree_double_click(self, event: tk.Event) -> None:
-        region = self.system_tree.identify_region(event.x, event.y)
-        if region != "cell":
-            return
-        column = self.system_tree.identify_column(event.x)
-        row_id = self.system_tree.identify_row(event.y)
-        if not row_id:
-            return
-        col_index = int(column.replace("#", "")) - 1
-        if col_index < 0 or col_index >= len(self.column_keys):
-            return
-        if self.column_keys[col_index] != "group":
+        column, row_id = self._identify_cell(self.system_tree, event)
+        if not row_id or self._col_id_to_key.get(column) != "group":
             return
         self._dispatch("on_group_double_click")(row_id)
 
@@ -1597,7 +2310,7 @@ class MainView:
         selection = self.system_tree.selection()
         if not selection:
             return
-        self._dispatch("on_row_select")(selection[0])
+        self._on_row_select(selection[0])
 
     def _on_related_double_click(self, event: tk.Event) -> None:
         region = self.related_tree.identify_region(event.x, event.y)
@@ -1,10 +1,25 @@
 from dataclasses import dataclass, field
 import datetime as _dt
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    # Repeated strings (publishers, versions, groups) share one object.
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_iso_date(raw: Any) -> Optional[_dt.date]:
+    if not raw:
+        return None
+    try:
+        return _dt.date.fromisoformat(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class RelatedFile:
     path: str
     kind: str = "file"
@@ -12,8 +27,13 @@ class RelatedFile:
     confidence: str = ""
     marked: str = ""
     score: int = 0
-    _search_cache: str = field(default="", init=False, repr=False, compare=False)
-    _search_cache_src: Tuple[str, str, str, str] = field(default=("", "", "", ""), init=False, repr=False, compare=False)
+    _search_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.kind = _intern(self.kind)
+        self.source = _intern(self.source)
+        self.confidence = _intern(self.confidence)
+        self.marked = _intern(self.marked)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -25,14 +45,18 @@ class RelatedFile:
         }
 
     def search_blob(self) -> str:
-        src = (self.path, self.source, self.confidence, self.marked)
-        if src != self._search_cache_src:
-            self._search_cache_src = src
-            self._search_cache = " ".join(part for part in src if part).casefold()
-        return self._search_cache
+        # Related files are fixed after load; editors call invalidate() on change.
+        blob = self._search_cache
+        if blob is None:
+            src = (self.path, self.source, self.confidence, self.marked)
+            blob = self._search_cache = " ".join(part for part in src if part).casefold()
+        return blob
+
+    def invalidate(self) -> None:
+        self._search_cache = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppEntry:
     name: str
     version: str = ""
@@ -43,51 +67,65 @@ class AppEntry:
     website: str = ""
     group: str = ""
     related_files: List[RelatedFile] = field(default_factory=list)
+    _cache_version: int = field(default=0, init=False, repr=False, compare=False)
     _key_cache: str = field(default="", init=False, repr=False, compare=False)
-    _key_cache_src: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    _key_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _legacy_key_cache: str = field(default="", init=False, repr=False, compare=False)
+    _legacy_key_version: int = field(default=-1, init=False, repr=False, compare=False)
     _name_key_cache: str = field(default="", init=False, repr=False, compare=False)
-    _name_key_src: str = field(default="", init=False, repr=False, compare=False)
+    _name_key_version: int = field(default=-1, init=False, repr=False, compare=False)
     _install_date_cache: Optional[_dt.date] = field(default=None, init=False, repr=False, compare=False)
-    _install_date_src: str = field(default="", init=False, repr=False, compare=False)
     _search_cache: str = field(default="", init=False, repr=False, compare=False)
-    _search_cache_src: Tuple[str, str] = field(default=("", ""), init=False, repr=False, compare=False)
+    _search_version: int = field(default=-1, init=False, repr=False, compare=False)
     related_scanned: bool = field(default=False, init=False, repr=False, compare=False)
     related_scan_token: str = field(default="", init=False, repr=False, compare=False)
 
+    # Writes to these fields bump _cache_version so the derived values recompute.
+    _CACHE_SOURCES = frozenset({"name", "version", "install_date", "publisher"})
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        object.__setattr__(self, attr, value)
+        if attr in AppEntry._CACHE_SOURCES:
+            object.__setattr__(self, "_cache_version", getattr(self, "_cache_version", 0) + 1)
+            if attr == "install_date":
+                # Dates are set once per scan/override; parse at write time, not per sort.
+                object.__setattr__(self, "_install_date_cache", _parse_iso_date(value))
+
+    def __post_init__(self) -> None:
+        self.version = _intern(self.version)
+        self.install_date = _intern(self.install_date)
+        self.publisher = _intern(self.publisher)
+        self.group = _intern(self.group)
+
     def key(self) -> str:
-        src = (self.name or "", self.version or "")
-        if src != self._key_cache_src:
-            self._key_cache_src = src
-            name, version = src
+        # Kept as a string: keys double as Treeview iids and persisted group ids.
+        if self._key_version != self._cache_version:
+            self._key_version = self._cache_version
+            name = self.name or ""
+            version = self.version or ""
             self._key_cache = f"{len(name)}|{name}|{len(version)}|{version}"
         return self._key_cache
 
     def legacy_key(self) -> str:
-        return json.dumps([self.name, self.version], ensure_ascii=True)
+        # Looked up next to key() for every override/size-cache check; json.dumps is the slow part.
+        if self._legacy_key_version != self._cache_version:
+            self._legacy_key_version = self._cache_version
+            self._legacy_key_cache = json.dumps([self.name, self.version], ensure_ascii=True)
+        return self._legacy_key_cache
 
     def name_key(self) -> str:
-        name = self.name or ""
-        if name != self._name_key_src:
-            self._name_key_src = name
-            self._name_key_cache = name.casefold()
+        if self._name_key_version != self._cache_version:
+            self._name_key_version = self._cache_version
+            self._name_key_cache = (self.name or "").casefold()
         return self._name_key_cache
 
     def install_date_value(self) -> Optional[_dt.date]:
-        raw = self.install_date or ""
-        if raw != self._install_date_src:
-            self._install_date_src = raw
-            self._install_date_cache = None
-            if raw:
-                try:
-                    self._install_date_cache = _dt.date.fromisoformat(raw)
-                except ValueError:
-                    self._install_date_cache = None
         return self._install_date_cache
 
     def search_blob(self) -> str:
-        src = (self.name or "", self.publisher or "")
-        if src != self._search_cache_src:
-            self._search_cache_src = src
+        if self._search_version != self._cache_version:
+            self._search_version = self._cache_version
+            src = (self.name or "", self.publisher or "")
             self._search_cache = " ".join(part for part in src if part).casefold()
         return self._search_cache
 
@@ -1,27 +1,47 @@
 import os
 import re
+import stat
+import threading
 import time
 import difflib
-from typing import Dict, Iterable, List, Optional, Tuple
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from models import AppEntry, RelatedFile
 
-
-CONFIG_EXTENSIONS = {
-    ".cfg",
-    ".config",
-    ".dat",
-    ".db",
-    ".ini",
-    ".json",
-    ".sqlite",
-    ".xml",
-    ".yaml",
-    ".yml",
-}
+_CLEAN_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:  # pragma: no cover - optional dependency
+    _fuzz_ratio = None
+
+
+CONFIG_EXTENSIONS = frozenset(
+    {
+        ".cfg",
+        ".config",
+        ".dat",
+        ".db",
+        ".ini",
+        ".json",
+        ".sqlite",
+        ".xml",
+        ".yaml",
+        ".yml",
+    }
+)
+# str.endswith takes a tuple and matches in C, replacing splitext + lower + set lookup per file.
+_CONFIG_SUFFIXES = tuple(sorted(CONFIG_EXTENSIONS))
+_DEEP_SCAN_SUFFIXES = _CONFIG_SUFFIXES + (".exe",)
+_CAP_CHECK: Tuple[str, None] = ("", None)
 
 
 class RelatedFileScanner:
+    # Parallel deep-scan walkers; kept small so spinning disks are not thrashed.
+    DEEP_SCAN_WORKERS = 4
+
     def __init__(self, max_dirs: int = 25, max_files: int = 200, max_depth: int = 3) -> None:
         self.max_dirs = max_dirs
         self.max_files = max_files
@@ -29,6 +49,9 @@ class RelatedFileScanner:
         self._config_cache: Dict[str, List[str]] = {}
         self._root_index: List[Tuple[str, str, str]] = []
         self._root_index_key: Optional[Tuple[bool, Tuple[str, ...]]] = None
+        # Postings over _root_index positions: cleaned name -> entries, trigram -> entries.
+        self._root_exact: Dict[str, List[int]] = {}
+        self._root_trigrams: Dict[str, List[int]] = {}
         self._source_scores = {
             "install_location": 100,
             "appdata": 70,
@@ -45,6 +68,8 @@ class RelatedFileScanner:
         self._config_cache.clear()
         self._root_index = []
         self._root_index_key = None
+        self._root_exact = {}
+        self._root_trigrams = {}
 
     def build_root_index(self, deep_scan: bool, extra_roots: Optional[List[str]] = None) -> List[Tuple[str, str, str]]:
         roots: List[str] = []
@@ -83,8 +108,48 @@ class RelatedFileScanner:
                 continue
         self._root_index = index
         self._root_index_key = key
+        self._build_root_postings(index)
         return index
 
+    def _build_root_postings(self, index: List[Tuple[str, str, str]]) -> None:
+        exact: Dict[str, List[int]] = {}
+        trigrams: Dict[str, List[int]] = {}
+        for position, (_path, _source, name_cf) in enumerate(index):
+            exact.setdefault(_cleaned(name_cf), []).append(position)
+            for gram in {name_cf[i : i + 3] for i in range(len(name_cf) - 2)}:
+                trigrams.setdefault(gram, []).append(position)
+        self._root_exact = exact
+        self._root_trigrams = trigrams
+
+    def _root_candidates(
+        self,
+        root_index: List[Tuple[str, str, str]],
+        tokens: Iterable[str],
+        exact_names: Iterable[str],
+    ) -> Iterable[Tuple[str, str, str]]:
+        # Superset of the entries the matching loop in scan_for_app can accept, in index order:
+        # exact cleaned-name hits plus entries containing every trigram of a substring token.
+        if root_index is not self._root_index:
+            return root_index
+        positions: Set[int] = set()
+        for name in exact_names:
+            if name:
+                positions.update(self._root_exact.get(name, ()))
+        for token in tokens:
+            if len(token) < 3:
+                return root_index
+            grams = {token[i : i + 3] for i in range(len(token) - 2)}
+            postings = sorted((self._root_trigrams.get(gram, ()) for gram in grams), key=len)
+            if not postings[0]:
+                continue
+            matched = set(postings[0])
+            for posting in postings[1:]:
+                matched.intersection_update(posting)
+                if not matched:
+                    break
+            positions |= matched
+        return [root_index[position] for position in sorted(positions)]
+
     def scan(
         self,
         apps: List[AppEntry],
@@ -122,16 +187,27 @@ class RelatedFileScanner:
         seen_dirs = set()
 
         install_location = _clean_path(app.install_location)
-        if install_location and os.path.isfile(install_location):
-            install_location = os.path.dirname(install_location)
-        if install_location and os.path.isdir(install_location):
+        if install_location:
+            # One stat answers both "is it a file" and "is it a folder"; a file's parent is always a folder.
+            try:
+                mode = os.stat(install_location).st_mode
+            except (OSError, ValueError):
+                mode = 0
+            if stat.S_ISREG(mode):
+                install_location = os.path.dirname(install_location)
+            elif not stat.S_ISDIR(mode):
+                install_location = ""
+        if install_location:
             candidates.append((install_location, "install_location", "High"))
             seen_dirs.add(_normalize_path(install_location))
 
         if deep_scan or extra_roots:
             if root_index is None:
                 root_index = self.build_root_index(deep_scan, extra_roots=extra_roots)
-            for path, source, name_cf in root_index:
+            root_entries = self._root_candidates(
+                root_index, (*tokens_name, *tokens_pub), (cleaned_name, cleaned_pub)
+            )
+            for path, source, name_cf in root_entries:
                 confidence = ""
                 name_clean = _cleaned(name_cf)
                 exact_name = bool(cleaned_name) and name_clean == cleaned_name
@@ -211,81 +287,150 @@ class RelatedFileScanner:
         cleaned_pub = _cleaned(app.publisher)
         if not tokens_name and not tokens_pub and not cleaned_name and not cleaned_pub:
             return []
+        # _tokens() already leads with the cleaned full string, so dedupe the per-app query bundles once.
+        name_queries = tuple(dict.fromkeys(query for query in (*tokens_name, cleaned_name) if query))
+        pub_queries = tuple(dict.fromkeys(query for query in (*tokens_pub, cleaned_pub) if query))
         ignored_set = {_normalize_path(path) for path in (ignored or []) if path}
+        deadline = time.monotonic() + limits.max_seconds if limits.max_seconds else None
+        # Folder and file names repeat across roots (e.g. "Settings", "config.json"); score each once.
+        dir_scores: Dict[str, int] = {}
+        file_scores: Dict[str, int] = {}
+        roots = [root for root in roots if root and os.path.isdir(root)]
+
+        # Set once the merged caps are reached, so walkers of later roots stop listing directories.
+        stop = threading.Event()
+
+        def walk(root: str) -> List[Tuple[str, Optional[RelatedFile]]]:
+            return self._deep_scan_root(
+                root, name_queries, pub_queries, limits, ignored_set, deadline, stop, dir_scores, file_scores
+            )
+
+        # Drive roots are independent and the walk is mostly blocking I/O, so overlap them. All roots
+        # share the one deadline: a slow first drive no longer uses it up before the others start, so
+        # on slow drives later roots can contribute results a serial walk would have run out of time for.
+        if len(roots) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(roots), self.DEEP_SCAN_WORKERS)) as executor:
+                futures = [executor.submit(walk, root) for root in roots]
+                try:
+                    return self._merge_deep_scan((future.result() for future in futures), limits)
+                finally:
+                    stop.set()
+        return self._merge_deep_scan((walk(root) for root in roots), limits)
+
+    @staticmethod
+    def _merge_deep_scan(
+        per_root: Iterable[List[Tuple[str, Optional[RelatedFile]]]], limits: "DeepScanLimits"
+    ) -> List[RelatedFile]:
+        # Merge in root order with the same dedupe and caps a serial walk would apply; per_root is
+        # consumed lazily, so returning at a cap leaves later roots unwalked or lets them stop.
         results: List[RelatedFile] = []
         seen: set = set()
-        deadline = time.monotonic() + limits.max_seconds if limits.max_seconds else None
         max_dirs = limits.max_dirs
         max_files = limits.max_files
-        for root in roots:
-            if not root or not os.path.isdir(root):
-                continue
-            try:
-                root_norm = _normalize_path(root)
-            except OSError:
-                continue
-            root_depth = root_norm.count(os.sep)
-            for current, dirs, files in os.walk(root, topdown=True):
-                if deadline and time.monotonic() >= deadline:
-                    return results
-                try:
-                    current_norm = _normalize_path(current)
-                except OSError:
+        for found in per_root:
+            for norm, related in found:
+                if related is None:
+                    if len(results) >= max_files:
+                        return results
                     continue
-                if current_norm in ignored_set:
-                    dirs[:] = []
+                if norm in seen:
                     continue
-                depth = current_norm.count(os.sep) - root_depth
-                if depth >= limits.max_depth:
-                    dirs[:] = []
-                name_cf = _cleaned(os.path.basename(current))
-                score = _fuzzy_score(name_cf, cleaned_name, tokens_name, cleaned_pub, tokens_pub)
-                if score >= limits.dir_threshold:
-                    confidence = _confidence_from_score(score)
-                    if current_norm not in seen:
-                        seen.add(current_norm)
-                        results.append(
-                            RelatedFile(
-                                path=current,
-                                kind="dir",
-                                source="deep_scan",
-                                confidence=confidence,
-                                score=score,
-                            )
-                        )
-                        if len(results) >= max_dirs:
-                            return results
-                    for filename in files:
-                        if len(results) >= max_files:
-                            return results
-                        ext = os.path.splitext(filename)[1].lower()
-                        if ext not in CONFIG_EXTENSIONS and ext != ".exe":
-                            continue
-                        file_name = _cleaned(filename)
-                        fscore = _fuzzy_score(file_name, cleaned_name, tokens_name, cleaned_pub, tokens_pub)
-                        if fscore < limits.file_threshold:
-                            continue
-                        path = os.path.join(current, filename)
-                        try:
-                            norm = _normalize_path(path)
-                        except OSError:
-                            continue
-                        if norm in ignored_set or norm in seen:
-                            continue
-                        seen.add(norm)
-                        results.append(
-                            RelatedFile(
-                                path=path,
-                                kind="file",
-                                source="deep_scan",
-                                confidence=_confidence_from_score(fscore),
-                                score=fscore,
-                            )
-                        )
-            if deadline and time.monotonic() >= deadline:
-                break
+                seen.add(norm)
+                results.append(related)
+                if related.kind == "dir" and len(results) >= max_dirs:
+                    return results
         return results
 
+    def _deep_scan_root(
+        self,
+        root: str,
+        name_queries: Tuple[str, ...],
+        pub_queries: Tuple[str, ...],
+        limits: "DeepScanLimits",
+        ignored_set: Set[str],
+        deadline: Optional[float],
+        stop: threading.Event,
+        dir_scores: Dict[str, int],
+        file_scores: Dict[str, int],
+    ) -> List[Tuple[str, Optional[RelatedFile]]]:
+        # Entries of (norm, None) mark where the serial walk checked the file cap, so the merge
+        # in deep_scan_for_app stops at exactly the same point.
+        found: List[Tuple[str, Optional[RelatedFile]]] = []
+        count = 0
+        seen: set = set()
+        max_dirs = limits.max_dirs
+        max_files = limits.max_files
+        dir_threshold = limits.dir_threshold
+        file_threshold = limits.file_threshold
+        for current, current_norm, files in _walk_tree(root, limits.max_depth, ignored_set):
+            if stop.is_set() or (deadline and time.monotonic() >= deadline):
+                return found
+            # Caches are keyed by the raw name so repeats skip the regex clean-up as well as scoring.
+            dir_name = os.path.basename(current)
+            score = dir_scores.get(dir_name)
+            if score is None:
+                score = _fuzzy_score(_cleaned(dir_name), name_queries, pub_queries, dir_threshold)
+                dir_scores[dir_name] = score
+            if score < dir_threshold:
+                continue
+            if current_norm not in seen:
+                seen.add(current_norm)
+                found.append(
+                    (
+                        current_norm,
+                        RelatedFile(
+                            path=current,
+                            kind="dir",
+                            source="deep_scan",
+                            confidence=_confidence_from_score(score),
+                            score=score,
+                        ),
+                    )
+                )
+                count += 1
+                if count >= max_dirs:
+                    return found
+            # The count only moves on an add, so one marker per add is enough to replay the checks.
+            check_pending = True
+            for file_entry in files:
+                if count >= max_files:
+                    found.append(_CAP_CHECK)
+                    return found
+                if check_pending:
+                    found.append(_CAP_CHECK)
+                    check_pending = False
+                filename = file_entry.name
+                fscore = file_scores.get(filename)
+                if fscore is None:
+                    # Files outside the suffix list are cached as -1 so repeats cost one dict hit.
+                    if filename.lower().endswith(_DEEP_SCAN_SUFFIXES):
+                        fscore = _fuzzy_score(_cleaned(filename), name_queries, pub_queries, file_threshold)
+                    else:
+                        fscore = -1
+                    file_scores[filename] = fscore
+                if fscore < file_threshold:
+                    continue
+                path = file_entry.path
+                norm = _child_norm(current_norm, filename)
+                if norm in ignored_set or norm in seen:
+                    continue
+                seen.add(norm)
+                found.append(
+                    (
+                        norm,
+                        RelatedFile(
+                            path=path,
+                            kind="file",
+                            source="deep_scan",
+                            confidence=_confidence_from_score(fscore),
+                            score=fscore,
+                        ),
+                    )
+                )
+                count += 1
+                check_pending = True
+        return found
+
     def _score_related(self, path: str, source: str, confidence: str, is_file: bool) -> int:
         score = self._source_scores.get(source, 0) + self._confidence_scores.get(confidence, 0)
         if is_file:
@@ -293,9 +438,13 @@ class RelatedFileScanner:
         return score
 
     def _dedupe_related_files(self, apps: List[AppEntry]) -> None:
+        # Normalize each path once; the second pass reuses the same str objects, whose hashes
+        # Python has already cached, so a separate integer digest would buy nothing.
+        normalized: List[List[Tuple[str, RelatedFile]]] = []
+        app_keys = [app.key() for app in apps]
         best_by_path: Dict[str, Tuple[int, str]] = {}
-        for app in apps:
-            app_key = app.key()
+        for app, app_key in zip(apps, app_keys):
+            entries: List[Tuple[str, RelatedFile]] = []
             for related in app.related_files or []:
                 path = related.path or ""
                 if not path:
@@ -304,24 +453,20 @@ class RelatedFileScanner:
                     norm = _normalize_path(path)
                 except OSError:
                     norm = path.casefold()
+                entries.append((norm, related))
                 score = related.score or self._score_related(path, related.source, related.confidence, related.kind != "dir")
                 best = best_by_path.get(norm)
                 if best is None or score > best[0]:
                     best_by_path[norm] = (score, app_key)
+            normalized.append(entries)
         if not best_by_path:
             return
-        for app in apps:
-            app_key = app.key()
+        # A path can only be outranked by a strictly higher score, so ownership is settled after
+        # one accumulation pass; sorting all entries by score would cost more than these dict hits.
+        for app, app_key, entries in zip(apps, app_keys, normalized):
             kept: List[RelatedFile] = []
             seen: set = set()
-            for related in app.related_files or []:
-                path = related.path or ""
-                if not path:
-                    continue
-                try:
-                    norm = _normalize_path(path)
-                except OSError:
-                    norm = path.casefold()
+            for norm, related in entries:
                 best = best_by_path.get(norm)
                 if not best or best[1] != app_key:
                     continue
@@ -341,13 +486,22 @@ def _clean_path(path: str) -> str:
 
 
 def _normalize_path(path: str) -> str:
+    # Relative paths depend on the cwd, so only absolute ones go through the cache.
+    if os.path.isabs(path):
+        return _normalize_abs_path(path)
+    return os.path.normcase(os.path.abspath(path))
+
+
+# The same paths are normalized repeatedly across scan_for_app, dedupe and the config cache.
+@functools.lru_cache(maxsize=16384)
+def _normalize_abs_path(path: str) -> str:
     return os.path.normcase(os.path.abspath(path))
 
 
 def _tokens(text: str) -> List[str]:
     if not text:
         return []
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", " ", text).strip().casefold()
+    cleaned = _CLEAN_RE.sub(" ", text).strip().casefold()
     if not cleaned:
         return []
     tokens = [cleaned]
@@ -358,10 +512,12 @@ def _tokens(text: str) -> List[str]:
 def _cleaned(text: str) -> str:
     if not text:
         return ""
-    return re.sub(r"[^a-zA-Z0-9]+", " ", text).strip().casefold()
+    return _CLEAN_RE.sub(" ", text).strip().casefold()
 
 
-def _default_roots() -> Iterable[Tuple[str, str]]:
+# The profile folders are fixed for the life of the process; resolve them once.
+@functools.lru_cache(maxsize=1)
+def _default_roots() -> Tuple[Tuple[str, str], ...]:
     roots: List[Tuple[str, str]] = []
     env = os.environ
     appdata = env.get("APPDATA", "")
@@ -376,7 +532,7 @@ def _default_roots() -> Iterable[Tuple[str, str]]:
     roots.extend(_maybe_root(program_data, "programdata"))
     roots.extend(_maybe_root(os.path.join(userprofile, "Documents"), "documents"))
     roots.extend(_maybe_root(os.path.join(userprofile, "Saved Games"), "saved_games"))
-    return roots
+    return tuple(roots)
 
 
 def _maybe_root(path: str, source: str) -> List[Tuple[str, str]]:
@@ -385,30 +541,68 @@ def _maybe_root(path: str, source: str) -> List[Tuple[str, str]]:
     return []
 
 
-def _scan_config_files(root: str, max_depth: int, max_files: int) -> List[str]:
+def _walk_tree(
+    root: str, max_depth: int, ignored: Optional[Set[str]] = None
+) -> Iterator[Tuple[str, str, List[os.DirEntry]]]:
+    # Top-down, os.walk-ordered traversal on an explicit scandir stack; DirEntry carries the
+    # file type from the directory listing, so classifying entries needs no extra stat calls.
+    # Only the root goes through abspath; children extend their parent's normalized path.
+    # Depth counts separators below the root, as the os.walk version did, so a drive root
+    # ("C:\\") and its direct children share depth 0 and drive scans reach one level further.
     try:
         root_norm = _normalize_path(root)
     except OSError:
-        return []
-    root_depth = root_norm.count(os.sep)
-    results: List[str] = []
-    seen = set()
-    for current, dirs, files in os.walk(root, topdown=True):
+        return
+    stack: List[Tuple[str, str, int]] = [(root, root_norm, 0)]
+    while stack:
+        current, current_norm, depth = stack.pop()
+        if ignored and current_norm in ignored:
+            continue
+        files: List[os.DirEntry] = []
+        subdirs: List[Tuple[str, str, int]] = []
+        child_depth = depth if current_norm.endswith(os.sep) else depth + 1
         try:
-            current_norm = _normalize_path(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry)
+                        continue
+                    if depth >= max_depth:
+                        continue
+                    try:
+                        if entry.is_symlink():
+                            continue
+                    except OSError:
+                        continue
+                    subdirs.append((entry.path, _child_norm(current_norm, entry.name), child_depth))
         except OSError:
             continue
-        depth = current_norm.count(os.sep) - root_depth
-        if depth >= max_depth:
-            dirs[:] = []
-        for filename in files:
+        stack.extend(reversed(subdirs))
+        yield current, current_norm, files
+
+
+def _child_norm(parent_norm: str, name: str) -> str:
+    # Same result as _normalize_path(os.path.join(parent, name)) for a scandir child name.
+    if parent_norm.endswith(os.sep):
+        return parent_norm + os.path.normcase(name)
+    return parent_norm + os.sep + os.path.normcase(name)
+
+
+def _scan_config_files(root: str, max_depth: int, max_files: int) -> List[str]:
+    results: List[str] = []
+    seen = set()
+    for _current, current_norm, files in _walk_tree(root, max_depth):
+        for entry in files:
             if len(results) >= max_files:
                 return results
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in CONFIG_EXTENSIONS:
+            if not entry.name.lower().endswith(_CONFIG_SUFFIXES):
                 continue
-            path = os.path.join(current, filename)
-            norm = _normalize_path(path)
+            path = entry.path
+            norm = _child_norm(current_norm, entry.name)
             if norm in seen:
                 continue
             seen.add(norm)
@@ -434,30 +628,49 @@ class DeepScanLimits:
         self.file_threshold = file_threshold
 
 
+def _similarity(candidate: str, target: str, cutoff: float = 0.0) -> float:
+    # SequenceMatcher.ratio() is the one score the thresholds are tuned for. RapidFuzz's InDel ratio
+    # is an LCS ratio, never below it but often well above (0.72 vs 0.16 on scrambled names), so it
+    # only serves as a C-speed upper bound to reject pairs under cutoff, which come back as 0.0.
+    if cutoff and _fuzz_ratio is not None and not _fuzz_ratio(candidate, target, score_cutoff=cutoff * 100.0 - 1e-6):
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, candidate, target)
+    if cutoff and (matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff):
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= cutoff else 0.0
+
+
 def _fuzzy_score(
     candidate: str,
-    name_full: str,
-    name_tokens: List[str],
-    pub_full: str,
-    pub_tokens: List[str],
+    name_queries: Tuple[str, ...],
+    pub_queries: Tuple[str, ...],
+    threshold: int = 0,
 ) -> int:
+    # Scores below threshold may come back lower than their true value; callers only compare
+    # against that threshold. The epsilon keeps float rounding from dropping a boundary match.
     if not candidate:
         return 0
+    cutoff = max(0.0, threshold / 100.0 - 1e-9)
+    # Any ratio is at most 2 * min(len) / (len + len), so lengths alone rule many queries out
+    # before a scorer call is made.
+    size = len(candidate)
     best = 0.0
-    for token in name_tokens:
-        if not token:
+    for query in name_queries:
+        floor = max(cutoff, best)
+        if 2 * min(size, len(query)) < floor * (size + len(query)):
             continue
-        best = max(best, difflib.SequenceMatcher(None, candidate, token).ratio())
-    if name_full:
-        best = max(best, difflib.SequenceMatcher(None, candidate, name_full).ratio())
-    pub_best = 0.0
-    for token in pub_tokens:
-        if not token:
-            continue
-        pub_best = max(pub_best, difflib.SequenceMatcher(None, candidate, token).ratio())
-    if pub_full:
-        pub_best = max(pub_best, difflib.SequenceMatcher(None, candidate, pub_full).ratio())
-    if pub_best:
+        best = max(best, _similarity(candidate, query, floor))
+        if best >= 1.0:
+            return 100
+    pub_cutoff = max(0.0, max(cutoff, best) / 0.9 - 1e-9)
+    if pub_cutoff <= 1.0:
+        pub_best = 0.0
+        for query in pub_queries:
+            floor = max(pub_cutoff, pub_best)
+            if 2 * min(size, len(query)) < floor * (size + len(query)):
+                continue
+            pub_best = max(pub_best, _similarity(candidate, query, floor))
         best = max(best, pub_best * 0.9)
     return int(best * 100)
 
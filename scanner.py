@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import os
+import stat
+import sys
 import time
 from typing import Dict, List, Optional, Tuple
 
@@ -19,6 +22,10 @@ REG_PATHS = [
     (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_64KEY),
     (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_32KEY),
 ]
+# 32-bit views are read first so 64-bit duplicates simply overwrite them in the scan loop.
+_REG_SCAN_ORDER = sorted(REG_PATHS, key=lambda item: item[2] == winreg.KEY_WOW64_64KEY)
+# Junctions and symlinks both carry this attribute; neither is followed when sizing installs.
+_REPARSE_POINT = stat.FILE_ATTRIBUTE_REPARSE_POINT
 
 
 @dataclass(frozen=True)
@@ -63,41 +70,47 @@ class AppScanner:
 
     def scan(self, include_sizes: bool = False, size_limits: Optional[SizeScanLimits] = None) -> List[AppEntry]:
         raw_entries: Dict[Tuple[str, str], AppEntry] = {}
-        for hive, path, view in REG_PATHS:
-            # KEY_WOW64_* flags target the desired registry view without needing elevation.
-            access = winreg.KEY_READ | view
-            try:
-                base = winreg.OpenKey(hive, path, 0, access)
-            except OSError:
-                continue
-            with base:
-                for idx in range(self._subkey_count(base)):
-                    try:
-                        sub_name = winreg.EnumKey(base, idx)
-                        sub_key = winreg.OpenKey(base, sub_name)
-                    except OSError:
-                        continue
-                    with sub_key:
-                        app = self._read_entry(sub_key)
-                    if not app.name:
-                        continue
-                    key = (app.name, app.version)
-                    # Prefer 64-bit entries over 32-bit duplicates.
-                    is_64 = view == winreg.KEY_WOW64_64KEY
-                    if key in raw_entries:
-                        existing = raw_entries[key]
-                        existing_is_64 = getattr(existing, "_64bit", False)
-                        if existing_is_64 and not is_64:
-                            continue
-                    setattr(app, "_64bit", is_64)
-                    raw_entries[key] = app
+        # Registry calls release the GIL, so the four views are read concurrently and merged in order.
+        with ThreadPoolExecutor(max_workers=len(_REG_SCAN_ORDER)) as executor:
+            per_view = list(executor.map(lambda reg_path: self._read_hive(*reg_path), _REG_SCAN_ORDER))
+        for apps in per_view:
+            for app in apps:
+                # Later reads win, which prefers 64-bit entries over 32-bit duplicates.
+                raw_entries[(app.name, app.version)] = app
         if include_sizes:
+            # Several uninstall entries often share one install folder; walk each folder once.
+            sizes: Dict[str, Optional[int]] = {}
             for entry in raw_entries.values():
-                if entry.size_mb is None:
-                    entry.size_mb = self._compute_install_size_mb(entry.install_location, size_limits)
+                if entry.size_mb is not None:
+                    continue
+                location_key = os.path.normcase(entry.install_location)
+                if location_key not in sizes:
+                    sizes[location_key] = self._compute_install_size_mb(entry.install_location, size_limits)
+                entry.size_mb = sizes[location_key]
         self.apps = sorted(raw_entries.values(), key=lambda x: (x.name or "").lower())
         return self.apps
 
+    def _read_hive(self, hive, path: str, view: int) -> List[AppEntry]:
+        apps: List[AppEntry] = []
+        # KEY_WOW64_* flags target the desired registry view without needing elevation.
+        access = winreg.KEY_READ | view
+        try:
+            base = winreg.OpenKey(hive, path, 0, access)
+        except OSError:
+            return apps
+        with base:
+            for idx in range(self._subkey_count(base)):
+                try:
+                    sub_name = winreg.EnumKey(base, idx)
+                    sub_key = winreg.OpenKey(base, sub_name)
+                except OSError:
+                    continue
+                with sub_key:
+                    app = self._read_entry(sub_key)
+                if app.name:
+                    apps.append(app)
+        return apps
+
     @staticmethod
     def _subkey_count(key) -> int:
         try:
@@ -108,36 +121,50 @@ class AppScanner:
 
     def _read_entry(self, handle) -> AppEntry:
         entry = AppEntry(name="")
+        values = self._read_values(handle)
         raw_values: Dict[str, str] = {}
         for value_name, target in self.VALUE_MAP.items():
-            try:
-                value, _ = winreg.QueryValueEx(handle, value_name)
-            except OSError:
+            key = value_name.lower()
+            if key not in values:
                 continue
+            value = values[key]
             if value_name == "InstallDate":
-                setattr(entry, target, normalize_date(str(value)))
+                setattr(entry, target, sys.intern(normalize_date(str(value))))
             elif value_name == "EstimatedSize":
                 entry.size_mb = normalize_registry_size(value)
             else:
-                setattr(entry, target, str(value))
+                setattr(entry, target, sys.intern(str(value)))
             if value_name == "InstallLocation":
                 raw_values[value_name] = str(value)
         for value_name in self.FALLBACK_LOCATION_KEYS:
-            try:
-                value, _ = winreg.QueryValueEx(handle, value_name)
-            except OSError:
-                continue
-            raw_values[value_name] = str(value)
-        for key in self.WEBSITE_KEYS:
+            key = value_name.lower()
+            if key in values:
+                raw_values[value_name] = str(values[key])
+        for value_name in self.WEBSITE_KEYS:
             if entry.website:
                 break
+            key = value_name.lower()
+            if key in values:
+                entry.website = str(values[key]).strip()
+        entry.install_location = self._resolve_install_location(entry.install_location, raw_values)
+        return entry
+
+    @staticmethod
+    def _read_values(handle) -> Dict[str, object]:
+        # One EnumValue pass per subkey instead of a QueryValueEx per wanted name (most of which miss).
+        # Registry value names are case-insensitive, so key the result by the lowered name.
+        values: Dict[str, object] = {}
+        try:
+            count = winreg.QueryInfoKey(handle)[1]
+        except OSError:
+            return values
+        for idx in range(count):
             try:
-                value, _ = winreg.QueryValueEx(handle, key)
+                name, value, _ = winreg.EnumValue(handle, idx)
             except OSError:
                 continue
-            entry.website = str(value).strip()
-        entry.install_location = self._resolve_install_location(entry.install_location, raw_values)
-        return entry
+            values.setdefault(name.lower(), value)
+        return values
 
     def compute_install_size_mb(self, raw_path: str, limits: Optional[SizeScanLimits] = None) -> Optional[int]:
         return self._compute_install_size_mb(raw_path, limits)
@@ -234,9 +261,8 @@ class AppScanner:
         if not candidate:
             return ""
         name = os.path.basename(candidate)
-        if name.casefold() in cls.BLOCKED_EXE_NAMES:
-            return ""
-        if not name.casefold().endswith(".exe"):
+        name_cf = name.casefold()
+        if name_cf in cls.BLOCKED_EXE_NAMES or not name_cf.endswith(".exe"):
             return ""
         return name
 
@@ -286,9 +312,17 @@ class AppScanner:
                 with os.scandir(current) as entries:
                     for entry in entries:
                         try:
-                            if entry.is_symlink():
+                            # On Windows the lstat result comes from the directory listing itself, so
+                            # type, reparse flag and size are all read from one cached struct.
+                            info = entry.stat(follow_symlinks=False)
+                            mode = info.st_mode
+                            if stat.S_ISLNK(mode):
                                 continue
-                            if entry.is_dir(follow_symlinks=False):
+                            if stat.S_ISDIR(mode):
+                                # Junctions and mount points loop or double-count; reparse-point files
+                                # (cloud placeholders, dedup, app links) still count toward the size.
+                                if getattr(info, "st_file_attributes", 0) & _REPARSE_POINT:
+                                    continue
                                 child_depth = depth + 1
                                 if max_depth is not None and child_depth > max_depth:
                                     continue
@@ -297,7 +331,7 @@ class AppScanner:
                                 if max_files is not None and file_count >= max_files:
                                     return None
                                 file_count += 1
-                                total += entry.stat(follow_symlinks=False).st_size
+                                total += info.st_size
                         except OSError:
                             continue
             except OSError:
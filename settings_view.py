@@ -1,7 +1,10 @@
+from functools import partial
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import colorchooser, ttk
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from utils import noop
 
 # DEFAULT UI VALUES (first-run / app start)
 # To change the *default* colors, fonts, and sizes the app starts with,
@@ -14,20 +17,43 @@ from typing import Callable, Dict, List, Optional
 # - "map_drive_outline", "map_node_outline", "map_unknown_group", "map_highlight"
 # - "map_max_related", "deep_scan"
 
+# Extra top padding that opens each GUI tab section (stands in for separator widgets).
+_SECTION_PAD = (20, 4)
+
 
 class SettingsView:
+    # Sorted system font list; Tk's font enumeration is slow, so it is read once per process.
+    _font_families_cache: Optional[List[str]] = None
+    # One 12x12 swatch per color string, shared by every group row and window.
+    _swatch_cache: Dict[str, tk.PhotoImage] = {}
+    # Set once the Settings.TNotebook styles exist in the Tk style database.
+    _styles_configured = False
+
     def __init__(self, root: tk.Tk, callbacks: dict) -> None:
         self.root = root
         self.callbacks = callbacks
         self.window: Optional[tk.Toplevel] = None
-        self.settings_vars: Dict[str, tk.StringVar] = {}
-        self.groups_list: Optional[tk.Listbox] = None
+        # Plain entry widgets read on Apply; only the deep-scan Checkbutton needs a Tk variable.
+        self.settings_widgets: Dict[str, ttk.Entry] = {}
+        self.deep_scan_var: Optional[tk.BooleanVar] = None
+        self.groups_list: Optional[ttk.Treeview] = None
         self.group_name_var: Optional[tk.StringVar] = None
         self.group_color_var: Optional[tk.StringVar] = None
         self.group_colors: Dict[str, str] = {}
+        # Tk variables survive close/reopen; the public attributes above are reset to None on destroy().
+        self._tk_vars: Dict[str, tk.Variable] = {}
+        self._group_select_job: Optional[str] = None
         self.drive_vars: Dict[str, tk.BooleanVar] = {}
         self.drive_order: List[str] = []
         self.drive_container: Optional[ttk.Frame] = None
+        self.drive_widgets: Dict[str, ttk.Checkbutton] = {}
+        # Checked drives in drive_order; cleared by a write trace on each drive's BooleanVar.
+        self._selected_drives_cache: Optional[List[str]] = None
+        self.drive_empty_label: Optional[ttk.Label] = None
+        self._tab_builders: Dict[str, Callable[[], None]] = {}
+        self._pending_drives: Tuple[List[str], List[str]] = ([], [])
+        self._pending_groups: List[str] = []
+        self._last_groups_sig: Optional[Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]] = None
 
     def show(
         self,
@@ -47,6 +73,8 @@ class SettingsView:
         self.group_colors = dict(group_colors)
 
         win = tk.Toplevel(self.root)
+        # Build hidden so the window maps once, after a single layout pass.
+        win.withdraw()
         win.title("Settings")
         win.transient(self.root)
         win.resizable(False, False)
@@ -57,25 +85,26 @@ class SettingsView:
         container.grid(row=0, column=0, sticky="nsew")
         container.columnconfigure(0, weight=1)
         container.rowconfigure(0, weight=1)
-
-        style = ttk.Style(win)
-        style.configure("Settings.TNotebook", borderwidth=2, relief="ridge", tabmargins=(2, 2, 2, 0))
-        style.configure("Settings.TNotebook.Tab", padding=(12, 6), borderwidth=2)
-        style.map(
-            "Settings.TNotebook.Tab",
-            relief=[("selected", "ridge"), ("!selected", "groove")],
-            background=[("selected", "#e6e6e6"), ("!selected", "#d0d0d0")],
-        )
+        # Children don't resize the container while it is being filled; propagation is restored below.
+        container.grid_propagate(False)
+
+        if not SettingsView._styles_configured:
+            # Styles are global Tk state; configure them once per process, not per open.
+            style = ttk.Style(win)
+            style.configure("Settings.TNotebook", borderwidth=2, relief="ridge", tabmargins=(2, 2, 2, 0))
+            style.configure("Settings.TNotebook.Tab", padding=(12, 6), borderwidth=2)
+            style.map(
+                "Settings.TNotebook.Tab",
+                relief=[("selected", "ridge"), ("!selected", "groove")],
+                background=[("selected", "#e6e6e6"), ("!selected", "#d0d0d0")],
+            )
+            SettingsView._styles_configured = True
 
         notebook = ttk.Notebook(container, style="Settings.TNotebook")
         notebook.grid(row=0, column=0, sticky="nsew")
 
-        gui_tab = ttk.Frame(notebook, padding=6)
-        notebook.add(gui_tab, text="GUI Customization")
-        gui_tab.columnconfigure(0, weight=1)
-
-        gui_frame = ttk.Labelframe(gui_tab, text="GUI Customization", padding=10)
-        gui_frame.grid(row=0, column=0, sticky="nsew")
+        gui_frame = ttk.Frame(notebook, padding=12)
+        notebook.add(gui_frame, text="GUI Customization")
         gui_frame.columnconfigure(1, weight=1)
 
         color_fields = [
@@ -98,87 +127,78 @@ class SettingsView:
             ("Map highlight", "map_highlight"),
         ]
 
-        self.settings_vars = {
-            "font_family": tk.StringVar(value=str(gui_settings.get("font_family", ""))),
-            "font_size": tk.StringVar(value=str(gui_settings.get("font_size", ""))),
-            "deep_scan": tk.BooleanVar(value=bool(gui_settings.get("deep_scan", False))),
-        }
-        for _, key in color_fields:
-            self.settings_vars[key] = tk.StringVar(value=str(gui_settings.get(key, "")))
-        for _, key in map_fields:
-            self.settings_vars[key] = tk.StringVar(value=str(gui_settings.get(key, "")))
-        self.settings_vars["map_max_related"] = tk.StringVar(value=str(gui_settings.get("map_max_related", "")))
+        self.settings_widgets = {}
+        self.deep_scan_var = self._reuse_var("deep_scan", tk.BooleanVar)
+        self.deep_scan_var.set(bool(gui_settings.get("deep_scan", False)))
 
         row = 0
-        for label, key in color_fields:
-            ttk.Label(gui_frame, text=label).grid(row=row, column=0, sticky="w", pady=4)
-            ttk.Entry(gui_frame, textvariable=self.settings_vars[key], width=16).grid(row=row, column=1, sticky="w")
-            ttk.Button(
-                gui_frame,
-                text="Pick",
-                command=lambda v=self.settings_vars[key]: self._pick_color(win, v),
-            ).grid(row=row, column=2, padx=(6, 0))
+        # None marks the break between the general colors and the System Map colors.
+        for field in color_fields + [None] + map_fields:
+            if field is None:
+                ttk.Label(gui_frame, text="System Map").grid(row=row, column=0, sticky="w", pady=_SECTION_PAD)
+                row += 1
+                continue
+            label, key = field
+            self._color_row(gui_frame, row, label, key, str(gui_settings.get(key, "")), win)
             row += 1
 
-        ttk.Separator(gui_frame, orient=tk.HORIZONTAL).grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-        row += 1
-        ttk.Label(gui_frame, text="System Map").grid(row=row, column=0, sticky="w", pady=(0, 6))
-        row += 1
-
-        for label, key in map_fields:
-            ttk.Label(gui_frame, text=label).grid(row=row, column=0, sticky="w", pady=4)
-            ttk.Entry(gui_frame, textvariable=self.settings_vars[key], width=16).grid(row=row, column=1, sticky="w")
-            ttk.Button(
-                gui_frame,
-                text="Pick",
-                command=lambda v=self.settings_vars[key]: self._pick_color(win, v),
-            ).grid(row=row, column=2, padx=(6, 0))
-            row += 1
-
-        ttk.Separator(gui_frame, orient=tk.HORIZONTAL).grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
-        row += 1
-        ttk.Label(gui_frame, text="Map max related").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Spinbox(
-            gui_frame,
-            from_=0,
-            to=50,
-            textvariable=self.settings_vars["map_max_related"],
-            width=8,
-        ).grid(row=row, column=1, sticky="w")
-        row += 1
-
-        ttk.Separator(gui_frame, orient=tk.HORIZONTAL).grid(row=row, column=0, columnspan=3, sticky="ew", pady=8)
+        ttk.Label(gui_frame, text="Map max related").grid(row=row, column=0, sticky="w", pady=_SECTION_PAD)
+        map_max_box = ttk.Spinbox(gui_frame, from_=0, to=50, width=8)
+        map_max_box.grid(row=row, column=1, sticky="w", pady=_SECTION_PAD)
+        self.settings_widgets["map_max_related"] = map_max_box
         row += 1
 
-        ttk.Label(gui_frame, text="Font family").grid(row=row, column=0, sticky="w", pady=4)
-        fonts = sorted(tkfont.families())
-        ttk.Combobox(
-            gui_frame,
-            textvariable=self.settings_vars["font_family"],
-            values=fonts,
-            width=22,
-            state="readonly",
-        ).grid(row=row, column=1, columnspan=2, sticky="w")
+        ttk.Label(gui_frame, text="Font family").grid(row=row, column=0, sticky="w", pady=_SECTION_PAD)
+        fonts = SettingsView.font_families(self.root)
+        font_box = ttk.Combobox(gui_frame, values=fonts, width=22, state="readonly")
+        font_box.grid(row=row, column=1, columnspan=2, sticky="w", pady=_SECTION_PAD)
+        self.settings_widgets["font_family"] = font_box
         row += 1
 
         ttk.Label(gui_frame, text="Font size").grid(row=row, column=0, sticky="w", pady=4)
-        ttk.Spinbox(
-            gui_frame,
-            from_=6,
-            to=72,
-            textvariable=self.settings_vars["font_size"],
-            width=8,
-        ).grid(row=row, column=1, sticky="w")
+        font_size_box = ttk.Spinbox(gui_frame, from_=6, to=72, width=8)
+        font_size_box.grid(row=row, column=1, sticky="w")
+        self.settings_widgets["font_size"] = font_size_box
+        for key in ("map_max_related", "font_family", "font_size"):
+            self._set_entry(self.settings_widgets[key], str(gui_settings.get(key, "")))
 
         scan_tab = ttk.Frame(notebook, padding=6)
         notebook.add(scan_tab, text="Scan Options")
+        groups_tab = ttk.Frame(notebook, padding=6)
+        notebook.add(groups_tab, text="Groups")
+        # Scan Options and Groups are only built the first time their tab is selected.
+        self.drive_container = None
+        self.groups_list = None
+        self.group_name_var = None
+        self.group_color_var = None
+        self._tab_builders = {
+            str(scan_tab): partial(self._build_scan_tab, scan_tab),
+            str(groups_tab): partial(self._build_groups_tab, groups_tab, win),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.set_drive_options(drives, selected_drives)
+        self.refresh_groups(groups, group_colors)
+
+        actions = ttk.Frame(container)
+        actions.grid(row=1, column=0, sticky="e", pady=(10, 0))
+        ttk.Button(actions, text="Restore Defaults", command=self._dispatch("on_restore_defaults")).grid(
+            row=0, column=0, padx=(0, 6)
+        )
+        ttk.Button(actions, text="Apply", command=self._dispatch("on_apply")).grid(row=0, column=1, padx=(0, 6))
+        ttk.Button(actions, text="Close", command=self._dispatch("on_close")).grid(row=0, column=2)
+
+        container.grid_propagate(True)
+        win.update_idletasks()
+        win.deiconify()
+
+    def _build_scan_tab(self, scan_tab: ttk.Frame) -> None:
         scan_tab.columnconfigure(0, weight=1)
 
         ttk.Label(scan_tab, text="Related file scanning is on-demand.").grid(row=0, column=0, sticky="w", pady=(0, 6))
         ttk.Checkbutton(
             scan_tab,
             text="Deep scan related files (AppData, ProgramData, Documents)",
-            variable=self.settings_vars["deep_scan"],
+            variable=self.deep_scan_var,
         ).grid(row=1, column=0, sticky="w")
 
         drive_frame = ttk.Labelframe(scan_tab, text="Drives to include", padding=6)
@@ -186,10 +206,15 @@ class SettingsView:
         drive_frame.columnconfigure(0, weight=1)
         self.drive_container = ttk.Frame(drive_frame)
         self.drive_container.grid(row=0, column=0, sticky="ew")
+        self.drive_vars = {}
+        self.drive_widgets = {}
+        self.drive_order = []
+        self._selected_drives_cache = None
+        self.drive_empty_label = None
+        drives, selected_drives = self._pending_drives
         self.set_drive_options(drives, selected_drives)
 
-        groups_tab = ttk.Frame(notebook, padding=6)
-        notebook.add(groups_tab, text="Groups")
+    def _build_groups_tab(self, groups_tab: ttk.Frame, win: tk.Toplevel) -> None:
         groups_tab.columnconfigure(0, weight=1)
         groups_tab.rowconfigure(1, weight=1)
 
@@ -202,7 +227,7 @@ class SettingsView:
         list_frame.rowconfigure(0, weight=1)
         list_frame.columnconfigure(0, weight=1)
 
-        self.groups_list = tk.Listbox(list_frame, height=8, exportselection=False)
+        self.groups_list = ttk.Treeview(list_frame, show="tree", height=8, selectmode="browse")
         groups_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.groups_list.yview)
         self.groups_list.configure(yscrollcommand=groups_scroll.set)
         self.groups_list.grid(row=0, column=0, sticky="nsew")
@@ -213,7 +238,8 @@ class SettingsView:
         edit_frame.columnconfigure(1, weight=1)
 
         ttk.Label(edit_frame, text="Group name").grid(row=0, column=0, sticky="w", padx=(0, 6))
-        self.group_name_var = tk.StringVar()
+        self.group_name_var = self._reuse_var("group_name", tk.StringVar)
+        self.group_name_var.set("")
         ttk.Entry(edit_frame, textvariable=self.group_name_var, width=24).grid(row=0, column=1, sticky="w")
 
         buttons_frame = ttk.Frame(edit_frame)
@@ -223,14 +249,15 @@ class SettingsView:
         ttk.Button(buttons_frame, text="Delete", command=self._dispatch("on_delete_group")).grid(row=0, column=2)
 
         ttk.Label(edit_frame, text="Group color").grid(row=1, column=0, sticky="w", padx=(0, 6), pady=(8, 0))
-        self.group_color_var = tk.StringVar()
+        self.group_color_var = self._reuse_var("group_color", tk.StringVar)
+        self.group_color_var.set("")
         ttk.Entry(edit_frame, textvariable=self.group_color_var, width=12).grid(row=1, column=1, sticky="w", pady=(8, 0))
         color_buttons = ttk.Frame(edit_frame)
         color_buttons.grid(row=1, column=2, sticky="w", padx=(8, 0), pady=(8, 0))
         ttk.Button(
             color_buttons,
             text="Pick",
-            command=lambda v=self.group_color_var: self._pick_color(win, v),
+            command=partial(self._pick_color, win, self.group_color_var),
         ).grid(row=0, column=0, padx=(0, 6))
         ttk.Button(
             color_buttons,
@@ -238,61 +265,144 @@ class SettingsView:
             command=self._dispatch("on_set_group_color"),
         ).grid(row=0, column=1)
 
-        self.groups_list.bind("<<ListboxSelect>>", self._on_group_select)
-        self.refresh_groups(groups, group_colors)
+        self.groups_list.bind("<<TreeviewSelect>>", self._on_group_select)
+        self._last_groups_sig = None
+        self.refresh_groups(self._pending_groups)
+
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        builder = self._tab_builders.pop(str(event.widget.select()), None)
+        if builder is not None:
+            builder()
+
+    def _reuse_var(self, name: str, factory: Callable[..., tk.Variable]) -> tk.Variable:
+        var = self._tk_vars.get(name)
+        if var is None:
+            var = self._tk_vars[name] = factory(master=self.root)
+        return var
+
+    def _color_row(self, parent: ttk.Frame, row: int, label: str, key: str, value: str, win: tk.Toplevel) -> None:
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", pady=4)
+        entry = ttk.Entry(parent, width=16)
+        entry.insert(0, value)
+        entry.grid(row=row, column=1, sticky="w")
+        self.settings_widgets[key] = entry
+        ttk.Button(parent, text="Pick", command=partial(self._pick_color, win, entry)).grid(row=row, column=2, padx=(6, 0))
+
+    @staticmethod
+    def _set_entry(widget: ttk.Entry, value: str) -> None:
+        if widget.get() == value:
+            # Restore Defaults re-pushes every field; leave unchanged ones alone.
+            return
+        if isinstance(widget, ttk.Combobox):
+            # Readonly comboboxes ignore insert/delete; set() still works.
+            widget.set(value)
+            return
+        widget.delete(0, tk.END)
+        widget.insert(0, value)
 
-        actions = ttk.Frame(container)
-        actions.grid(row=1, column=0, sticky="e", pady=(10, 0))
-        ttk.Button(actions, text="Restore Defaults", command=self._dispatch("on_restore_defaults")).grid(
-            row=0, column=0, padx=(0, 6)
-        )
-        ttk.Button(actions, text="Apply", command=self._dispatch("on_apply")).grid(row=0, column=1, padx=(0, 6))
-        ttk.Button(actions, text="Close", command=self._dispatch("on_close")).grid(row=0, column=2)
+    def _swatch(self, color: str) -> Union[tk.PhotoImage, str]:
+        if not color:
+            return ""
+        image = SettingsView._swatch_cache.get(color)
+        if image is None:
+            image = tk.PhotoImage(master=self.root, width=12, height=12)
+            try:
+                image.put(color, to=(0, 0, 12, 12))
+            except tk.TclError:
+                return ""
+            SettingsView._swatch_cache[color] = image
+        return image
+
+    @staticmethod
+    def font_families(root: tk.Misc) -> List[str]:
+        if SettingsView._font_families_cache is None:
+            SettingsView._font_families_cache = sorted(tkfont.families(root))
+        return SettingsView._font_families_cache
 
     def set_settings(self, gui_settings: Dict[str, object]) -> None:
-        if not self.settings_vars:
+        if not self.settings_widgets:
             return
-        for key, var in self.settings_vars.items():
+        for key, widget in self.settings_widgets.items():
             if key in gui_settings:
-                value = gui_settings.get(key, "")
-                if isinstance(var, tk.BooleanVar):
-                    var.set(bool(value))
-                else:
-                    var.set(str(value))
+                self._set_entry(widget, str(gui_settings.get(key, "")))
+        if self.deep_scan_var is not None and "deep_scan" in gui_settings:
+            self.deep_scan_var.set(bool(gui_settings.get("deep_scan")))
 
     def _dispatch(self, name: str) -> Callable:
-        return self.callbacks.get(name, lambda *args, **kwargs: None)
+        return self.callbacks.get(name, noop)
 
-    def _pick_color(self, parent: tk.Toplevel, target: tk.StringVar) -> None:
+    def _pick_color(self, parent: tk.Toplevel, target: Union[tk.StringVar, ttk.Entry]) -> None:
         color = colorchooser.askcolor(initialcolor=target.get(), parent=parent)
         if color and color[1]:
-            target.set(color[1])
+            if isinstance(target, tk.StringVar):
+                target.set(color[1])
+            else:
+                self._set_entry(target, color[1])
 
     def refresh_groups(self, groups: List[str], group_colors: Optional[Dict[str, str]] = None) -> None:
         if group_colors is not None:
             self.group_colors = dict(group_colors)
         if not self.groups_list:
+            self._pending_groups = list(groups)
+            return
+        groups = list(groups)
+        signature = (tuple(groups), tuple(sorted(self.group_colors.items())))
+        if signature == self._last_groups_sig:
             return
-        self.groups_list.delete(0, tk.END)
-        for name in groups:
-            self.groups_list.insert(tk.END, name)
+        self._last_groups_sig = signature
+        tree = self.groups_list
+        # Unchanged lists keep their rows (and selection); color-only edits just swap swatches.
+        current = tree.get_children("")
+        if list(current) != groups:
+            if current:
+                tree.delete(*current)
+            for name in groups:
+                tree.insert("", "end", iid=name, text=name, image=self._swatch(self.group_colors.get(name, "")))
+        else:
+            for name in groups:
+                tree.item(name, image=self._swatch(self.group_colors.get(name, "")))
         self._sync_group_color()
 
     def set_drive_options(self, drives: List[str], selected_drives: List[str]) -> None:
         if not self.drive_container:
+            self._pending_drives = (list(drives), list(selected_drives))
             return
-        self.drive_vars = {}
-        self.drive_order = list(drives)
+        drives = list(drives)
         selected = {drive for drive in selected_drives}
-        for child in self.drive_container.winfo_children():
-            child.destroy()
+        # Compared against what the checkboxes show now, so unapplied toggles are still reset.
+        if drives and drives == self.drive_order and selected.intersection(drives) == set(self.get_selected_drives()):
+            return
+        # Keep existing checkbuttons; only the drives that came or went create or destroy widgets.
+        current = set(drives)
+        self._selected_drives_cache = None
+        for drive in [drive for drive in self.drive_widgets if drive not in current]:
+            self.drive_widgets.pop(drive).destroy()
+            self.drive_vars.pop(drive, None)
         if not drives:
-            ttk.Label(self.drive_container, text="No drives detected.").grid(row=0, column=0, sticky="w")
+            self.drive_order = []
+            if self.drive_empty_label is None:
+                self.drive_empty_label = ttk.Label(self.drive_container, text="No drives detected.")
+                self.drive_empty_label.grid(row=0, column=0, sticky="w")
             return
+        if self.drive_empty_label is not None:
+            self.drive_empty_label.destroy()
+            self.drive_empty_label = None
+        reflow = drives != self.drive_order
+        self.drive_order = drives
         for idx, drive in enumerate(drives):
-            var = tk.BooleanVar(value=drive in selected)
-            self.drive_vars[drive] = var
-            ttk.Checkbutton(self.drive_container, text=drive, variable=var).grid(
+            var = self.drive_vars.get(drive)
+            widget = self.drive_widgets.get(drive)
+            if var is None or widget is None:
+                var = tk.BooleanVar(value=drive in selected)
+                self.drive_vars[drive] = var
+                var.trace_add("write", self._mark_drives_dirty)
+                widget = ttk.Checkbutton(self.drive_container, text=drive, variable=var)
+                self.drive_widgets[drive] = widget
+            else:
+                var.set(drive in selected)
+                if not reflow:
+                    continue
+            widget.grid(
                 row=idx // 6,
                 column=idx % 6,
                 sticky="w",
@@ -301,14 +411,23 @@ class SettingsView:
             )
 
     def get_selected_drives(self) -> List[str]:
+        if not self.drive_container:
+            drives, selected_drives = self._pending_drives
+            selected = set(selected_drives)
+            return [drive for drive in drives if drive in selected]
         if not self.drive_vars:
             return []
-        selected: List[str] = []
-        for drive in self.drive_order:
-            var = self.drive_vars.get(drive)
-            if var and var.get():
-                selected.append(drive)
-        return selected
+        if self._selected_drives_cache is None:
+            selected: List[str] = []
+            for drive in self.drive_order:
+                var = self.drive_vars.get(drive)
+                if var and var.get():
+                    selected.append(drive)
+            self._selected_drives_cache = selected
+        return list(self._selected_drives_cache)
+
+    def _mark_drives_dirty(self, *_args) -> None:
+        self._selected_drives_cache = None
 
     def get_group_name(self) -> str:
         return self.group_name_var.get().strip() if self.group_name_var else ""
@@ -316,16 +435,18 @@ class SettingsView:
     def get_selected_group(self) -> str:
         if not self.groups_list:
             return ""
-        selection = self.groups_list.curselection()
-        if not selection:
-            return ""
-        return self.groups_list.get(selection[0])
+        selection = self.groups_list.selection()
+        return selection[0] if selection else ""
 
     def select_group_index(self, index: int) -> None:
         if not self.groups_list:
             return
-        self.groups_list.selection_clear(0, tk.END)
-        self.groups_list.selection_set(index)
+        children = self.groups_list.get_children("")
+        if 0 <= index < len(children):
+            self.groups_list.selection_set(children[index])
+            self.groups_list.see(children[index])
+        else:
+            self.groups_list.selection_remove(self.groups_list.selection())
 
     def set_group_name(self, name: str) -> None:
         if self.group_name_var:
@@ -336,19 +457,24 @@ class SettingsView:
             self.group_name_var.set("")
 
     def _on_group_select(self, _event=None) -> None:
+        # Held arrow keys fire a select per row; only the last selection is applied.
+        if self._group_select_job is None:
+            self._group_select_job = self.root.after_idle(self._apply_group_select)
+
+    def _apply_group_select(self) -> None:
+        self._group_select_job = None
         if not self.groups_list or not self.group_name_var:
             return
-        selection = self.groups_list.curselection()
-        if not selection:
+        name = self.get_selected_group()
+        if not name:
             return
-        name = self.groups_list.get(selection[0])
         self.group_name_var.set(name)
-        self._sync_group_color()
+        self._sync_group_color(name)
 
-    def _sync_group_color(self) -> None:
+    def _sync_group_color(self, name: Optional[str] = None) -> None:
         if not self.group_color_var:
             return
-        selected = self.get_selected_group()
+        selected = self.get_selected_group() if name is None else name
         if not selected:
             self.group_color_var.set("")
             return
@@ -358,18 +484,32 @@ class SettingsView:
     def get_group_color(self) -> str:
         return self.group_color_var.get().strip() if self.group_color_var else ""
 
-    def get_settings(self) -> Dict[str, str]:
-        return {key: var.get() for key, var in self.settings_vars.items()}
+    def get_settings(self) -> Dict[str, object]:
+        settings: Dict[str, object] = {key: widget.get() for key, widget in self.settings_widgets.items()}
+        if self.deep_scan_var is not None:
+            settings["deep_scan"] = self.deep_scan_var.get()
+        return settings
 
     def destroy(self) -> None:
+        if self._group_select_job is not None:
+            self.root.after_cancel(self._group_select_job)
+            self._group_select_job = None
         if self.window and self.window.winfo_exists():
             self.window.destroy()
         self.window = None
-        self.settings_vars = {}
+        self.settings_widgets = {}
+        self.deep_scan_var = None
         self.groups_list = None
         self.group_name_var = None
         self.group_color_var = None
         self.group_colors = {}
         self.drive_vars = {}
         self.drive_order = []
+        self._selected_drives_cache = None
         self.drive_container = None
+        self.drive_widgets = {}
+        self.drive_empty_label = None
+        self._tab_builders = {}
+        self._pending_drives = ([], [])
+        self._pending_groups = []
+        self._last_groups_sig = None
@@ -1,15 +1,44 @@
+import functools
 import json
 import os
 import shutil
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 from utils import unique_casefold
 
 APP_NAME = "ARC"
 ENV_DATA_DIR = "ARC_DATA_DIR"
+# Set to any non-empty value to indent saved JSON for hand inspection.
+ENV_PRETTY_JSON = "ARC_PRETTY_JSON"
 CONFIG_FILENAME = "arc_poc_config.json"
 CONFIG_KEY = "data_dir"
+# State files at least this large are streamed key by key when ijson is available.
+STREAM_STATE_MIN_BYTES = 1024 * 1024
+# With msgpack installed, size_cache lives in "<state stem>" + this suffix instead of the JSON file.
+SIZE_CACHE_SIDECAR_SUFFIX = ".size_cache.msgpack"
+
+# Older builds kept state next to the source; resolved once at import.
+_LEGACY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (hash, st_mtime_ns, st_size) of the bytes this process last wrote to each path, so unchanged
+# saves can be skipped while files changed by another instance, an import or by hand are rewritten.
+_last_written: Dict[str, Tuple[int, int, int]] = {}
+
+# Parsed app config; _save_config() refreshes it so a data-dir change costs one write, not a re-read.
+_config_items: Optional[Tuple[Tuple[str, str], ...]] = None
 
 
 @dataclass
@@ -32,6 +61,66 @@ class StoredState:
     install_date_overrides: Dict[str, str] = field(default_factory=dict)
 
 
+def _read_json(path: str) -> object:
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Escaped lone surrogates from the stdlib fallback below; let json decide.
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def _write_json(path: str, payload: object) -> None:
+    pretty = bool(os.getenv(ENV_PRETTY_JSON))
+    data: Optional[bytes] = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else None)
+        except TypeError:
+            # orjson rejects some strings (e.g. lone surrogates) the stdlib encoder escapes.
+            data = None
+    if data is None:
+        if pretty:
+            text = json.dumps(payload, indent=2)
+        else:
+            text = json.dumps(payload, separators=(",", ":"))
+        data = text.encode("utf-8")
+    _write_bytes(path, data)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    digest = hash(data)
+    last = _last_written.get(path)
+    if last is not None and last[0] == digest:
+        try:
+            info = os.stat(path)
+        except OSError:
+            info = None
+        # Most saves follow view switches or no-op edits; identical bytes need no disk write.
+        if info is not None and (info.st_mtime_ns, info.st_size) == last[1:]:
+            return
+    # One write to a sibling temp file, then a rename: a crash never leaves a half-written file.
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+        info = os.stat(path)
+        _last_written[path] = (digest, info.st_mtime_ns, info.st_size)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=1)
 def app_data_dir(app_name: str = APP_NAME) -> str:
     if os.name == "nt":
         base = os.getenv("LOCALAPPDATA") or os.getenv("APPDATA")
@@ -42,38 +131,53 @@ def app_data_dir(app_name: str = APP_NAME) -> str:
     return os.path.join(base, app_name)
 
 
+@functools.lru_cache(maxsize=1)
 def _config_path() -> str:
     return os.path.join(app_data_dir(), CONFIG_FILENAME)
 
 
 def _load_config() -> Dict[str, str]:
+    # Callers edit the result before saving, so hand out a fresh dict over the cached items.
+    return dict(_read_config())
+
+
+def _read_config() -> Tuple[Tuple[str, str], ...]:
+    global _config_items
+    if _config_items is None:
+        _config_items = _parse_config_file()
+    return _config_items
+
+
+def _parse_config_file() -> Tuple[Tuple[str, str], ...]:
     path = _config_path()
     if not os.path.exists(path):
-        return {}
+        return ()
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            payload = json.load(fh)
+        payload = _read_json(path)
     except (OSError, json.JSONDecodeError):
-        return {}
+        return ()
     if not isinstance(payload, dict):
-        return {}
+        return ()
     config: Dict[str, str] = {}
     for key, value in payload.items():
         if not isinstance(key, str):
             continue
         if isinstance(value, str):
             config[key] = value
-    return config
+    return tuple(config.items())
 
 
 def _save_config(config: Dict[str, str]) -> None:
+    global _config_items
     path = _config_path()
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(config, fh, indent=2)
+        _write_json(path, config)
     except OSError:
-        pass
+        _config_items = None
+        return
+    # The file now holds exactly this config; keep it instead of re-parsing on the next load.
+    _config_items = tuple((key, value) for key, value in config.items() if isinstance(key, str) and isinstance(value, str))
 
 
 def set_configured_data_dir(data_dir: str) -> None:
@@ -88,7 +192,7 @@ def set_configured_data_dir(data_dir: str) -> None:
 
 
 def _legacy_state_path(filename: str) -> str:
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    return os.path.join(_LEGACY_DIR, filename)
 
 
 def _maybe_migrate_legacy_state(target_path: str, filename: str) -> None:
@@ -98,8 +202,7 @@ def _maybe_migrate_legacy_state(target_path: str, filename: str) -> None:
     if legacy == target_path or not os.path.exists(legacy):
         return
     try:
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        shutil.copyfile(legacy, target_path)
+        copy_state_file(legacy, target_path)
     except OSError:
         pass
 
@@ -129,228 +232,231 @@ def default_state_path(filename: str, prompt_for_dir: Optional[Callable[[], str]
     return path
 
 
-def load_state(path: str, default_gui_settings: Dict[str, object]) -> StoredState:
-    state = StoredState(gui_settings=dict(default_gui_settings))
-    if not os.path.exists(path):
-        return state
-    try:
-        with open(path, "r", encoding="utf-8") as fh:
-            payload = json.load(fh)
-    except (OSError, json.JSONDecodeError):
-        return state
-    if isinstance(payload, dict):
-        state.geometry = str(payload.get("geometry") or "")
-        state.sort_column = str(payload.get("sort_column") or state.sort_column)
-        state.sort_reverse = bool(payload.get("sort_reverse", state.sort_reverse))
-        saved_gui = payload.get("gui_settings", {})
-        if isinstance(saved_gui, dict):
-            for key, value in saved_gui.items():
-                if key not in default_gui_settings:
-                    continue
-                if key == "font_size":
-                    try:
-                        size = int(value)
-                    except (TypeError, ValueError):
-                        continue
-                    state.gui_settings[key] = max(6, min(72, size))
-                elif isinstance(value, str) or isinstance(value, (int, float)):
-                    state.gui_settings[key] = value
-        groups = payload.get("groups", [])
-        if isinstance(groups, list):
-            state.groups = unique_casefold(groups)
-        app_groups = payload.get("app_groups", {})
-        if isinstance(app_groups, dict):
-            valid = set(state.groups)
-            pruned: Dict[str, str] = {}
-            for key, value in app_groups.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, str):
-                    continue
-                if value not in valid:
-                    continue
-                pruned[key] = value
-            state.app_groups = pruned
-        scan_drives = payload.get("scan_drives", [])
-        if isinstance(scan_drives, list):
-            state.scan_drives = [str(value) for value in scan_drives if isinstance(value, str)]
-        group_colors = payload.get("group_colors", {})
-        if isinstance(group_colors, dict):
-            valid = set(state.groups)
-            pruned_colors: Dict[str, str] = {}
-            for key, value in group_colors.items():
-                if not isinstance(key, str):
-                    continue
-                if key not in valid:
-                    continue
-                if not isinstance(value, str):
-                    continue
-                pruned_colors[key] = value
-            state.group_colors = pruned_colors
-        size_cache = payload.get("size_cache", {})
-        if isinstance(size_cache, dict):
-            pruned_cache: Dict[str, Dict[str, object]] = {}
-            for key, value in size_cache.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, dict):
-                    continue
-                size = value.get("size_mb")
-                location = value.get("install_location")
-                if not isinstance(location, str):
-                    continue
-                if isinstance(size, bool):
-                    continue
-                if isinstance(size, (int, float)):
-                    size_val = int(size)
-                    if size_val < 0:
-                        continue
-                else:
-                    continue
-                pruned_cache[key] = {
-                    "size_mb": size_val,
-                    "install_location": location,
-                    "updated_at": str(value.get("updated_at") or ""),
-                }
-            state.size_cache = pruned_cache
-        overrides = payload.get("related_overrides", {})
-        if isinstance(overrides, dict):
-            pruned_overrides: Dict[str, str] = {}
-            for key, value in overrides.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, str):
-                    continue
-                pruned_overrides[key] = value
-            state.related_overrides = pruned_overrides
-        manual = payload.get("related_manual", {})
-        if isinstance(manual, dict):
-            pruned_manual: Dict[str, List[Dict[str, str]]] = {}
-            for key, value in manual.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, list):
-                    continue
-                items: List[Dict[str, str]] = []
-                for entry in value:
-                    if not isinstance(entry, dict):
-                        continue
-                    path = entry.get("path")
-                    kind = entry.get("kind")
-                    if not isinstance(path, str) or not path.strip():
-                        continue
-                    if not isinstance(kind, str) or not kind.strip():
-                        kind = "file"
-                    items.append({"path": path.strip(), "kind": kind.strip()})
-                if items:
-                    pruned_manual[key] = items
-            state.related_manual = pruned_manual
-        ignore = payload.get("related_ignore", {})
-        if isinstance(ignore, dict):
-            pruned_ignore: Dict[str, List[str]] = {}
-            for key, value in ignore.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, list):
-                    continue
-                paths: List[str] = []
-                for item in value:
-                    if not isinstance(item, str):
-                        continue
-                    item = item.strip()
-                    if not item:
-                        continue
-                    paths.append(item)
-                if paths:
-                    pruned_ignore[key] = paths
-            state.related_ignore = pruned_ignore
-        unassigned = payload.get("related_unassigned", {})
-        if isinstance(unassigned, dict):
-            pruned_unassigned: Dict[str, List[str]] = {}
-            for key, value in unassigned.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, list):
-                    continue
-                paths: List[str] = []
-                for item in value:
-                    if not isinstance(item, str):
-                        continue
-                    item = item.strip()
-                    if not item:
-                        continue
-                    paths.append(item)
-                if paths:
-                    pruned_unassigned[key] = paths
-            state.related_unassigned = pruned_unassigned
-        overrides = payload.get("install_location_overrides", {})
-        if isinstance(overrides, dict):
-            pruned_overrides: Dict[str, str] = {}
-            for key, value in overrides.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, str):
-                    continue
-                value = value.strip()
-                if not value:
-                    continue
-                pruned_overrides[key] = value
-            state.install_location_overrides = pruned_overrides
-        version_overrides = payload.get("version_overrides", {})
-        if isinstance(version_overrides, dict):
-            pruned_versions: Dict[str, str] = {}
-            for key, value in version_overrides.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, str):
-                    continue
-                value = value.strip()
-                if not value:
-                    continue
-                pruned_versions[key] = value
-            state.version_overrides = pruned_versions
-        date_overrides = payload.get("install_date_overrides", {})
-        if isinstance(date_overrides, dict):
-            pruned_dates: Dict[str, str] = {}
-            for key, value in date_overrides.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, str):
-                    continue
-                value = value.strip()
-                if not value:
-                    continue
-                pruned_dates[key] = value
-            state.install_date_overrides = pruned_dates
-    return state
+def _stream_state_items(path: str) -> Iterator[Tuple[str, object]]:
+    # Only one top-level value is materialized at a time instead of the whole document.
+    with open(path, "rb") as fh:
+        yield from ijson.kvitems(fh, "", use_float=True)
 
 
-def save_state(path: str, state: StoredState) -> None:
-    valid_groups = set(state.groups)
-    app_groups = {key: value for key, value in state.app_groups.items() if value in valid_groups}
-    size_cache: Dict[str, Dict[str, object]] = {}
-    for key, value in state.size_cache.items():
-        if not isinstance(key, str):
+# Sections that are plain {str: str} maps; the flag says whether values are stripped (and blanks dropped).
+_STR_DICT_FIELDS = {
+    "related_overrides": False,
+    "install_location_overrides": True,
+    "version_overrides": True,
+    "install_date_overrides": True,
+}
+# Sections that map keys to lists of non-blank, stripped paths.
+_STR_LIST_DICT_FIELDS = frozenset({"related_ignore", "related_unassigned"})
+
+
+def _prune_str_dict(raw: Dict[object, object], strip: bool) -> Dict[str, str]:
+    if not strip:
+        return {key: value for key, value in raw.items() if type(key) is str and type(value) is str}
+    pruned: Dict[str, str] = {}
+    for key, value in raw.items():
+        if type(key) is not str or type(value) is not str:
+            continue
+        value = value.strip()
+        if value:
+            pruned[key] = value
+    return pruned
+
+
+def _prune_str_list_dict(raw: Dict[object, object]) -> Dict[str, List[str]]:
+    pruned: Dict[str, List[str]] = {}
+    for key, value in raw.items():
+        if type(key) is not str or type(value) is not list:
             continue
-        if not isinstance(value, dict):
+        paths: List[str] = []
+        for item in value:
+            if type(item) is not str:
+                continue
+            item = item.strip()
+            if item:
+                paths.append(item)
+        if paths:
+            pruned[key] = paths
+    return pruned
+
+
+def _prune_size_cache(raw: Dict[object, object]) -> Dict[str, Dict[str, object]]:
+    pruned_cache: Dict[str, Dict[str, object]] = {}
+    # Decoded files and controller-built entries only hold exact builtin types, so `type(x) is`
+    # stands in for isinstance (and keeps bools out of the size check without a separate test).
+    for key, value in raw.items():
+        if type(key) is not str or type(value) is not dict:
             continue
         size = value.get("size_mb")
         location = value.get("install_location")
-        if not isinstance(location, str):
+        if type(location) is not str:
             continue
-        if isinstance(size, bool):
+        size_type = type(size)
+        if size_type is not int and size_type is not float:
             continue
-        if isinstance(size, (int, float)):
-            size_val = int(size)
-            if size_val < 0:
-                continue
-        else:
+        size_val = int(size)
+        if size_val < 0:
             continue
-        size_cache[key] = {
+        pruned_cache[key] = {
             "size_mb": size_val,
             "install_location": location,
             "updated_at": str(value.get("updated_at") or ""),
         }
+    return pruned_cache
+
+
+def _apply_state_item(state: StoredState, name: str, raw: object, default_gui_settings: Dict[str, object]) -> None:
+    if name in _STR_DICT_FIELDS:
+        if isinstance(raw, dict):
+            setattr(state, name, _prune_str_dict(raw, strip=_STR_DICT_FIELDS[name]))
+        return
+    if name in _STR_LIST_DICT_FIELDS:
+        if isinstance(raw, dict):
+            setattr(state, name, _prune_str_list_dict(raw))
+        return
+    if name == "geometry":
+        state.geometry = str(raw or "")
+    elif name == "sort_column":
+        state.sort_column = str(raw or state.sort_column)
+    elif name == "sort_reverse":
+        state.sort_reverse = bool(raw)
+    elif name == "gui_settings" and isinstance(raw, dict):
+        for key, value in raw.items():
+            if key not in default_gui_settings:
+                continue
+            if key == "font_size":
+                try:
+                    size = int(value)
+                except (TypeError, ValueError):
+                    continue
+                state.gui_settings[key] = max(6, min(72, size))
+            elif isinstance(value, str) or isinstance(value, (int, float)):
+                state.gui_settings[key] = value
+    elif name == "groups" and isinstance(raw, list):
+        state.groups = unique_casefold(raw)
+    elif name == "app_groups" and isinstance(raw, dict):
+        valid = set(state.groups)
+        pruned: Dict[str, str] = {}
+        for key, value in raw.items():
+            if not isinstance(key, str):
+                continue
+            if not isinstance(value, str):
+                continue
+            if value not in valid:
+                continue
+            pruned[key] = value
+        state.app_groups = pruned
+    elif name == "scan_drives" and isinstance(raw, list):
+        state.scan_drives = [value for value in raw if isinstance(value, str)]
+    elif name == "group_colors" and isinstance(raw, dict):
+        valid = set(state.groups)
+        pruned_colors: Dict[str, str] = {}
+        for key, value in raw.items():
+            if not isinstance(key, str):
+                continue
+            if key not in valid:
+                continue
+            if not isinstance(value, str):
+                continue
+            pruned_colors[key] = value
+        state.group_colors = pruned_colors
+    elif name == "size_cache" and isinstance(raw, dict):
+        state.size_cache = _prune_size_cache(raw)
+    elif name == "related_manual" and isinstance(raw, dict):
+        pruned_manual: Dict[str, List[Dict[str, str]]] = {}
+        for key, value in raw.items():
+            if type(key) is not str or type(value) is not list:
+                continue
+            items: List[Dict[str, str]] = []
+            for entry in value:
+                if type(entry) is not dict:
+                    continue
+                path = entry.get("path")
+                if type(path) is not str:
+                    continue
+                path = path.strip()
+                if not path:
+                    continue
+                kind = entry.get("kind")
+                kind = kind.strip() if type(kind) is str else ""
+                items.append({"path": path, "kind": kind or "file"})
+            if items:
+                pruned_manual[key] = items
+        state.related_manual = pruned_manual
+
+
+def _size_cache_sidecar(path: str) -> str:
+    return os.path.splitext(path)[0] + SIZE_CACHE_SIDECAR_SUFFIX
+
+
+def copy_state_file(source: str, target: str) -> None:
+    # The size cache may live in a sidecar next to the JSON; it moves with the file, and a
+    # stale sidecar already at the target is dropped so it cannot stand in for the copied one.
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    shutil.copyfile(source, target)
+    source_sidecar = _size_cache_sidecar(source)
+    target_sidecar = _size_cache_sidecar(target)
+    if os.path.exists(source_sidecar):
+        shutil.copyfile(source_sidecar, target_sidecar)
+    elif os.path.exists(target_sidecar):
+        os.remove(target_sidecar)
+
+
+def _read_size_cache_sidecar(path: str) -> object:
+    sidecar = _size_cache_sidecar(path)
+    if msgpack is None or not os.path.exists(sidecar):
+        return None
+    try:
+        with open(sidecar, "rb") as fh:
+            return msgpack.unpackb(fh.read(), raw=False)
+    except (OSError, ValueError, msgpack.UnpackException):
+        return None
+
+
+def _state_from_items(
+    items: Iterable[Tuple[str, object]], default_gui_settings: Dict[str, object], path: str
+) -> StoredState:
+    state = StoredState(gui_settings=dict(default_gui_settings))
+    # These are pruned against the final group list, which may appear later in the file.
+    deferred: Dict[str, object] = {}
+    inline_size_cache = False
+    for name, raw in items:
+        if name in ("app_groups", "group_colors"):
+            deferred[name] = raw
+        else:
+            inline_size_cache = inline_size_cache or name == "size_cache"
+            _apply_state_item(state, name, raw, default_gui_settings)
+    if not inline_size_cache:
+        # A size_cache still inside the JSON (saved without msgpack) is newer than any sidecar.
+        _apply_state_item(state, "size_cache", _read_size_cache_sidecar(path), default_gui_settings)
+    for name, raw in deferred.items():
+        _apply_state_item(state, name, raw, default_gui_settings)
+    return state
+
+
+def load_state(path: str, default_gui_settings: Dict[str, object]) -> StoredState:
+    # The fallback state (and its copy of the defaults) is only built when loading fails.
+    if not os.path.exists(path):
+        return StoredState(gui_settings=dict(default_gui_settings))
+    try:
+        if ijson is not None and os.path.getsize(path) >= STREAM_STATE_MIN_BYTES:
+            try:
+                return _state_from_items(_stream_state_items(path), default_gui_settings, path)
+            except (ijson.JSONError, UnicodeDecodeError):
+                # ijson chokes on escaped lone surrogates; the regular parser below decides.
+                pass
+        payload = _read_json(path)
+    except (OSError, json.JSONDecodeError):
+        payload = None
+    if not isinstance(payload, dict):
+        return StoredState(gui_settings=dict(default_gui_settings))
+    return _state_from_items(payload.items(), default_gui_settings, path)
+
+
+def save_state(path: str, state: StoredState) -> None:
+    valid_groups = set(state.groups)
+    app_groups = {key: value for key, value in state.app_groups.items() if value in valid_groups}
+    group_colors = {key: value for key, value in state.group_colors.items() if key in valid_groups}
+    size_cache = _prune_size_cache(state.size_cache)
     payload = {
         "geometry": state.geometry,
         "sort_column": state.sort_column,
@@ -359,7 +465,7 @@ def save_state(path: str, state: StoredState) -> None:
         "groups": state.groups,
         "app_groups": app_groups,
         "scan_drives": state.scan_drives,
-        "group_colors": {key: value for key, value in state.group_colors.items() if key in valid_groups},
+        "group_colors": group_colors,
         "size_cache": size_cache,
         "related_overrides": state.related_overrides,
         "related_manual": state.related_manual,
@@ -371,7 +477,14 @@ def save_state(path: str, state: StoredState) -> None:
     }
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=2)
+        if msgpack is not None:
+            try:
+                _write_bytes(_size_cache_sidecar(path), msgpack.packb(size_cache, use_bin_type=True))
+            except (OSError, ValueError):
+                # Unencodable paths (e.g. lone surrogates) or a failed write keep the cache in the JSON.
+                pass
+            else:
+                del payload["size_cache"]
+        _write_json(path, payload)
     except OSError:
         pass
@@ -13,3 +13,81 @@ def test_related_scanner_install_location_and_configs(tmp_path) -> None:
     paths = {item.path for item in related}
     assert str(root) in paths
     assert str(config) in paths
+
+
+def test_fuzzy_score_prefers_name_over_publisher() -> None:
+    from related_scanner import _fuzzy_score
+
+    assert _fuzzy_score("myapp", ("myapp",), ()) == 100
+    assert _fuzzy_score("contoso", ("myapp",), ("contoso",)) == 90
+    assert _fuzzy_score("zzzz", ("myapp",), ()) < 50
+
+
+def test_fuzzy_score_is_backend_independent(monkeypatch) -> None:
+    import difflib
+
+    import related_scanner
+    from related_scanner import _fuzzy_score
+
+    # RapidFuzz's InDel ratio puts this pair at 72; SequenceMatcher, which the thresholds use, at 16.
+    candidate, query = "driverplayer", "vriderlabyedr"
+    expected = int(difflib.SequenceMatcher(None, candidate, query).ratio() * 100)
+    assert expected < 68
+    if related_scanner._fuzz_ratio is not None:
+        assert related_scanner._fuzz_ratio(candidate, query) >= 72
+    assert _fuzzy_score(candidate, (query,), ()) == expected
+    assert _fuzzy_score(candidate, (query,), (), 68) < 68
+    monkeypatch.setattr(related_scanner, "_fuzz_ratio", None)
+    assert _fuzzy_score(candidate, (query,), ()) == expected
+    assert _fuzzy_score(candidate, (query,), (), 68) < 68
+
+
+def test_deep_scan_merges_roots_in_order(tmp_path) -> None:
+    from related_scanner import DeepScanLimits
+
+    roots = []
+    for drive in ("first", "second"):
+        app_dir = tmp_path / drive / "MyApp"
+        app_dir.mkdir(parents=True)
+        (app_dir / "myapp.db").write_text("")
+        roots.append(str(tmp_path / drive))
+    app = AppEntry(name="MyApp")
+    scanner = RelatedFileScanner()
+    related = scanner.deep_scan_for_app(app, roots, DeepScanLimits(max_seconds=0))
+    assert [(item.kind, item.path) for item in related] == [
+        ("dir", str(tmp_path / "first" / "MyApp")),
+        ("file", str(tmp_path / "first" / "MyApp" / "myapp.db")),
+        ("dir", str(tmp_path / "second" / "MyApp")),
+        ("file", str(tmp_path / "second" / "MyApp" / "myapp.db")),
+    ]
+    capped = scanner.deep_scan_for_app(app, roots, DeepScanLimits(max_seconds=0, max_dirs=1))
+    assert [item.path for item in capped] == [str(tmp_path / "first" / "MyApp")]
+
+
+def test_walk_tree_matches_os_walk_depth_on_drive_roots(tmp_path, monkeypatch) -> None:
+    import os
+
+    import related_scanner
+
+    for rel in ("a/b/c/d", "a/x", "e/f/g"):
+        (tmp_path / rel).mkdir(parents=True)
+    base = str(tmp_path)
+
+    def as_drive(path: str) -> str:
+        # Present tmp_path as a separator-terminated drive root, like "C:\\".
+        rel = os.path.relpath(os.path.abspath(path), base)
+        return os.sep if rel == "." else os.sep + os.path.normcase(rel)
+
+    monkeypatch.setattr(related_scanner, "_normalize_path", as_drive)
+    for max_depth in (0, 1, 2):
+        # The os.walk version counted separators below the root, so a drive root's children sat at depth 0.
+        expected = []
+        root_depth = as_drive(base).count(os.sep)
+        for current, dirs, _files in os.walk(base, topdown=True):
+            current_norm = as_drive(current)
+            if current_norm.count(os.sep) - root_depth >= max_depth:
+                dirs[:] = []
+            expected.append(current_norm)
+        walked = [current_norm for _current, current_norm, _files in related_scanner._walk_tree(base, max_depth)]
+        assert walked == expected
+    assert os.path.normcase(os.sep + os.path.join("a", "b", "c")) in walked
@@ -35,3 +35,20 @@ def test_resolve_install_location_with_fallback(tmp_path) -> None:
     scanner = AppScanner()
     resolved = scanner._resolve_install_location("", {"DisplayIcon": f'"{exe}"'})
     assert os.path.normcase(resolved) == os.path.normcase(str(exe))
+
+
+def test_read_entry_matches_value_names_case_insensitively(monkeypatch) -> None:
+    import scanner as scanner_module
+
+    values = [
+        ("displayname", "Example", 1),
+        ("DisplayVersion", "1.0", 1),
+        ("InstallDate", "20240102", 1),
+        ("URLInfoAbout", "", 1),
+        ("HelpLink", " https://example.test ", 1),
+    ]
+    monkeypatch.setattr(scanner_module.winreg, "QueryInfoKey", lambda _handle: (0, len(values), 0))
+    monkeypatch.setattr(scanner_module.winreg, "EnumValue", lambda _handle, idx: values[idx])
+    entry = AppScanner()._read_entry(object())
+    assert (entry.name, entry.version, entry.install_date) == ("Example", "1.0", "2024-01-02")
+    assert entry.website == "https://example.test"
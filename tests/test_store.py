@@ -0,0 +1,139 @@
+import dataclasses
+import json
+import os
+
+import pytest
+
+import store
+from store import StoredState, load_state, save_state
+
+
+DEFAULT_GUI_SETTINGS = {"font_size": 9, "deep_scan": False}
+
+
+def _sample_state() -> StoredState:
+    return StoredState(
+        geometry="800x600+10+10",
+        sort_column="size",
+        sort_reverse=True,
+        gui_settings={"font_size": 10, "deep_scan": True},
+        groups=["Games", "Tools"],
+        app_groups={"app-a": "Games", "app-b": "Missing"},
+        scan_drives=["C:\\", "D:\\"],
+        group_colors={"Games": "#ff0000", "Missing": "#00ff00"},
+        size_cache={"app-a": {"size_mb": 12, "install_location": "C:\\Games\\A", "updated_at": "2024-01-01"}},
+        related_overrides={"C:\\Games\\A": "app-a"},
+        related_manual={"app-a": [{"path": "C:\\Saves\\A", "kind": "dir"}]},
+        related_ignore={"app-a": ["C:\\Temp"]},
+        version_overrides={"app-b": "1.2"},
+    )
+
+
+def _expected(state: StoredState) -> dict:
+    expected = dataclasses.asdict(state)
+    expected["app_groups"] = {"app-a": "Games"}
+    expected["group_colors"] = {"Games": "#ff0000"}
+    return expected
+
+
+def test_round_trip_without_msgpack(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(store, "msgpack", None)
+    path = str(tmp_path / "state.json")
+    state = _sample_state()
+    save_state(path, state)
+    assert not os.path.exists(store._size_cache_sidecar(path))
+    with open(path, encoding="utf-8") as fh:
+        assert "size_cache" in json.load(fh)
+    loaded = load_state(path, DEFAULT_GUI_SETTINGS)
+    assert dataclasses.asdict(loaded) == _expected(state)
+
+
+def test_round_trip_with_msgpack_sidecar(tmp_path) -> None:
+    pytest.importorskip("msgpack")
+    path = str(tmp_path / "state.json")
+    state = _sample_state()
+    save_state(path, state)
+    assert os.path.exists(store._size_cache_sidecar(path))
+    with open(path, encoding="utf-8") as fh:
+        assert "size_cache" not in json.load(fh)
+    loaded = load_state(path, DEFAULT_GUI_SETTINGS)
+    assert dataclasses.asdict(loaded) == _expected(state)
+
+
+def test_inline_size_cache_wins_over_stale_sidecar(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("msgpack")
+    path = str(tmp_path / "state.json")
+    stale = _sample_state()
+    stale.size_cache = {"app-a": {"size_mb": 1, "install_location": "C:\\Old", "updated_at": ""}}
+    save_state(path, stale)
+    # A later save from a build without msgpack keeps the cache inline and leaves the sidecar behind.
+    monkeypatch.setattr(store, "msgpack", None)
+    save_state(path, _sample_state())
+    monkeypatch.undo()
+    assert os.path.exists(store._size_cache_sidecar(path))
+    loaded = load_state(path, DEFAULT_GUI_SETTINGS)
+    assert loaded.size_cache == _sample_state().size_cache
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "state.json")
+
+    def fail_replace(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        store._write_bytes(path, b"{}")
+    assert os.listdir(tmp_path) == []
+
+
+def test_unchanged_write_skipped_until_file_changes(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "state.json")
+    store._write_bytes(path, b'{"a":1}')
+    replaced = []
+    real_replace = os.replace
+
+    def counting_replace(src: str, dst: str) -> None:
+        replaced.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(store.os, "replace", counting_replace)
+    store._write_bytes(path, b'{"a":1}')
+    assert replaced == []
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write('{"a": 2, "edited": true}')
+    store._write_bytes(path, b'{"a":1}')
+    assert replaced == [path]
+    with open(path, "rb") as fh:
+        assert fh.read() == b'{"a":1}'
+
+
+def test_streamed_load_matches_regular_load(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(store, "msgpack", None)
+    path = str(tmp_path / "state.json")
+    # Group-dependent sections come first so the deferred pruning sees the group list only later.
+    payload = dataclasses.asdict(_sample_state())
+    payload = {"app_groups": payload.pop("app_groups"), "group_colors": payload.pop("group_colors"), **payload}
+    payload["size_cache"]["app-b"] = {"size_mb": 2.5, "install_location": "D:\\B"}
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh)
+    streamed = store._state_from_items(store._stream_state_items(path), DEFAULT_GUI_SETTINGS, path)
+    regular = store._state_from_items(payload.items(), DEFAULT_GUI_SETTINGS, path)
+    assert dataclasses.asdict(streamed) == dataclasses.asdict(regular)
+    monkeypatch.setattr(store, "STREAM_STATE_MIN_BYTES", 0)
+    assert dataclasses.asdict(load_state(path, DEFAULT_GUI_SETTINGS)) == dataclasses.asdict(regular)
+
+
+def test_copied_state_file_keeps_size_cache(tmp_path) -> None:
+    source = str(tmp_path / "backup" / "my_state.json")
+    target = str(tmp_path / "data" / "state.json")
+    state = _sample_state()
+    save_state(source, state)
+    # A sidecar left at the target by an earlier state must not replace the copied cache.
+    stale = _sample_state()
+    stale.size_cache = {"app-z": {"size_mb": 1, "install_location": "C:\\Old", "updated_at": ""}}
+    save_state(target, stale)
+    store.copy_state_file(source, target)
+    loaded = load_state(target, DEFAULT_GUI_SETTINGS)
+    assert dataclasses.asdict(loaded) == _expected(state)
@@ -1,6 +1,20 @@
 import datetime as _dt
 import re
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+# Groups are positional (year, month, day); groups() avoids the per-name lookups.
+_DATE_PATTERNS = (
+    re.compile(r"^(\d{4})(\d{2})(\d{2})$"),
+    re.compile(r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})$"),
+)
+_URL_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+
+# Sentinel for dict.get/pop lookups where None is a real value.
+MISSING = object()
+
+
+def noop(*_args, **_kwargs) -> None:
+    return None
 
 
 def normalize_date(raw: str) -> str:
@@ -8,15 +22,18 @@ def normalize_date(raw: str) -> str:
     if not raw:
         return ""
     raw = raw.strip()
-    patterns = [
-        r"^(?P<y>\d{4})(?P<m>\d{2})(?P<d>\d{2})$",
-        r"^(?P<y>\d{4})[-/](?P<m>\d{1,2})[-/](?P<d>\d{1,2})$",
-    ]
-    for pat in patterns:
-        match = re.match(pat, raw)
+    if len(raw) == 8 and raw.isdecimal():
+        # The common Win32 YYYYMMDD shape; slicing skips the regex entirely.
+        try:
+            return _dt.date(int(raw[:4]), int(raw[4:6]), int(raw[6:])).isoformat()
+        except ValueError:
+            return ""
+    for pattern in _DATE_PATTERNS:
+        match = pattern.match(raw)
         if match:
+            year, month, day = match.groups()
             try:
-                dt = _dt.date(int(match.group("y")), int(match.group("m")), int(match.group("d")))
+                dt = _dt.date(int(year), int(month), int(day))
             except ValueError:
                 return ""
             return dt.isoformat()
@@ -45,25 +62,23 @@ def parse_size_mb(value) -> Optional[int]:
 
 
 def unique_casefold(values: Iterable[str]) -> List[str]:
-    seen = set()
-    result: List[str] = []
+    # Keyed by casefolded name; insertion order keeps the first spelling seen.
+    unique: Dict[str, str] = {}
     for value in values:
-        name = str(value).strip()
+        name = value.strip() if isinstance(value, str) else str(value).strip()
         if not name:
             continue
         folded = name.casefold()
-        if folded in seen:
-            continue
-        seen.add(folded)
-        result.append(name)
-    return result
+        if folded not in unique:
+            unique[folded] = name
+    return list(unique.values())
 
 
 def normalize_url(raw: str) -> str:
     url = raw.strip()
     if not url:
         return ""
-    if re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", url):
+    if _URL_SCHEME_RE.match(url):
         return url
     if url.startswith("www."):
         return f"https://{url}"